@@ -0,0 +1,15 @@
+from fastapi import APIRouter, Response
+
+from core.keys import get_key_store
+from services.config import get_config
+
+router = APIRouter()
+
+
+@router.get("/.well-known/jwks.json")
+async def jwks(response: Response) -> dict:
+    """Открытые ключи для локальной проверки токенов потребителями."""
+    response.headers["Cache-Control"] = (
+        f"public, max-age={get_config().jwt.jwks_max_age}"
+    )
+    return get_key_store().jwks()
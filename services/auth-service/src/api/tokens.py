@@ -0,0 +1,66 @@
+import time
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import HTTPBasic, HTTPBasicCredentials
+
+from core.clients import verify_client
+from core.keys import get_key_store
+from schemas.tokens import IssueRequest, IssueResponse
+from services.config import get_config
+
+router = APIRouter()
+
+# Допуск на расхождение часов с вызывающим сервисом
+CLOCK_SKEW_SECONDS = 60
+
+basic = HTTPBasic(auto_error=False)
+
+
+def authenticate_client(
+    credentials: HTTPBasicCredentials | None = Depends(basic),
+) -> str:
+    """client_id сервиса из ``clients_settings``, иначе 401."""
+    if credentials is None or not verify_client(
+        get_config().clients, credentials.username, credentials.password
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid client credentials",
+            headers={"WWW-Authenticate": "Basic"},
+        )
+    return credentials.username
+
+
+@router.post("/tokens", response_model=IssueResponse)
+async def issue_tokens(
+    data: IssueRequest, client_id: str = Depends(authenticate_client)
+) -> IssueResponse:
+    """
+    Подписывает токены для внутренних сервисов из ``clients_settings``
+    (HTTP Basic): claims — от вызывающего, ``iss``/``iat``/``azp`` и срок
+    жизни проверяет и проставляет auth-service.
+    """
+    jwt_config = get_config().jwt
+    now = int(time.time())
+    max_lifetime = {
+        "access": jwt_config.access_token_expire_minutes * 60,
+        "refresh": jwt_config.refresh_token_expire_days * 86400,
+    }
+
+    store = get_key_store()
+    tokens = []
+    for claims in data.claims:
+        if not now < claims.exp <= now + max_lifetime[claims.type] + CLOCK_SKEW_SECONDS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"exp is outside the allowed {claims.type} token lifetime",
+            )
+        # azp — какой сервис запросил токен; подставленный клиентом не в счёт
+        payload = claims.model_dump() | {
+            "iss": jwt_config.issuer,
+            "iat": now,
+            "azp": client_id,
+        }
+        tokens.append(store.sign(payload))
+
+    return IssueResponse(tokens=tokens)
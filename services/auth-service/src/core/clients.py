@@ -0,0 +1,40 @@
+"""
+Учётные данные сервисов, которым auth-service подписывает токены.
+
+Сервис-клиент передаёт ``client_id`` и секрет по HTTP Basic. В настройках
+(секция ``clients_settings``) хранится только SHA-256 секрета: секрет —
+случайные 256 бит, медленный хэш паролей ему не нужен. Новый клиент::
+
+    python -m core.clients new main_app
+
+печатает секрет (в настройки клиента) и строку для settings.toml.
+"""
+
+import hashlib
+import hmac
+import secrets
+import sys
+
+
+def secret_digest(secret: str) -> str:
+    return hashlib.sha256(secret.encode()).hexdigest()
+
+
+def verify_client(clients: dict[str, str], client_id: str, secret: str) -> bool:
+    expected = clients.get(client_id)
+    if expected is None:
+        return False
+    return hmac.compare_digest(expected, secret_digest(secret))
+
+
+def main(argv: list[str]) -> None:
+    if len(argv) != 2 or argv[0] != "new":
+        sys.exit("usage: python -m core.clients new <client_id>")
+    client_id = argv[1]
+    secret = secrets.token_urlsafe(32)
+    print(f"secret: {secret}")
+    print(f'[clients_settings] {client_id} = "{secret_digest(secret)}"')
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,176 @@
+"""
+Ключи подписи RS256.
+
+Ключи — файлы ``*.pem`` в ``keys_dir``; ``kid`` — отпечаток открытого
+ключа (RFC 7638). В JWKS публикуются все ключи каталога, подписывает
+самый новый из активных: ключ становится активным через
+``key_activation_seconds`` после появления файла, чтобы потребители
+успели загрузить его из JWKS до первого токена с новым ``kid``.
+
+Ротация::
+
+    python -m core.keys rotate   # новый ключ, активен после задержки
+    python -m core.keys list
+
+Старый ключ удаляется из каталога, когда истекли все подписанные им
+токены (срок refresh-токена), — после этого он пропадает из JWKS.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+
+from services.config import get_config
+
+ALGORITHM = "RS256"
+
+
+def thumbprint(public_jwk: dict) -> str:
+    canonical = json.dumps(
+        {name: public_jwk[name] for name in ("e", "kty", "n")},
+        separators=(",", ":"),
+        sort_keys=True,
+    )
+    digest = hashlib.sha256(canonical.encode()).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+@dataclass(frozen=True, slots=True)
+class SigningKey:
+    kid: str
+    key: object
+    public_jwk: dict
+    created_at: float
+
+
+def _read_key(path: Path) -> SigningKey:
+    from jose import jwk
+
+    key = jwk.construct(path.read_bytes(), ALGORITHM)
+    public_jwk = {
+        name: value
+        for name, value in key.public_key().to_dict().items()
+        if name in ("kty", "n", "e")
+    }
+    kid = thumbprint(public_jwk)
+    public_jwk |= {"kid": kid, "alg": ALGORITHM, "use": "sig"}
+    return SigningKey(
+        kid=kid, key=key, public_jwk=public_jwk, created_at=path.stat().st_mtime
+    )
+
+
+def _generate_pem() -> bytes:
+    try:
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import rsa
+    except ImportError:
+        # Чистый Python (зависимость python-jose): медленно, но ключ
+        # создаётся только при ротации
+        import rsa as pure_rsa
+
+        _, private_key = pure_rsa.newkeys(2048)
+        return private_key.save_pkcs1()
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+
+
+def _write_key(directory: Path) -> Path:
+    """Новый ключ; файл появляется атомарно и не перезаписывает существующий."""
+    pem = _generate_pem()
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{time.time_ns()}.pem"
+    tmp = directory / f".{path.name}.{os.getpid()}"
+    tmp.write_bytes(pem)
+    tmp.chmod(0o600)
+    try:
+        os.link(tmp, path)
+    finally:
+        tmp.unlink()
+    return path
+
+
+class KeyStore:
+    def __init__(self, directory: Path, activation_seconds: int):
+        self.directory = directory
+        self.activation_seconds = activation_seconds
+        self.keys: list[SigningKey] = []
+        self._loaded_mtime = 0
+
+    def load(self) -> None:
+        """Читает каталог; если ключей нет, создаёт первый (активен сразу)."""
+        paths = sorted(self.directory.glob("*.pem"))
+        if not paths:
+            paths = [_write_key(self.directory)]
+        self._loaded_mtime = self.directory.stat().st_mtime_ns
+        self.keys = sorted(
+            (_read_key(path) for path in paths), key=lambda key: key.created_at
+        )
+
+    def _reload_if_changed(self) -> None:
+        # Ротация и удаление ключей — в другом процессе (CLI): каталог
+        # перечитывается, когда меняется его mtime
+        if self.directory.stat().st_mtime_ns != self._loaded_mtime:
+            self.load()
+
+    def rotate(self) -> SigningKey:
+        key = _read_key(_write_key(self.directory))
+        self.load()
+        return key
+
+    @property
+    def active(self) -> SigningKey:
+        """Самый новый ключ старше задержки активации (или самый старый)."""
+        self._reload_if_changed()
+        threshold = time.time() - self.activation_seconds
+        active = [key for key in self.keys if key.created_at <= threshold]
+        return active[-1] if active else self.keys[0]
+
+    def jwks(self) -> dict:
+        self._reload_if_changed()
+        return {"keys": [key.public_jwk for key in self.keys]}
+
+    def sign(self, claims: dict) -> str:
+        from jose import jwt
+
+        key = self.active
+        return jwt.encode(
+            claims, key.key, algorithm=ALGORITHM, headers={"kid": key.kid}
+        )
+
+
+@cache
+def get_key_store() -> KeyStore:
+    jwt_config = get_config().jwt
+    store = KeyStore(jwt_config.keys_dir, jwt_config.key_activation_seconds)
+    store.load()
+    return store
+
+
+def main(argv: list[str]) -> None:
+    command = argv[0] if argv else "list"
+    store = get_key_store()
+    if command == "rotate":
+        key = store.rotate()
+        print(f"created {key.kid}, active in {store.activation_seconds}s")
+    elif command == "list":
+        active = store.active.kid
+        for key in store.keys:
+            marker = "*" if key.kid == active else " "
+            print(f"{marker} {key.kid}  {time.ctime(key.created_at)}")
+    else:
+        sys.exit(f"unknown command {command!r}: expected rotate or list")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
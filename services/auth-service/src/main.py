@@ -0,0 +1,28 @@
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+
+from api.jwks import router as jwks_router
+from api.tokens import router as tokens_router
+from core.keys import get_key_store
+from services.config import get_config
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Ключи читаются (или создаётся первый) до приёма запросов
+    get_key_store()
+    yield
+
+
+config = get_config()
+
+app = FastAPI(title=config.app.name, version=config.app.version, lifespan=lifespan)
+
+app.include_router(jwks_router, tags=["Keys"])
+app.include_router(tokens_router, tags=["Tokens"])
+
+
+@app.get("/health")
+async def health():
+    return {"status": "healthy"}
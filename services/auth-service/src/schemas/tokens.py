@@ -0,0 +1,20 @@
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class TokenClaims(BaseModel):
+    # Остальные claims (jti и т.п.) подписываются как есть
+    model_config = ConfigDict(extra="allow")
+
+    sub: str
+    type: Literal["access", "refresh"]
+    exp: int
+
+
+class IssueRequest(BaseModel):
+    claims: list[TokenClaims] = Field(min_length=1, max_length=10)
+
+
+class IssueResponse(BaseModel):
+    tokens: list[str]
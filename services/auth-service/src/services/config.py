@@ -0,0 +1,91 @@
+"""
+Конфигурация auth-service: settings.toml и переменные окружения вида
+``JWT_SETTINGS__KEYS_DIR`` (секция и ключ, как у Dynaconf в main-app),
+замороженные в ``Config``.
+"""
+
+import os
+import tomllib
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+SETTINGS_FILE = BASE_DIR / "settings.toml"
+
+
+@dataclass(frozen=True, slots=True)
+class AppConfig:
+    name: str
+    version: str
+    host: str = "0.0.0.0"
+    port: int = 8001
+
+
+@dataclass(frozen=True, slots=True)
+class JWTConfig:
+    # Каталог с закрытыми ключами RS256 (*.pem); пустой — ключ создаётся
+    keys_dir: Path
+    # Новый ключ подписывает токены только через столько секунд после
+    # появления: потребители успевают увидеть его в JWKS
+    key_activation_seconds: int = 600
+    # Предельные сроки токенов, которые сервис согласен подписать
+    access_token_expire_minutes: int = 30
+    refresh_token_expire_days: int = 30
+    # Cache-Control: max-age для JWKS
+    jwks_max_age: int = 300
+    issuer: str = "kanban-auth-service"
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    app: AppConfig
+    jwt: JWTConfig
+    # Сервисы, которым разрешено подписывать токены: client_id -> SHA-256
+    # (hex) секрета. Пусто — POST /tokens отклоняет всех
+    clients: dict[str, str] = field(default_factory=dict)
+
+
+def _load_sources(settings_file: Path) -> dict:
+    raw = tomllib.loads(settings_file.read_text()) if settings_file.exists() else {}
+    for name, value in os.environ.items():
+        section, separator, key = name.lower().partition("__")
+        if separator and section.endswith("_settings"):
+            raw.setdefault(section, {})[key] = value
+    return raw
+
+
+def load_config(settings_file: Path = SETTINGS_FILE) -> Config:
+    raw = _load_sources(settings_file)
+    app = raw.get("app_settings", {})
+    jwt = raw.get("jwt_settings", {})
+    clients = raw.get("clients_settings", {})
+
+    keys_dir = Path(jwt.get("keys_dir", "keys"))
+    if not keys_dir.is_absolute():
+        keys_dir = BASE_DIR / keys_dir
+
+    return Config(
+        app=AppConfig(
+            name=app.get("app_name", "auth-service"),
+            version=app.get("app_version", "0.0.0"),
+            host=app.get("app_host", "0.0.0.0"),
+            port=int(app.get("app_port", 8001)),
+        ),
+        jwt=JWTConfig(
+            keys_dir=keys_dir,
+            key_activation_seconds=int(jwt.get("key_activation_seconds", 600)),
+            access_token_expire_minutes=int(jwt.get("access_token_expire_minutes", 30)),
+            refresh_token_expire_days=int(jwt.get("refresh_token_expire_days", 30)),
+            jwks_max_age=int(jwt.get("jwks_max_age", 300)),
+            issuer=jwt.get("issuer", "kanban-auth-service"),
+        ),
+        clients={
+            client_id: str(digest).lower() for client_id, digest in clients.items()
+        },
+    )
+
+
+@cache
+def get_config() -> Config:
+    return load_config()
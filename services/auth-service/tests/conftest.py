@@ -0,0 +1,29 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from core.clients import secret_digest
+from core.keys import get_key_store
+from services.config import get_config
+
+CLIENT_ID = "main_app"
+CLIENT_SECRET = "test-secret"
+
+
+@pytest.fixture(autouse=True)
+def config(tmp_path, monkeypatch):
+    """Свой каталог ключей и клиент на каждый тест; кэши конфигурации сброшены."""
+    monkeypatch.setenv("JWT_SETTINGS__KEYS_DIR", str(tmp_path / "keys"))
+    monkeypatch.setenv(f"CLIENTS_SETTINGS__{CLIENT_ID}", secret_digest(CLIENT_SECRET))
+    get_config.cache_clear()
+    get_key_store.cache_clear()
+    yield get_config()
+    get_config.cache_clear()
+    get_key_store.cache_clear()
+
+
+@pytest.fixture
+def client(config):
+    from main import app
+
+    with TestClient(app) as client:
+        yield client
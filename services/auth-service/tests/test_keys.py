@@ -0,0 +1,66 @@
+import os
+import time
+
+from core.keys import ALGORITHM, KeyStore, _read_key, thumbprint
+
+
+def _age(store: KeyStore, kid: str, seconds: float) -> None:
+    """Сдвигает время создания ключа в прошлое (mtime файла)."""
+    path = next(
+        path for path in store.directory.glob("*.pem") if _read_key(path).kid == kid
+    )
+    created_at = time.time() - seconds
+    os.utime(path, (created_at, created_at))
+    store.load()
+
+
+def test_first_key_is_active_immediately(tmp_path):
+    """Пустой каталог: создаётся ключ, он подписывает сразу."""
+    store = KeyStore(tmp_path, activation_seconds=600)
+    store.load()
+
+    assert len(store.keys) == 1
+    assert store.active.kid == store.keys[0].kid
+
+
+def test_rotated_key_signs_after_activation(tmp_path):
+    """Новый ключ сразу в JWKS, но подписывает только после задержки."""
+    store = KeyStore(tmp_path, activation_seconds=600)
+    store.load()
+    old = store.active
+    _age(store, old.kid, 3600)
+
+    new = store.rotate()
+    assert [key["kid"] for key in store.jwks()["keys"]] == [old.kid, new.kid]
+    assert store.active.kid == old.kid
+
+    _age(store, new.kid, 601)
+    assert store.active.kid == new.kid
+
+
+def test_reloads_keys_rotated_elsewhere(tmp_path):
+    """Ключ, созданный другим процессом (CLI), подхватывается без рестарта."""
+    store = KeyStore(tmp_path, activation_seconds=0)
+    store.load()
+    other = KeyStore(tmp_path, activation_seconds=0)
+    other.load()
+
+    new = other.rotate()
+    # mtime каталога может не измениться в пределах его разрешения
+    store._loaded_mtime = 0
+
+    assert new.kid in [key["kid"] for key in store.jwks()["keys"]]
+
+
+def test_jwks_contents(client):
+    """В JWKS только открытая часть ключа; kid — отпечаток RFC 7638."""
+    response = client.get("/.well-known/jwks.json")
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "public, max-age=300"
+
+    (key,) = response.json()["keys"]
+    assert set(key) == {"kty", "n", "e", "kid", "alg", "use"}
+    assert key["kty"] == "RSA"
+    assert key["alg"] == ALGORITHM
+    assert key["use"] == "sig"
+    assert key["kid"] == thumbprint(key)
@@ -0,0 +1,92 @@
+import time
+
+import pytest
+from jose import jwt
+
+from tests.conftest import CLIENT_ID, CLIENT_SECRET
+
+AUTH = (CLIENT_ID, CLIENT_SECRET)
+
+
+def _claims(**overrides) -> dict:
+    return {
+        "sub": "user-1",
+        "type": "access",
+        "exp": int(time.time()) + 600,
+    } | overrides
+
+
+def _verify(client, token: str) -> dict:
+    jwks = client.get("/.well-known/jwks.json").json()
+    kid = jwt.get_unverified_header(token)["kid"]
+    (key,) = [key for key in jwks["keys"] if key["kid"] == kid]
+    return jwt.decode(token, key, algorithms=["RS256"])
+
+
+@pytest.mark.parametrize(
+    "auth",
+    [None, (CLIENT_ID, "wrong"), ("unknown", CLIENT_SECRET)],
+    ids=["no credentials", "wrong secret", "unknown client"],
+)
+def test_requires_client_credentials(client, auth):
+    """Без учётных данных зарегистрированного клиента токены не подписываются."""
+    response = client.post("/tokens", json={"claims": [_claims()]}, auth=auth)
+
+    assert response.status_code == 401
+    assert response.headers["WWW-Authenticate"] == "Basic"
+
+
+def test_issues_tokens_in_request_order(client, config):
+    """Токены проверяются по JWKS; iss/iat/azp проставляет auth-service."""
+    claims = [
+        _claims(jti="a"),
+        _claims(type="refresh", exp=int(time.time()) + 86400, jti="b"),
+    ]
+    response = client.post(
+        "/tokens",
+        json={"claims": [claims[0] | {"azp": "forged"}, claims[1]]},
+        auth=AUTH,
+    )
+    assert response.status_code == 200
+
+    tokens = response.json()["tokens"]
+    decoded = [_verify(client, token) for token in tokens]
+    assert [payload["jti"] for payload in decoded] == ["a", "b"]
+    for payload in decoded:
+        assert payload["iss"] == config.jwt.issuer
+        assert payload["azp"] == CLIENT_ID
+        assert abs(payload["iat"] - time.time()) < 5
+
+
+@pytest.mark.parametrize(
+    "claims",
+    [
+        _claims(exp=int(time.time()) - 1),
+        _claims(exp=int(time.time()) + 31 * 60 + 60),
+        _claims(type="refresh", exp=int(time.time()) + 31 * 86400),
+    ],
+    ids=["expired", "access too long", "refresh too long"],
+)
+def test_rejects_lifetime_outside_limits(client, claims):
+    """exp в прошлом или дальше предельного срока токена — 400."""
+    response = client.post("/tokens", json={"claims": [claims]}, auth=AUTH)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == (
+        f"exp is outside the allowed {claims['type']} token lifetime"
+    )
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"claims": []},
+        {"claims": [_claims(type="id")]},
+        {"claims": [{"type": "access", "exp": int(time.time()) + 60}]},
+    ],
+    ids=["empty", "unknown type", "no sub"],
+)
+def test_rejects_malformed_claims(client, body):
+    response = client.post("/tokens", json=body, auth=AUTH)
+
+    assert response.status_code == 422
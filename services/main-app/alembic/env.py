@@ -5,11 +5,11 @@ from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
-from core.config import db_config
+from core.config import get_config
 from models import Base
 
 config = context.config
-config.set_main_option("sqlalchemy.url", db_config.url)
+config.set_main_option("sqlalchemy.url", get_config().db.url)
 
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
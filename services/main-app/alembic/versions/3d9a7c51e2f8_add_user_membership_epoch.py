@@ -0,0 +1,58 @@
+"""add user membership_epoch and team_member triggers
+
+Revision ID: 3d9a7c51e2f8
+Revises: b4e8f2a61c07
+Create Date: 2026-10-19 21:04:17.512630
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3d9a7c51e2f8"
+down_revision: str | None = "b4e8f2a61c07"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "user",
+        sa.Column("membership_epoch", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_membership_epoch() RETURNS trigger AS $$
+        BEGIN
+            UPDATE "user" SET membership_epoch = membership_epoch + 1
+            WHERE id IN (SELECT user_id FROM changed);
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER team_member_inserted_epoch
+        AFTER INSERT ON team_member REFERENCING NEW TABLE AS changed
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_membership_epoch()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER team_member_deleted_epoch
+        AFTER DELETE ON team_member REFERENCING OLD TABLE AS changed
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_membership_epoch()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER team_member_deleted_epoch ON team_member")
+    op.execute("DROP TRIGGER team_member_inserted_epoch ON team_member")
+    op.execute("DROP FUNCTION bump_membership_epoch()")
+    op.drop_column("user", "membership_epoch")
@@ -0,0 +1,33 @@
+"""create login_throttle
+
+Revision ID: 5f0c2b8e7a14
+Revises: 3d9a7c51e2f8
+Create Date: 2026-10-19 22:31:05.174902
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5f0c2b8e7a14"
+down_revision: str | None = "3d9a7c51e2f8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "login_throttle",
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("tat", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("key"),
+        prefixes=["UNLOGGED"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("login_throttle")
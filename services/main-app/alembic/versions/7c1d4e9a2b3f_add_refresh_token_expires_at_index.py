@@ -0,0 +1,31 @@
+"""add refresh_token expires_at index
+
+Revision ID: 7c1d4e9a2b3f
+Revises: 2e02ad7e14af, f253821c72e2
+Create Date: 2026-10-19 17:05:12.418305
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c1d4e9a2b3f"
+down_revision: str | Sequence[str] | None = ("2e02ad7e14af", "f253821c72e2")
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Очистка истёкших токенов выбирает их пачками по expires_at
+    op.create_index(
+        op.f("ix_refresh_token_expires_at"),
+        "refresh_token",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_refresh_token_expires_at"), table_name="refresh_token")
@@ -0,0 +1,43 @@
+"""add refresh_token family_id, revoked_at, replaced_by
+
+Revision ID: b4e8f2a61c07
+Revises: 7c1d4e9a2b3f
+Create Date: 2026-10-19 18:12:40.233917
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b4e8f2a61c07"
+down_revision: str | None = "7c1d4e9a2b3f"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("refresh_token", sa.Column("family_id", sa.UUID(), nullable=True))
+    # Выданные до ротации токены — каждый в своём семействе
+    op.execute("UPDATE refresh_token SET family_id = id")
+    op.alter_column("refresh_token", "family_id", nullable=False)
+    op.create_index(
+        op.f("ix_refresh_token_family_id"),
+        "refresh_token",
+        ["family_id"],
+        unique=False,
+    )
+    op.add_column(
+        "refresh_token", sa.Column("revoked_at", sa.DateTime(), nullable=True)
+    )
+    op.add_column("refresh_token", sa.Column("replaced_by", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("refresh_token", "replaced_by")
+    op.drop_column("refresh_token", "revoked_at")
+    op.drop_index(op.f("ix_refresh_token_family_id"), table_name="refresh_token")
+    op.drop_column("refresh_token", "family_id")
@@ -0,0 +1,7 @@
+from .generator import PASSWORD, DatagenConfig, generate
+
+__all__ = [
+    "DatagenConfig",
+    "generate",
+    "PASSWORD",
+]
@@ -0,0 +1,92 @@
+"""
+Генератор синтетических данных для всех моделей (COPY через asyncpg).
+
+Пример (из services/main-app), ~10M строк:
+
+    PYTHONPATH=src python -m benchmarks.datagen --truncate --seed 42 \\
+        --users 100000 --teams 2000 --boards 5000 --tasks-per-column 200 \\
+        --comments-per-task 2 --notifications-per-task 1
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from dataclasses import fields
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from core.config import get_config
+from models import Base
+
+from .generator import PASSWORD, DatagenConfig, generate
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.datagen")
+    parser.add_argument("--db-url", help="URL БД (по умолчанию из settings.toml)")
+    parser.add_argument(
+        "--truncate",
+        action="store_true",
+        help="Очистить все таблицы перед загрузкой",
+    )
+    parser.add_argument(
+        "--skip-fk-checks",
+        action="store_true",
+        help=(
+            "Отключить триггеры внешних ключей на время загрузки "
+            "(session_replication_role = replica, нужен суперпользователь)"
+        ),
+    )
+    for field in fields(DatagenConfig):
+        parser.add_argument(
+            f"--{field.name.replace('_', '-')}",
+            type=type(field.default),
+            default=field.default,
+        )
+    return parser.parse_args(argv)
+
+
+def _report(table: str, rows: int, elapsed: float) -> None:
+    rate = rows / elapsed if elapsed else 0
+    print(f"{table:<15} {rows:>12,} rows {elapsed:>8.2f}s {rate:>12,.0f} rows/s")
+
+
+async def main(args: argparse.Namespace) -> dict[str, int]:
+    config = DatagenConfig(
+        **{field.name: getattr(args, field.name) for field in fields(DatagenConfig)}
+    )
+    engine = create_async_engine(args.db_url or get_config().db.url)
+
+    try:
+        async with engine.begin() as conn:
+            if args.truncate:
+                tables = ", ".join(
+                    f'"{table.name}"' for table in Base.metadata.sorted_tables
+                )
+                await conn.execute(text(f"TRUNCATE TABLE {tables} CASCADE"))
+            if args.skip_fk_checks:
+                await conn.execute(text("SET LOCAL session_replication_role = replica"))
+
+            counts = await generate(conn, config, progress=_report)
+    finally:
+        await engine.dispose()
+
+    return counts
+
+
+def cli(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    started = time.perf_counter()
+    counts = asyncio.run(main(args))
+    elapsed = time.perf_counter() - started
+
+    total = sum(counts.values())
+    print(f"{'total':<15} {total:>12,} rows {elapsed:>8.2f}s")
+    print(f"Пароль всех пользователей: {PASSWORD}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(cli())
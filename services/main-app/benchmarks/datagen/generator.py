@@ -0,0 +1,317 @@
+import math
+import random
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from auth.security import hash_password
+from core.bulk import copy_records
+from enums.task_status import TaskStatus
+from models import (
+    Board,
+    BoardColumn,
+    Comment,
+    Notification,
+    RefreshToken,
+    Task,
+    TaskMember,
+    Team,
+    TeamMember,
+    User,
+)
+
+# Фиксированная точка отсчёта, чтобы данные зависели только от seed
+EPOCH = datetime(2025, 1, 1)
+HISTORY_DAYS = 365
+
+PASSWORD = "Password123!"
+
+
+@dataclass
+class DatagenConfig:
+    seed: int = 0
+    users: int = 1_000
+    teams: int = 50
+    members_per_team: float = 8.0
+    boards: int = 200
+    public_board_ratio: float = 0.2
+    columns_per_board: int = 5
+    tasks_per_column: float = 100.0
+    # Показатель Zipf для распределения задач по доскам: 0 — равномерно,
+    # больше 1 — несколько «горячих» досок держат большую часть задач
+    hot_board_skew: float = 1.1
+    task_members_per_task: float = 1.5
+    comments_per_task: float = 2.0
+    notifications_per_task: float = 1.0
+    refresh_tokens_per_user: float = 1.0
+
+    @property
+    def total_tasks(self) -> int:
+        return round(self.boards * self.columns_per_board * self.tasks_per_column)
+
+
+def poisson(rng: random.Random, mean: float) -> int:
+    """Пуассоновская величина (алгоритм Кнута, для больших средних — нормальное приближение)."""
+    if mean <= 0:
+        return 0
+    if mean > 30:
+        return max(round(rng.gauss(mean, math.sqrt(mean))), 0)
+
+    limit = math.exp(-mean)
+    k, p = 0, rng.random()
+    while p > limit:
+        k += 1
+        p *= rng.random()
+    return k
+
+
+def allocate(total: int, weights: list[float]) -> list[int]:
+    """Делит ``total`` пропорционально весам методом наибольших остатков."""
+    weight_sum = sum(weights)
+    exact = [total * weight / weight_sum for weight in weights]
+    counts = [math.floor(value) for value in exact]
+
+    remainder = total - sum(counts)
+    by_fraction = sorted(
+        range(len(weights)), key=lambda i: exact[i] - counts[i], reverse=True
+    )
+    for i in by_fraction[:remainder]:
+        counts[i] += 1
+
+    return counts
+
+
+class IdSpace:
+    """
+    Детерминированные UUID: старшие 64 бита — случайные на каждую таблицу,
+    младшие — порядковый номер строки. Так id задачи восстанавливается по
+    индексу, и не нужно держать в памяти миллионы UUID ради внешних ключей.
+    """
+
+    def __init__(self, rng: random.Random):
+        self.prefix = rng.getrandbits(64) << 64
+
+    def __call__(self, index: int) -> uuid.UUID:
+        return uuid.UUID(int=self.prefix | index)
+
+
+def _timestamps(rng: random.Random) -> tuple[datetime, datetime]:
+    created_at = EPOCH + timedelta(seconds=rng.randrange(HISTORY_DAYS * 86400))
+    updated_at = created_at + timedelta(seconds=rng.randrange(30 * 86400))
+    return created_at, updated_at
+
+
+def _columns(table) -> list[str]:
+    """Порядок колонок в кортежах генераторов: id, created_at, updated_at, остальные."""
+    head = ["id", "created_at", "updated_at"]
+    return head + [column.name for column in table.columns if column.name not in head]
+
+
+async def generate(
+    connection: AsyncConnection,
+    config: DatagenConfig,
+    progress: Callable[[str, int, float], None] | None = None,
+) -> dict[str, int]:
+    """
+    Генерирует связанные данные для всех моделей и грузит их через COPY.
+
+    Строки создаются генераторами и уходят в COPY потоково, память не
+    зависит от количества задач, комментариев и уведомлений.
+    Возвращает количество строк по таблицам.
+    """
+    rng = random.Random(config.seed)
+    # Один хэш на всех: считать sha512_crypt на каждого — часы на миллионе строк
+    password_hash = hash_password(PASSWORD)
+    ids = {
+        name: IdSpace(rng)
+        for name in (
+            "user",
+            "team",
+            "team_member",
+            "board",
+            "column",
+            "task",
+            "task_member",
+            "comment",
+            "notification",
+            "refresh_token",
+        )
+    }
+    statuses = [status.value for status in TaskStatus]
+    board_team = [
+        rng.randrange(config.teams) if config.teams and rng.random() < 0.8 else None
+        for _ in range(config.boards)
+    ]
+    columns_total = config.boards * config.columns_per_board
+
+    board_weights = [
+        1 / (rank**config.hot_board_skew) for rank in range(1, config.boards + 1)
+    ]
+    column_weights = [
+        board_weights[i // config.columns_per_board] for i in range(columns_total)
+    ]
+    tasks_per_column = allocate(config.total_tasks, column_weights)
+
+    def users() -> Iterator[tuple]:
+        for i in range(config.users):
+            created_at, updated_at = _timestamps(rng)
+            yield (
+                ids["user"](i),
+                created_at,
+                updated_at,
+                f"User {i}",
+                f"user{i}.{config.seed}@example.com",
+                password_hash,
+                0,
+            )
+
+    def teams() -> Iterator[tuple]:
+        for i in range(config.teams):
+            created_at, updated_at = _timestamps(rng)
+            yield ids["team"](i), created_at, updated_at, f"Team {i}", None
+
+    def team_members() -> Iterator[tuple]:
+        n = 0
+        for team in range(config.teams):
+            size = min(max(poisson(rng, config.members_per_team), 1), config.users)
+            for user in rng.sample(range(config.users), size):
+                created_at, updated_at = _timestamps(rng)
+                yield (
+                    ids["team_member"](n),
+                    created_at,
+                    updated_at,
+                    ids["team"](team),
+                    ids["user"](user),
+                )
+                n += 1
+
+    def boards() -> Iterator[tuple]:
+        for i in range(config.boards):
+            created_at, updated_at = _timestamps(rng)
+            team = board_team[i]
+            yield (
+                ids["board"](i),
+                created_at,
+                updated_at,
+                f"Board {i}",
+                None,
+                rng.random() < config.public_board_ratio,
+                ids["user"](rng.randrange(config.users)),
+                ids["team"](team) if team is not None else None,
+            )
+
+    def columns() -> Iterator[tuple]:
+        for i in range(columns_total):
+            created_at, updated_at = _timestamps(rng)
+            position = i % config.columns_per_board
+            yield (
+                ids["column"](i),
+                created_at,
+                updated_at,
+                f"Column {position}",
+                position,
+                None,
+                ids["board"](i // config.columns_per_board),
+            )
+
+    def tasks() -> Iterator[tuple]:
+        n = 0
+        for column, count in enumerate(tasks_per_column):
+            column_id = ids["column"](column)
+            for _ in range(count):
+                created_at, updated_at = _timestamps(rng)
+                due_date = None
+                if rng.random() < 0.7:
+                    due_date = created_at + timedelta(days=rng.randrange(-10, 60))
+                yield (
+                    ids["task"](n),
+                    created_at,
+                    updated_at,
+                    f"Task {n}",
+                    "Generated task description " * rng.randrange(0, 8) or None,
+                    rng.choice(statuses),
+                    due_date,
+                    ids["user"](rng.randrange(config.users)),
+                    column_id,
+                )
+                n += 1
+
+    def per_task(kind: str, mean: float, distinct: bool, body: str):
+        def rows() -> Iterator[tuple]:
+            n = 0
+            for task in range(config.total_tasks):
+                count = min(poisson(rng, mean), config.users)
+                if distinct:
+                    picked = rng.sample(range(config.users), count)
+                else:
+                    picked = [rng.randrange(config.users) for _ in range(count)]
+                for user in picked:
+                    created_at, updated_at = _timestamps(rng)
+                    row = (ids[kind](n), created_at, updated_at)
+                    if body:
+                        row += (body,)
+                    yield row + (ids["user"](user), ids["task"](task))
+                    n += 1
+
+        return rows
+
+    def refresh_tokens() -> Iterator[tuple]:
+        n = 0
+        for user in range(config.users):
+            for _ in range(poisson(rng, config.refresh_tokens_per_user)):
+                created_at, updated_at = _timestamps(rng)
+                revoked = rng.random() < 0.3
+                yield (
+                    ids["refresh_token"](n),
+                    created_at,
+                    updated_at,
+                    ids["user"](user),
+                    str(ids["refresh_token"](n)),
+                    created_at + timedelta(days=30),
+                    revoked,
+                    # Каждый токен — начало своего семейства, без ротаций
+                    ids["refresh_token"](n),
+                    updated_at if revoked else None,
+                    None,
+                )
+                n += 1
+
+    # Порядок важен: родительские таблицы раньше дочерних
+    plan = [
+        (User.__table__, users),
+        (Team.__table__, teams),
+        (TeamMember.__table__, team_members),
+        (Board.__table__, boards),
+        (BoardColumn.__table__, columns),
+        (Task.__table__, tasks),
+        (
+            TaskMember.__table__,
+            per_task("task_member", config.task_members_per_task, True, ""),
+        ),
+        (
+            Comment.__table__,
+            per_task("comment", config.comments_per_task, False, "Generated comment"),
+        ),
+        (
+            Notification.__table__,
+            per_task(
+                "notification", config.notifications_per_task, False, "Task updated"
+            ),
+        ),
+        (RefreshToken.__table__, refresh_tokens),
+    ]
+
+    counts = {}
+    for table, rows in plan:
+        started = time.perf_counter()
+        counts[table.name] = await copy_records(
+            connection, table, _columns(table), rows()
+        )
+        if progress:
+            progress(table.name, counts[table.name], time.perf_counter() - started)
+
+    return counts
@@ -0,0 +1,181 @@
+"""
+Нагрузочный прогон main-app.
+
+Примеры (из services/main-app):
+
+    PYTHONPATH=src python -m benchmarks.load --duration 30 --concurrency 20
+    PYTHONPATH=src python -m benchmarks.load --url http://localhost:8000 \\
+        --mix board_read=70,statistics_poll=30 --output result.json
+    PYTHONPATH=src python -m benchmarks.load --baseline old.json --max-regression 0.2
+
+Все входы прогона идут с одного IP, поэтому ограничение попыток входа
+(``rate_limit_settings``) отвечало бы 429 уже через ~30 входов. In-process
+прогон выключает его сам (``RATE_LIMIT_SETTINGS__ENABLED=false``, если
+переменная не задана явно); приложение для ``--url`` запускайте с этой
+переменной.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+from datetime import UTC, datetime
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from core.config import get_config, reload_config
+
+from .runner import RunConfig, run_load
+from .scenarios import DEFAULT_MIX, parse_mix
+from .seed import SeedConfig, seed
+from .stats import compare
+
+RATE_LIMIT_ENV = "RATE_LIMIT_SETTINGS__ENABLED"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.load",
+        epilog=(
+            f"In-process прогон выключает ограничение попыток входа "
+            f"({RATE_LIMIT_ENV}=false); приложение для --url запускайте с "
+            f"{RATE_LIMIT_ENV}=false, иначе login_burst получает 429."
+        ),
+    )
+    parser.add_argument(
+        "--url",
+        help="Базовый URL приложения. Без него приложение запускается in-process (ASGI)",
+    )
+    parser.add_argument(
+        "--db-url", help="URL БД для наполнения (по умолчанию из settings.toml)"
+    )
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=DEFAULT_MIX,
+        help="Веса сценариев, например board_read=50,task_move=20",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--users", type=int, default=SeedConfig.users)
+    parser.add_argument("--teams", type=int, default=SeedConfig.teams)
+    parser.add_argument("--boards", type=int, default=SeedConfig.boards)
+    parser.add_argument(
+        "--columns-per-board", type=int, default=SeedConfig.columns_per_board
+    )
+    parser.add_argument(
+        "--tasks-per-column", type=int, default=SeedConfig.tasks_per_column
+    )
+    parser.add_argument("--output", help="Файл для JSON-результата")
+    parser.add_argument("--baseline", help="JSON-результат прошлого прогона")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.2,
+        help="Допустимый рост p95 относительно baseline (доля)",
+    )
+    args = parser.parse_args(argv)
+
+    # Сценарии выбирают из засеянного: task_move переносит задачу между
+    # двумя колонками одной доски
+    minimums = {
+        "users": 1,
+        "teams": 1,
+        "boards": 1,
+        "columns_per_board": 2,
+        "tasks_per_column": 1,
+    }
+    for name, minimum in minimums.items():
+        if getattr(args, name) < minimum:
+            option = "--" + name.replace("_", "-")
+            parser.error(f"{option} must be >= {minimum}")
+    return args
+
+
+async def main(args: argparse.Namespace) -> dict:
+    engine = create_async_engine(args.db_url or get_config().db.url)
+    try:
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            data = await seed(
+                session,
+                SeedConfig(
+                    users=args.users,
+                    teams=args.teams,
+                    boards=args.boards,
+                    columns_per_board=args.columns_per_board,
+                    tasks_per_column=args.tasks_per_column,
+                ),
+                random.Random(args.seed),
+            )
+    finally:
+        await engine.dispose()
+
+    if args.url:
+        client = AsyncClient(base_url=args.url, timeout=30.0)
+        target = args.url
+    else:
+        from main import app
+
+        # Исключения приложения считаем ответами 500, а не падением прогона
+        transport = ASGITransport(app=app, raise_app_exceptions=False)
+        client = AsyncClient(
+            transport=transport, base_url="http://loadtest", timeout=30.0
+        )
+        target = "asgi"
+
+    run_config = RunConfig(
+        mix=args.mix,
+        concurrency=args.concurrency,
+        duration=args.duration,
+        seed=args.seed,
+    )
+    started_at = datetime.now(UTC).isoformat()
+    async with client:
+        summary = await run_load(client, data, run_config)
+
+    return {
+        "meta": {
+            "target": target,
+            "started_at": started_at,
+            "concurrency": run_config.concurrency,
+            "duration_s": run_config.duration,
+            "mix": run_config.mix,
+            "seed": run_config.seed,
+        },
+        **summary,
+    }
+
+
+def cli(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if not args.url:
+        # Настройки уже загружены при импорте репозиториев: перечитываем,
+        # лимитер берёт их из снимка на каждом запросе
+        os.environ.setdefault(RATE_LIMIT_ENV, "false")
+        reload_config()
+    result = asyncio.run(main(args))
+
+    output = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    print(output)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, result, args.max_regression)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(cli())
@@ -0,0 +1,53 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+
+from httpx import AsyncClient, HTTPError
+
+from .scenarios import SCENARIOS
+from .seed import SeedData
+from .stats import StatsCollector
+
+
+@dataclass
+class RunConfig:
+    mix: dict[str, int]
+    concurrency: int = 10
+    duration: float = 30.0
+    seed: int = 0
+
+
+async def run_load(client: AsyncClient, data: SeedData, config: RunConfig) -> dict:
+    """
+    Закрытая модель нагрузки: ``concurrency`` воркеров выполняют сценарии
+    один за другим, пока не истечёт ``duration`` секунд.
+    """
+    collector = StatsCollector()
+    names = list(config.mix)
+    weights = [config.mix[name] for name in names]
+    deadline = time.perf_counter() + config.duration
+
+    async def worker(worker_id: int) -> None:
+        # У каждого воркера свой генератор, чтобы прогон был воспроизводим
+        rng = random.Random(config.seed * 1000 + worker_id)
+        while time.perf_counter() < deadline:
+            name = rng.choices(names, weights=weights)[0]
+            started = time.perf_counter()
+            try:
+                requests = await SCENARIOS[name](client, data, rng)
+            except HTTPError:
+                elapsed = time.perf_counter() - started
+                collector.record(f"{name} (transport)", elapsed, False)
+                continue
+
+            for request in requests:
+                collector.record(
+                    request.route,
+                    request.response.elapsed.total_seconds(),
+                    request.response.status_code < 400,
+                )
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(config.concurrency)))
+    return collector.summary(time.perf_counter() - started)
@@ -0,0 +1,121 @@
+import random
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from httpx import AsyncClient, Response
+
+from .seed import SEED_PASSWORD, SeedData
+
+LOGIN_BURST_SIZE = 5
+
+
+@dataclass
+class Request:
+    route: str
+    response: Response
+
+
+Scenario = Callable[[AsyncClient, SeedData, random.Random], Awaitable[list[Request]]]
+
+
+def _auth(data: SeedData, rng: random.Random) -> tuple[str, dict]:
+    user_id = rng.choice(data.user_ids)
+    return str(user_id), {"Authorization": f"Bearer {data.tokens[user_id]}"}
+
+
+async def board_read(
+    client: AsyncClient, data: SeedData, rng: random.Random
+) -> list[Request]:
+    _, headers = _auth(data, rng)
+    board_id = rng.choice(data.board_ids)
+    board = await client.get(f"/api/v1/boards/{board_id}", headers=headers)
+    tasks = await client.get("/api/v1/tasks", headers=headers)
+    return [
+        Request("GET /api/v1/boards/{board_id}", board),
+        Request("GET /api/v1/tasks", tasks),
+    ]
+
+
+async def task_move(
+    client: AsyncClient, data: SeedData, rng: random.Random
+) -> list[Request]:
+    _, headers = _auth(data, rng)
+    board_id = rng.choice(data.board_ids)
+    source, target = rng.sample(data.column_ids[board_id], k=2)
+    task_id = rng.choice(data.task_ids[source] or data.task_ids[target])
+    response = await client.patch(
+        f"/api/v1/tasks/{task_id}", json={"column_id": str(target)}, headers=headers
+    )
+    return [Request("PATCH /api/v1/tasks/{task_id}", response)]
+
+
+async def comment_post(
+    client: AsyncClient, data: SeedData, rng: random.Random
+) -> list[Request]:
+    user_id, headers = _auth(data, rng)
+    response = await client.post(
+        "/api/v1/comments/",
+        json={
+            "body": "Load test comment",
+            "user_id": user_id,
+            "task_id": str(rng.choice(data.all_task_ids)),
+        },
+        headers=headers,
+    )
+    return [Request("POST /api/v1/comments/", response)]
+
+
+async def statistics_poll(
+    client: AsyncClient, data: SeedData, rng: random.Random
+) -> list[Request]:
+    _, headers = _auth(data, rng)
+    response = await client.get("/api/v1/statistics", headers=headers)
+    return [Request("GET /api/v1/statistics", response)]
+
+
+async def login_burst(
+    client: AsyncClient, data: SeedData, rng: random.Random
+) -> list[Request]:
+    email = rng.choice(data.emails)
+    requests = []
+    for _ in range(LOGIN_BURST_SIZE):
+        response = await client.post(
+            "/api/v1/auth/login", json={"email": email, "password": SEED_PASSWORD}
+        )
+        requests.append(Request("POST /api/v1/auth/login", response))
+    return requests
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "board_read": board_read,
+    "task_move": task_move,
+    "comment_post": comment_post,
+    "statistics_poll": statistics_poll,
+    "login_burst": login_burst,
+}
+
+DEFAULT_MIX = {
+    "board_read": 50,
+    "task_move": 20,
+    "comment_post": 15,
+    "statistics_poll": 10,
+    "login_burst": 5,
+}
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    """Разбирает строку вида ``board_read=50,task_move=20`` в веса сценариев."""
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise ValueError(
+                f"Unknown scenario '{name}', expected one of: {', '.join(SCENARIOS)}"
+            )
+        mix[name] = int(weight or 1)
+
+    if not any(mix.values()):
+        raise ValueError("Scenario mix must have at least one positive weight")
+
+    return mix
@@ -0,0 +1,124 @@
+import random
+import uuid
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from auth.jwt import create_access_token
+from auth.security import hash_password
+from core.unit_of_work import UnitOfWork
+from enums.task_status import TaskStatus
+from models import Team, TeamMember, User
+from repositories.board import BoardRepository
+from repositories.column import ColumnRepository
+from repositories.task import TaskRepository
+from repositories.team import TeamRepository
+from repositories.team_member import TeamMemberRepository
+from repositories.user import UserRepository
+
+SEED_PASSWORD = "LoadTest123!"
+
+
+@dataclass
+class SeedConfig:
+    users: int = 20
+    teams: int = 4
+    boards: int = 8
+    columns_per_board: int = 4
+    tasks_per_column: int = 25
+
+
+@dataclass
+class SeedData:
+    user_ids: list[UUID] = field(default_factory=list)
+    emails: list[str] = field(default_factory=list)
+    tokens: dict[UUID, str] = field(default_factory=dict)
+    team_ids: list[UUID] = field(default_factory=list)
+    board_ids: list[UUID] = field(default_factory=list)
+    column_ids: dict[UUID, list[UUID]] = field(default_factory=dict)
+    task_ids: dict[UUID, list[UUID]] = field(default_factory=dict)
+
+    @property
+    def all_task_ids(self) -> list[UUID]:
+        return [task_id for ids in self.task_ids.values() for task_id in ids]
+
+
+async def seed(
+    session: AsyncSession, config: SeedConfig, rng: random.Random
+) -> SeedData:
+    """
+    Наполняет БД через репозитории приложения.
+
+    Данные создаются теми же путями, что и в API, поэтому схема и значения по
+    умолчанию всегда совпадают с тем, что отдаёт приложение.
+    """
+    data = SeedData()
+    # Тег прогона не зависит от seed: повторный прогон не конфликтует по email
+    run_tag = uuid.uuid4().hex[:8]
+    # sha512_crypt дорогой — считаем хэш один раз на всех пользователей
+    hashed_password = hash_password(SEED_PASSWORD)
+
+    # Репозитории только flush-ят: всё засеянное коммитится одним разом
+    async with UnitOfWork(session):
+        user_repo = UserRepository(session)
+        for i in range(config.users):
+            email = f"load-{run_tag}-{i}@example.com"
+            user = await user_repo.add(
+                User(
+                    name=f"Load User {i}", email=email, hashed_password=hashed_password
+                )
+            )
+            data.user_ids.append(user.id)
+            data.emails.append(email)
+            data.tokens[user.id] = create_access_token(user.id)
+
+        team_repo = TeamRepository(session)
+        team_member_repo = TeamMemberRepository(session)
+        for i in range(config.teams):
+            team = await team_repo.add(Team(name=f"Load Team {run_tag}-{i}"))
+            data.team_ids.append(team.id)
+            for user_id in rng.sample(data.user_ids, k=min(5, len(data.user_ids))):
+                await team_member_repo.create(
+                    TeamMember(team_id=team.id, user_id=user_id)
+                )
+
+        board_repo = BoardRepository(session)
+        column_repo = ColumnRepository(session)
+        task_repo = TaskRepository(session)
+        statuses = list(TaskStatus)
+        for i in range(config.boards):
+            board = await board_repo.create(
+                {
+                    "title": f"Load Board {i}",
+                    "owner_id": rng.choice(data.user_ids),
+                    "team_id": rng.choice(data.team_ids) if data.team_ids else None,
+                }
+            )
+            data.board_ids.append(board.id)
+            data.column_ids[board.id] = []
+
+            for position in range(config.columns_per_board):
+                column = await column_repo.create(
+                    {
+                        "title": f"Column {position}",
+                        "position": position,
+                        "board_id": board.id,
+                    }
+                )
+                data.column_ids[board.id].append(column.id)
+                data.task_ids[column.id] = []
+
+                for j in range(config.tasks_per_column):
+                    task = await task_repo.create(
+                        {
+                            "title": f"Task {i}-{position}-{j}",
+                            "description": "Load test task " * rng.randint(1, 20),
+                            "status": rng.choice(statuses),
+                            "user_id": rng.choice(data.user_ids),
+                            "column_id": column.id,
+                        }
+                    )
+                    data.task_ids[column.id].append(task.id)
+
+    return data
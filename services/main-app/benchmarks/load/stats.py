@@ -0,0 +1,90 @@
+import math
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+
+@dataclass
+class RouteStats:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    @property
+    def count(self) -> int:
+        return len(self.latencies)
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Перцентиль методом nearest-rank (значения могут быть не отсортированы)."""
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = max(math.ceil(q / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class StatsCollector:
+    def __init__(self):
+        self.routes: dict[str, RouteStats] = defaultdict(RouteStats)
+
+    def record(self, route: str, latency: float, ok: bool) -> None:
+        stats = self.routes[route]
+        stats.latencies.append(latency)
+        if not ok:
+            stats.errors += 1
+
+    def summary(self, elapsed: float) -> dict:
+        routes = {
+            route: _summarize(stats, elapsed)
+            for route, stats in sorted(self.routes.items())
+        }
+
+        all_latencies = [
+            latency for stats in self.routes.values() for latency in stats.latencies
+        ]
+        total_errors = sum(stats.errors for stats in self.routes.values())
+        totals = _summarize(
+            RouteStats(latencies=all_latencies, errors=total_errors), elapsed
+        )
+
+        return {"elapsed_s": round(elapsed, 3), "totals": totals, "routes": routes}
+
+
+def _summarize(stats: RouteStats, elapsed: float) -> dict:
+    count = stats.count
+    return {
+        "requests": count,
+        "errors": stats.errors,
+        "error_rate": round(stats.errors / count, 4) if count else 0.0,
+        "throughput_rps": round(count / elapsed, 2) if elapsed > 0 else 0.0,
+        "mean_ms": round(sum(stats.latencies) / count * 1000, 3) if count else 0.0,
+        "p50_ms": round(percentile(stats.latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(stats.latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(stats.latencies, 99) * 1000, 3),
+        "max_ms": round(max(stats.latencies, default=0.0) * 1000, 3),
+    }
+
+
+def compare(baseline: dict, current: dict, max_regression: float) -> list[str]:
+    """
+    Сравнивает два результата прогона.
+
+    Возвращает список регрессий: маршрут, у которого p95 вырос больше чем
+    на max_regression (доля, 0.2 = 20%) или выросла доля ошибок.
+    """
+    regressions = []
+
+    for route, base in baseline.get("routes", {}).items():
+        cur = current.get("routes", {}).get(route)
+        if cur is None or not base["requests"]:
+            continue
+
+        if base["p95_ms"] and cur["p95_ms"] > base["p95_ms"] * (1 + max_regression):
+            regressions.append(f"{route}: p95 {base['p95_ms']}ms -> {cur['p95_ms']}ms")
+
+        if cur["error_rate"] > base["error_rate"]:
+            regressions.append(
+                f"{route}: error_rate {base['error_rate']} -> {cur['error_rate']}"
+            )
+
+    return regressions
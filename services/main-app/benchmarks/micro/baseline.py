@@ -0,0 +1,73 @@
+import json
+import warnings
+from pathlib import Path
+
+import pytest
+
+from .timer import Measurement
+
+SAVE_BASELINE_COMMAND = "python -m pytest benchmarks/micro --bench-save-baseline"
+
+
+class MissingBaselineWarning(UserWarning):
+    """Замеры не с чем сравнить: регрессия по ним не проверялась."""
+
+
+class BenchmarkRecorder:
+    """
+    Собирает замеры за сессию и сверяет их с сохранённым baseline.
+
+    Ключ замера — ``<имя>[<размер датасета>]``. Замер проваливает тест, если
+    медиана выросла больше чем на ``max_regression`` относительно baseline.
+    Если baseline для ключа нет — замер только записывается, а в конце
+    сессии ``warn_unchecked`` перечисляет такие ключи.
+    """
+
+    def __init__(self, baseline_path: Path, max_regression: float):
+        self.baseline_path = baseline_path
+        self.max_regression = max_regression
+        self.baseline: dict[str, dict] = {}
+        self.results: dict[str, dict] = {}
+        self.unchecked: list[str] = []
+
+        if baseline_path.exists():
+            self.baseline = json.loads(baseline_path.read_text())
+
+    def check(self, name: str, measurement: Measurement, size: int | None = None):
+        key = name if size is None else f"{name}[{size}]"
+        self.results[key] = measurement.as_dict()
+
+        base = self.baseline.get(key)
+        if base is None:
+            self.unchecked.append(key)
+            return
+
+        limit = base["median_us"] * (1 + self.max_regression)
+        if measurement.median_us > limit:
+            pytest.fail(
+                f"{key} regressed: median {measurement.median_us:.1f}us, "
+                f"baseline {base['median_us']:.1f}us "
+                f"(allowed +{self.max_regression:.0%})"
+            )
+
+    def warn_unchecked(self) -> None:
+        if not self.unchecked:
+            return
+        if self.baseline_path.exists():
+            reason = f"no baseline in {self.baseline_path}"
+        else:
+            reason = f"{self.baseline_path} does not exist"
+        warnings.warn(
+            f"not checked for regressions ({reason}): "
+            f"{', '.join(self.unchecked)}. "
+            f"Record a baseline on this machine with: {SAVE_BASELINE_COMMAND}",
+            MissingBaselineWarning,
+            stacklevel=1,
+        )
+
+    def save_baseline(self) -> None:
+        merged = {**self.baseline, **self.results}
+        self.baseline_path.write_text(json.dumps(merged, indent=2, sort_keys=True))
+
+    def save_results(self, path: Path) -> None:
+        path.write_text(json.dumps(self.results, indent=2, sort_keys=True))
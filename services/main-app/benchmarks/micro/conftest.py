@@ -0,0 +1,122 @@
+import os
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from .baseline import BenchmarkRecorder
+from .dataset import populate
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines.json"
+
+
+# ============================================================================
+# Параметры запуска
+# ============================================================================
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption(
+        "--bench-sizes",
+        default=os.environ.get("BENCH_SIZES", "1000"),
+        help="Размеры датасета (число задач) через запятую, например 1000,100000,1000000",
+    )
+    group.addoption(
+        "--bench-baseline",
+        default=str(DEFAULT_BASELINE),
+        help="JSON-файл с baseline замерами",
+    )
+    group.addoption(
+        "--bench-save-baseline",
+        action="store_true",
+        help="Записать текущие замеры как новый baseline",
+    )
+    group.addoption(
+        "--bench-max-regression",
+        type=float,
+        default=float(os.environ.get("BENCH_MAX_REGRESSION", "0.2")),
+        help="Допустимый рост медианы относительно baseline (доля)",
+    )
+    group.addoption("--bench-output", help="Файл для JSON с замерами прогона")
+
+
+def pytest_generate_tests(metafunc):
+    if "dataset_size" in metafunc.fixturenames:
+        sizes = [
+            int(size) for size in metafunc.config.getoption("--bench-sizes").split(",")
+        ]
+        metafunc.parametrize("dataset_size", sizes, scope="session")
+
+
+@pytest.fixture(scope="session")
+def bench(request) -> BenchmarkRecorder:
+    config = request.config
+    recorder = BenchmarkRecorder(
+        Path(config.getoption("--bench-baseline")),
+        config.getoption("--bench-max-regression"),
+    )
+    yield recorder
+
+    if config.getoption("--bench-save-baseline"):
+        recorder.save_baseline()
+    else:
+        recorder.warn_unchecked()
+    if output := config.getoption("--bench-output"):
+        recorder.save_results(Path(output))
+
+
+# ============================================================================
+# База данных (как в tests/conftest.py: внешняя БД или testcontainers)
+# ============================================================================
+
+
+@pytest.fixture(scope="session")
+def db_url():
+    """
+    URL БД для замеров.
+
+    Если задан BENCH_DB_URL (postgresql+asyncpg://...) — используется он,
+    иначе поднимается PostgreSQL в testcontainers.
+    """
+    if url := os.environ.get("BENCH_DB_URL"):
+        yield url
+        return
+
+    from testcontainers.postgres import PostgresContainer
+
+    with PostgresContainer(
+        image="postgres:latest",
+        username="bench_user",
+        password="bench_password",
+        dbname="bench_db",
+    ) as postgres:
+        sync_url = postgres.get_connection_url()
+        yield sync_url.replace("postgresql+psycopg2://", "postgresql+asyncpg://")
+
+
+@pytest.fixture(scope="session")
+async def db_engine(db_url):
+    from models import Base
+
+    engine = create_async_engine(db_url, echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture(scope="session")
+async def dataset(db_engine, dataset_size) -> int:
+    """Наполняет БД под текущий размер датасета (один раз на размер)."""
+    await populate(db_engine, tasks=dataset_size)
+    return dataset_size
+
+
+@pytest.fixture
+async def db_session(db_engine, dataset) -> AsyncGenerator[AsyncSession]:
+    async_session = async_sessionmaker(db_engine, expire_on_commit=False)
+    async with async_session() as session:
+        yield session
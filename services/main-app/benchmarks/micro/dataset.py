@@ -0,0 +1,32 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from benchmarks.datagen import DatagenConfig, generate
+from models import Base
+
+
+async def populate(engine: AsyncEngine, tasks: int, seed: int = 0) -> None:
+    """
+    Пересоздаёт данные для микробенчмарков: ``tasks`` задач плюс пропорциональное
+    количество пользователей, досок, колонок, комментариев и исполнителей.
+    """
+    boards = max(tasks // 5000, 2)
+    columns_per_board = 5
+    config = DatagenConfig(
+        seed=seed,
+        users=max(tasks // 1000, 10),
+        teams=max(boards // 2, 1),
+        boards=boards,
+        columns_per_board=columns_per_board,
+        tasks_per_column=tasks / (boards * columns_per_board),
+        hot_board_skew=1.0,
+        task_members_per_task=0.5,
+        comments_per_task=0.25,
+        notifications_per_task=0.0,
+    )
+
+    async with engine.begin() as conn:
+        tables = ", ".join(f'"{table.name}"' for table in Base.metadata.sorted_tables)
+        await conn.execute(text(f"TRUNCATE TABLE {tables} CASCADE"))
+        await generate(conn, config)
+        await conn.execute(text("ANALYZE"))
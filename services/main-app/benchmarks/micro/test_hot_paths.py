@@ -0,0 +1,201 @@
+import uuid
+from datetime import datetime
+
+import pytest
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.v1.boards import board_to_response
+from api.v1.tasks import task_to_response
+from auth.jwt import create_access_token, decode_token
+from auth.security import hash_password
+from core.config import get_config, load_config
+from core.responses import fast_json
+from enums.task_status import TaskStatus
+from models import Board, Task
+from repositories.statistics import StatisticsRepository
+from repositories.task import TaskRepository
+from schemas.task import TaskResponse
+from services.statistics import StatisticsService
+
+from .baseline import BenchmarkRecorder
+from .timer import ameasure, measure
+
+# ============================================================================
+# Репозитории и сервисы (зависят от размера датасета)
+# ============================================================================
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_task_repository_get_all_first_page(
+    db_session: AsyncSession, dataset: int, bench: BenchmarkRecorder
+):
+    repo = TaskRepository(db_session)
+
+    async def call():
+        await repo.get_all(skip=0, limit=100)
+        # Как в реальном запросе — без накопленной identity map
+        db_session.expunge_all()
+
+    bench.check("TaskRepository.get_all", await ameasure(call), dataset)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_task_repository_get_all_sparse_fields(
+    db_session: AsyncSession, dataset: int, bench: BenchmarkRecorder
+):
+    """Карточки канбана: только id, title, status, column_id, due_date."""
+    repo = TaskRepository(db_session)
+    fields = ("id", "title", "status", "due_date", "column_id")
+
+    async def call():
+        rows = await repo.get_all(skip=0, limit=100, fields=fields)
+        fast_json(rows, TaskResponse, fields)
+
+    bench.check("TaskRepository.get_all(fields)", await ameasure(call), dataset)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_task_repository_get_all_deep_offset(
+    db_session: AsyncSession, dataset: int, bench: BenchmarkRecorder
+):
+    repo = TaskRepository(db_session)
+    skip = max(dataset - 100, 0)
+
+    async def call():
+        await repo.get_all(skip=skip, limit=100)
+        db_session.expunge_all()
+
+    bench.check(
+        "TaskRepository.get_all(deep offset)",
+        await ameasure(call, max_rounds=200),
+        dataset,
+    )
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_task_repository_get_by_column_id(
+    db_session: AsyncSession, dataset: int, bench: BenchmarkRecorder
+):
+    """Страница задач колонки — запрос BaseRepository с фильтром."""
+    repo = TaskRepository(db_session)
+    column_id = await db_session.scalar(select(Task.column_id).limit(1))
+
+    async def call():
+        await repo.get_by_column_id(column_id, skip=0, limit=100)
+        db_session.expunge_all()
+
+    bench.check("TaskRepository.get_by_column_id", await ameasure(call), dataset)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_statistics_service_get_statistics(
+    db_session: AsyncSession, dataset: int, bench: BenchmarkRecorder
+):
+    service = StatisticsService(StatisticsRepository(db_session))
+
+    bench.check(
+        "StatisticsService.get_statistics",
+        await ameasure(service.get_statistics, max_rounds=200),
+        dataset,
+    )
+
+
+# ============================================================================
+# Сериализация и auth (от датасета не зависят)
+# ============================================================================
+
+
+def _task() -> Task:
+    now = datetime.utcnow()
+    return Task(
+        id=uuid.uuid4(),
+        title="Benchmark task",
+        description="Benchmark task description " * 5,
+        status=TaskStatus.IN_PROGRESS,
+        due_date=now,
+        user_id=uuid.uuid4(),
+        column_id=uuid.uuid4(),
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _board() -> Board:
+    now = datetime.utcnow()
+    return Board(
+        id=uuid.uuid4(),
+        title="Benchmark board",
+        description="Benchmark board description",
+        is_public=False,
+        owner_id=uuid.uuid4(),
+        team_id=uuid.uuid4(),
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_task_to_response(bench: BenchmarkRecorder):
+    task = _task()
+    bench.check("task_to_response", measure(lambda: task_to_response(task)))
+
+
+def test_board_to_response(bench: BenchmarkRecorder):
+    board = _board()
+    bench.check("board_to_response", measure(lambda: board_to_response(board)))
+
+
+LIST_RESPONSE_SIZE = 1000
+
+
+def test_list_tasks_response_model(bench: BenchmarkRecorder):
+    """
+    Ответ на 1000 задач так, как его собирает FastAPI по response_model:
+    модели через task_to_response, повторная валидация, dump и json.dumps.
+    """
+    tasks = [_task() for _ in range(LIST_RESPONSE_SIZE)]
+    adapter = TypeAdapter(list[TaskResponse])
+
+    def call():
+        content = adapter.validate_python([task_to_response(task) for task in tasks])
+        return JSONResponse(adapter.dump_python(content, mode="json")).body
+
+    bench.check("list_tasks response (response_model)", measure(call))
+
+
+def test_list_tasks_response_fast_json(bench: BenchmarkRecorder):
+    """Тот же ответ через fast_json: ORM-объекты сразу в байты."""
+    tasks = [_task() for _ in range(LIST_RESPONSE_SIZE)]
+
+    bench.check(
+        "list_tasks response (fast_json)",
+        measure(lambda: fast_json(tasks, TaskResponse).body),
+    )
+
+
+def test_decode_token(bench: BenchmarkRecorder):
+    token = create_access_token(uuid.uuid4())
+    bench.check("decode_token", measure(lambda: decode_token(token, "access")))
+
+
+def test_config_load(bench: BenchmarkRecorder):
+    """Разовая стоимость при старте: чтение и проверка settings.toml."""
+    bench.check("load_config", measure(load_config, max_rounds=20))
+
+
+def test_config_attribute_access(bench: BenchmarkRecorder):
+    """Чтение настройки на горячем пути — обычные атрибуты снимка."""
+    bench.check(
+        "get_config().auth.secret_key",
+        measure(lambda: get_config().auth.secret_key),
+    )
+
+
+def test_hash_password(bench: BenchmarkRecorder):
+    # Хэш намеренно дорогой — хватает нескольких раундов
+    bench.check(
+        "hash_password",
+        measure(lambda: hash_password("BenchPassword123!"), warmup=1, max_rounds=5),
+    )
@@ -0,0 +1,23 @@
+import statistics
+
+from benchmarks.startup.profile import profile_runs
+
+from .baseline import BenchmarkRecorder
+from .timer import Measurement
+
+
+def test_cold_import_main(bench: BenchmarkRecorder):
+    """
+    Холодный импорт приложения в отдельном процессе — бюджет на старт
+    воркера. Разбивка по пакетам: ``python -m benchmarks.startup``.
+    """
+    walls = [profile.wall_us for profile in profile_runs("main", runs=5)]
+    bench.check(
+        "cold import main",
+        Measurement(
+            rounds=len(walls),
+            median_us=statistics.median(walls),
+            min_us=min(walls),
+            max_us=max(walls),
+        ),
+    )
@@ -0,0 +1,80 @@
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+
+@dataclass
+class Measurement:
+    rounds: int
+    median_us: float
+    min_us: float
+    max_us: float
+
+    def as_dict(self) -> dict:
+        return {
+            "rounds": self.rounds,
+            "median_us": round(self.median_us, 3),
+            "min_us": round(self.min_us, 3),
+            "max_us": round(self.max_us, 3),
+        }
+
+
+def _build(samples: list[int]) -> Measurement:
+    return Measurement(
+        rounds=len(samples),
+        median_us=statistics.median(samples) / 1000,
+        min_us=min(samples) / 1000,
+        max_us=max(samples) / 1000,
+    )
+
+
+def measure(
+    fn: Callable[[], object],
+    *,
+    warmup: int = 3,
+    min_time: float = 0.5,
+    max_rounds: int = 10_000,
+) -> Measurement:
+    """
+    Замеряет стоимость одного вызова ``fn``.
+
+    Вызовы повторяются, пока суммарно не пройдёт ``min_time`` секунд
+    (но не больше ``max_rounds``). Медиана устойчивее среднего к выбросам GC.
+    """
+    for _ in range(warmup):
+        fn()
+
+    samples = []
+    deadline = time.perf_counter() + min_time
+    while len(samples) < max_rounds and (
+        time.perf_counter() < deadline or len(samples) < 5
+    ):
+        started = time.perf_counter_ns()
+        fn()
+        samples.append(time.perf_counter_ns() - started)
+
+    return _build(samples)
+
+
+async def ameasure(
+    fn: Callable[[], Awaitable[object]],
+    *,
+    warmup: int = 3,
+    min_time: float = 0.5,
+    max_rounds: int = 10_000,
+) -> Measurement:
+    """Асинхронный вариант :func:`measure`."""
+    for _ in range(warmup):
+        await fn()
+
+    samples = []
+    deadline = time.perf_counter() + min_time
+    while len(samples) < max_rounds and (
+        time.perf_counter() < deadline or len(samples) < 5
+    ):
+        started = time.perf_counter_ns()
+        await fn()
+        samples.append(time.perf_counter_ns() - started)
+
+    return _build(samples)
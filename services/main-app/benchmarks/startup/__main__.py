@@ -0,0 +1,63 @@
+"""
+Профиль холодного старта: время импорта приложения и его разбивка по
+пакетам (``python -X importtime`` в отдельных процессах).
+
+Примеры (из services/main-app):
+
+    PYTHONPATH=src python -m benchmarks.startup
+    PYTHONPATH=src python -m benchmarks.startup --runs 10 --budget-ms 900 \\
+        --output startup.json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+
+from .profile import median_profile, profile_runs, report
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup")
+    parser.add_argument("--module", default="main", help="Что импортировать")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        help="Бюджет на медиану холодного импорта; при превышении код возврата 1",
+    )
+    parser.add_argument("--output", help="Файл для JSON-результата")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    profiles = profile_runs(args.module, args.runs)
+    print(report(profiles, args.top))
+
+    median_ms = statistics.median(profile.wall_us for profile in profiles) / 1000
+    if args.output:
+        result = {
+            "module": args.module,
+            "runs": [profile.wall_us / 1000 for profile in profiles],
+            "median_ms": median_ms,
+            "packages_ms": {
+                package: self_us / 1000
+                for package, self_us in median_profile(profiles).by_package().items()
+            },
+        }
+        with open(args.output, "w") as file:
+            json.dump(result, file, indent=2)
+
+    if args.budget_ms is not None and median_ms > args.budget_ms:
+        print(
+            f"\nstartup budget exceeded: {median_ms:.1f} ms > {args.budget_ms:.1f} ms",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
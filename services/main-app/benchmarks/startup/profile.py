@@ -0,0 +1,100 @@
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent.parent
+
+# Печатает время импорта в микросекундах последней строкой stdout
+_SNIPPET = (
+    "import time; started = time.perf_counter_ns(); import {module}; "
+    "print((time.perf_counter_ns() - started) // 1000)"
+)
+
+
+@dataclass
+class ImportEntry:
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ImportProfile:
+    """Один холодный импорт модуля в отдельном процессе."""
+
+    wall_us: int
+    entries: list[ImportEntry] = field(default_factory=list)
+
+    def by_package(self) -> dict[str, int]:
+        """Собственное время импорта, сложенное по пакетам верхнего уровня."""
+        totals: dict[str, int] = defaultdict(int)
+        for entry in self.entries:
+            totals[entry.name.split(".")[0]] += entry.self_us
+        return dict(totals)
+
+
+def parse_importtime(stderr: str) -> list[ImportEntry]:
+    """Разбирает вывод ``python -X importtime``."""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        # Вложенность — по два пробела на уровень перед именем
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        entries.append(
+            ImportEntry(name.strip(), int(self_us), int(cumulative_us), depth)
+        )
+    return entries
+
+
+def profile_import(module: str = "main") -> ImportProfile:
+    """Импортирует ``module`` в чистом интерпретаторе с ``-X importtime``."""
+    env = {**os.environ, "PYTHONPATH": str(APP_DIR / "src")}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _SNIPPET.format(module=module)],
+        cwd=APP_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall_us = int(result.stdout.strip().splitlines()[-1])
+    return ImportProfile(wall_us=wall_us, entries=parse_importtime(result.stderr))
+
+
+def profile_runs(module: str = "main", runs: int = 5) -> list[ImportProfile]:
+    return [profile_import(module) for _ in range(runs)]
+
+
+def median_profile(profiles: list[ImportProfile]) -> ImportProfile:
+    """Прогон с медианным временем — по нему строится отчёт."""
+    ordered = sorted(profiles, key=lambda profile: profile.wall_us)
+    return ordered[len(ordered) // 2]
+
+
+def report(profiles: list[ImportProfile], top: int = 15) -> str:
+    walls = [profile.wall_us / 1000 for profile in profiles]
+    profile = median_profile(profiles)
+
+    lines = [
+        f"cold import: median {statistics.median(walls):.1f} ms, "
+        f"min {min(walls):.1f} ms, max {max(walls):.1f} ms ({len(walls)} runs)",
+        "",
+        f"{'self ms':>9}  package",
+    ]
+    packages = sorted(profile.by_package().items(), key=lambda item: -item[1])
+    for package, self_us in packages[:top]:
+        lines.append(f"{self_us / 1000:>9.1f}  {package}")
+
+    lines += ["", f"{'cum ms':>9}  module (top-level imports of the app)"]
+    direct = [entry for entry in profile.entries if entry.depth <= 1]
+    for entry in sorted(direct, key=lambda entry: -entry.cumulative_us)[:top]:
+        lines.append(f"{entry.cumulative_us / 1000:>9.1f}  {entry.name}")
+
+    return "\n".join(lines)
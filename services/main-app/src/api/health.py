@@ -0,0 +1,30 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from core.health import health_monitor
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+
+@router.get("")
+async def health():
+    return {"status": "healthy", "service": "main-app"}
+
+
+@router.get("/live")
+async def live():
+    """Процесс жив и обслуживает цикл событий; зависимости не проверяются."""
+    return {"status": "alive"}
+
+
+@router.get("/ready")
+async def ready():
+    """
+    Готовность принимать трафик: БД, пул соединений, задержка цикла
+    событий и версия схемы. Если хоть одна проверка не прошла — 503.
+    """
+    ok, checks = await health_monitor.ready()
+    return JSONResponse(
+        status_code=200 if ok else 503,
+        content={"status": "ready" if ok else "unavailable", "checks": checks},
+    )
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
 
 from auth.dependencies import get_current_user
@@ -16,6 +16,12 @@ from services.auth import AuthService, get_auth_service
 router = APIRouter()
 
 
+def _client_ip(request: Request) -> str | None:
+    # За прокси адрес клиента из X-Forwarded-For подставляет uvicorn, если
+    # прокси в server_settings.forwarded_allow_ips
+    return request.client.host if request.client else None
+
+
 @router.post(
     "/register",
     response_model=TokenPair,
@@ -38,11 +44,12 @@ async def register(
     description="Эндпоинт для OAuth2PasswordBearer. Используется Swagger UI для авторизации.",
 )
 async def login_for_token(
+    request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
     service: AuthService = Depends(get_auth_service),
 ):
     login_data = UserLogin(email=form_data.username, password=form_data.password)
-    return await service.login(login_data)
+    return await service.login(login_data, _client_ip(request))
 
 
 @router.post(
@@ -53,10 +60,11 @@ async def login_for_token(
     description="Аутентифицирует пользователя и возвращает пару токенов",
 )
 async def login(
+    request: Request,
     data: UserLogin,
     service: AuthService = Depends(get_auth_service),
 ):
-    return await service.login(data)
+    return await service.login(data, _client_ip(request))
 
 
 @router.post(
@@ -64,7 +72,7 @@ async def login(
     response_model=TokenPair,
     status_code=status.HTTP_200_OK,
     summary="Обновление токенов",
-    description="Создает новый access token используя refresh token (reuse стратегия)",
+    description="Обменивает refresh token на новую пару токенов (ротация: старый refresh отзывается)",
 )
 async def refresh(
     data: RefreshRequest,
@@ -1,11 +1,14 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 
 from auth.dependencies import get_current_user
+from core.responses import fast_json, streaming_download
+from enums.export_format import ExportFormat
 from models import Board, User
 from schemas.board import BoardResponse, CreateBoardRequest, UpdateBoardRequest
 from services.board import BoardService, get_board_service
+from services.export import MEDIA_TYPES, ExportService, get_export_service
 
 router = APIRouter()
 
@@ -16,9 +19,16 @@ BOARD_NOT_FOUND_MESSAGE = "Board not found"
 async def list_boards(
     skip: int | None = Query(None),
     limit: int | None = Query(None),
+    ids: list[UUID] | None = Query(None, max_length=1000),
     service: BoardService = Depends(get_board_service),
     current_user: User = Depends(get_current_user),
 ):
+    if ids:
+        # Пакетный запрос: один SELECT ... WHERE id = ANY(...) на все id,
+        # несуществующие id пропускаются
+        boards = await service.get_by_ids(ids)
+        return fast_json(boards, BoardResponse)
+
     if skip is None:
         skip = 0
     elif skip < 0:
@@ -30,7 +40,7 @@ async def list_boards(
         limit = min(limit, 1000)
 
     boards = await service.get_many(skip=skip, limit=limit)
-    return [board_to_response(board) for board in boards]
+    return fast_json(boards, BoardResponse)
 
 
 @router.get("/boards/{board_id}", response_model=BoardResponse)
@@ -47,6 +57,30 @@ async def get_board(
     return board_to_response(board)
 
 
+@router.get("/boards/{board_id}/export")
+async def export_board(
+    board_id: UUID,
+    request: Request,
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    service: BoardService = Depends(get_board_service),
+    export_service: ExportService = Depends(get_export_service),
+    current_user: User = Depends(get_current_user),
+):
+    """Доска с колонками, задачами, исполнителями и комментариями одним потоком."""
+    board = await service.get(board_id)
+    if not board:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=BOARD_NOT_FOUND_MESSAGE
+        )
+
+    return streaming_download(
+        export_service.export_board(board_id, export_format),
+        media_type=MEDIA_TYPES[export_format],
+        filename=f"board-{board_id}.{export_format.value}",
+        accept_encoding=request.headers.get("accept-encoding"),
+    )
+
+
 @router.post("/boards", response_model=BoardResponse, status_code=status.HTTP_201_CREATED)
 async def create_board(
     board_data: CreateBoardRequest,
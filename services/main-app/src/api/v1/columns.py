@@ -3,6 +3,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from auth.dependencies import get_current_user
+from core.responses import fast_json
 from models import BoardColumn, User
 from schemas.column import ColumnResponse, CreateColumnRequest, UpdateColumnRequest
 from services.column import ColumnService, get_column_service
@@ -16,9 +17,16 @@ COLUMN_NOT_FOUND_MESSAGE = "Column not found"
 async def list_columns(
     skip: int | None = Query(None),
     limit: int | None = Query(None),
+    ids: list[UUID] | None = Query(None, max_length=1000),
     service: ColumnService = Depends(get_column_service),
     current_user: User = Depends(get_current_user),
 ):
+    if ids:
+        # Пакетный запрос: один SELECT ... WHERE id = ANY(...) на все id,
+        # несуществующие id пропускаются
+        columns = await service.get_by_ids(ids)
+        return fast_json(columns, ColumnResponse)
+
     if skip is None:
         skip = 0
     elif skip < 0:
@@ -30,7 +38,7 @@ async def list_columns(
         limit = min(limit, 1000)
 
     columns = await service.get_many(skip=skip, limit=limit)
-    return [column_to_response(column) for column in columns]
+    return fast_json(columns, ColumnResponse)
 
 
 @router.get("/columns/{column_id}", response_model=ColumnResponse)
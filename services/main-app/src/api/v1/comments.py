@@ -2,9 +2,9 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from src.exceptions import CommentNotFoundError
-from src.schemas import CommentCreate, CommentOut, CommentUpdate
-from src.services.comment import CommentService, get_comment_service
+from exceptions import CommentNotFoundError
+from schemas import CommentCreate, CommentOut, CommentUpdate
+from services.comment import CommentService, get_comment_service
 
 COMMENT_NOT_FOUND_MESSAGE = "Comment not found"
 
@@ -0,0 +1,46 @@
+from fastapi import APIRouter, Depends, Query, Request
+
+from auth.dependencies import get_current_user
+from core.compression import gunzip_stream
+from enums.export_format import ExportFormat
+from models import User
+from schemas.bulk_import import ImportSummary
+from services.bulk_import import ImportService, get_import_service
+
+router = APIRouter()
+
+
+@router.post(
+    "/import",
+    response_model=ImportSummary,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {"schema": {"type": "string"}},
+                "text/csv": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def import_data(
+    request: Request,
+    import_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    skip: int = Query(0, ge=0),
+    service: ImportService = Depends(get_import_service),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Импорт команд, досок, колонок, задач, комментариев и участников в
+    формате выгрузки ``/boards/{id}/export``. Тело читается потоково,
+    можно присылать сжатым (Content-Encoding: gzip).
+
+    Чтобы продолжить прерванный импорт, передайте в ``skip`` число
+    ``records`` из последнего ответа (или просто отправьте файл заново —
+    уже загруженные id будут пропущены).
+    """
+    chunks = request.stream()
+    if request.headers.get("content-encoding", "").lower() == "gzip":
+        chunks = gunzip_stream(chunks)
+
+    return await service.import_stream(chunks, import_format, skip=skip)
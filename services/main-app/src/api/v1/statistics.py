@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 
 from auth.dependencies import get_current_user
+from core.responses import cached_json
 from models import User
 from schemas.statistics import StatisticsResponse
 from services.statistics import StatisticsService, get_statistics_service
@@ -10,7 +11,12 @@ router = APIRouter()
 
 @router.get("/statistics", response_model=StatisticsResponse)
 async def get_statistics(
+    request: Request,
     service: StatisticsService = Depends(get_statistics_service),
     current_user: User = Depends(get_current_user),
 ):
-    return await service.get_statistics()
+    """
+    Сводная статистика. Ответ помечается ETag: при совпадении
+    If-None-Match возвращается 304, сжатое тело кэшируется по версии.
+    """
+    return cached_json(request, await service.get_statistics())
@@ -3,22 +3,45 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from auth.dependencies import get_current_user
+from core.fields import sparse_fields
+from core.responses import FastJSONResponse, fast_json, rows_to_dicts
+from exceptions import ColumnLimitExceededError, ColumnNotFoundError
 from models import Task, User
-from schemas.task import CreateTaskRequest, TaskResponse, UpdateTaskRequest
+from schemas.task import (
+    BulkUpdateTasksRequest,
+    BulkUpdateTasksResponse,
+    CreateTaskRequest,
+    TaskResponse,
+    UpdateTaskRequest,
+)
 from services.task import TaskService, get_task_service
 
 router = APIRouter()
 
 TASK_NOT_FOUND_MESSAGE = "Task not found"
 
+task_fields = sparse_fields(TaskResponse)
+
 
 @router.get("/tasks", response_model=list[TaskResponse])
 async def list_tasks(
     skip: int | None = Query(None),
     limit: int | None = Query(None),
+    ids: list[UUID] | None = Query(None, max_length=1000),
+    fields: tuple[str, ...] | None = Depends(task_fields),
     service: TaskService = Depends(get_task_service),
     current_user: User = Depends(get_current_user),
 ):
+    """
+    ``?fields=id,title,status`` — только перечисленные поля (id всегда):
+    из БД выбираются только эти колонки.
+    """
+    if ids:
+        # Пакетный запрос: один SELECT ... WHERE id = ANY(...) на все id,
+        # несуществующие id пропускаются
+        tasks = await service.get_by_ids(ids, fields=fields)
+        return fast_json(tasks, TaskResponse, fields)
+
     if skip is None:
         skip = 0
     elif skip < 0:
@@ -29,21 +52,24 @@ async def list_tasks(
     else:
         limit = min(limit, 1000)
 
-    tasks = await service.get_many(skip=skip, limit=limit)
-    return [task_to_response(task) for task in tasks]
+    tasks = await service.get_many(skip=skip, limit=limit, fields=fields)
+    return fast_json(tasks, TaskResponse, fields)
 
 
 @router.get("/tasks/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: UUID,
+    fields: tuple[str, ...] | None = Depends(task_fields),
     service: TaskService = Depends(get_task_service),
     current_user: User = Depends(get_current_user),
 ):
-    task = await service.get(task_id)
+    task = await service.get(task_id, fields=fields)
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=TASK_NOT_FOUND_MESSAGE
         )
+    if fields:
+        return FastJSONResponse(rows_to_dicts([task], TaskResponse, fields)[0])
     return task_to_response(task)
 
 
@@ -57,6 +83,25 @@ async def create_task(
     return task_to_response(task)
 
 
+@router.patch("/tasks:bulk", response_model=BulkUpdateTasksResponse)
+async def bulk_update_tasks(
+    payload: BulkUpdateTasksRequest,
+    service: TaskService = Depends(get_task_service),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        tasks = await service.bulk_update(payload)
+    except ColumnNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    except ColumnLimitExceededError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
+
+    return BulkUpdateTasksResponse(
+        updated=len(tasks),
+        tasks=[task_to_response(task) for task in tasks],
+    )
+
+
 @router.patch("/tasks/{task_id}", response_model=TaskResponse)
 async def update_task(
     task_id: UUID,
@@ -1,11 +1,14 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 
 from auth.dependencies import get_current_user
+from core.responses import fast_json, streaming_download
+from enums.export_format import ExportFormat
 from exceptions import TeamNotFoundError
 from models import Team, User
 from schemas.team import CreateTeamRequest, TeamResponse, UpdateTeamRequest
+from services.export import MEDIA_TYPES, ExportService, get_export_service
 from services.team import TeamService, get_team_service
 
 router = APIRouter()
@@ -17,9 +20,16 @@ TEAM_NOT_FOUND_MESSAGE = "Team not found"
 async def list_teams(
     skip: int | None = Query(None),
     limit: int | None = Query(None),
+    ids: list[UUID] | None = Query(None, max_length=1000),
     service: TeamService = Depends(get_team_service),
     current_user: User = Depends(get_current_user),
 ):
+    if ids:
+        # Пакетный запрос: один SELECT ... WHERE id = ANY(...) на все id,
+        # несуществующие id пропускаются
+        teams = await service.get_by_ids(ids)
+        return fast_json(teams, TeamResponse)
+
     if skip is None:
         skip = 0
     elif skip < 0:
@@ -34,7 +44,7 @@ async def list_teams(
             limit = 1000
 
     teams = await service.get_many(skip=skip, limit=limit)
-    return [team_to_response(team) for team in teams]
+    return fast_json(teams, TeamResponse)
 
 
 @router.get("/teams/{team_id}", response_model=TeamResponse)
@@ -52,6 +62,31 @@ async def get_team(
     return team_to_response(team)
 
 
+@router.get("/teams/{team_id}/export")
+async def export_team(
+    team_id: UUID,
+    request: Request,
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    service: TeamService = Depends(get_team_service),
+    export_service: ExportService = Depends(get_export_service),
+    current_user: User = Depends(get_current_user),
+):
+    """Команда, её участники и все доски команды одним потоком."""
+    try:
+        await service.get(team_id)
+    except TeamNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=TEAM_NOT_FOUND_MESSAGE
+        ) from e
+
+    return streaming_download(
+        export_service.export_team(team_id, export_format),
+        media_type=MEDIA_TYPES[export_format],
+        filename=f"team-{team_id}.{export_format.value}",
+        accept_encoding=request.headers.get("accept-encoding"),
+    )
+
+
 @router.post("/teams", response_model=TeamResponse, status_code=status.HTTP_201_CREATED)
 async def create_team(
     team_data: CreateTeamRequest,
@@ -0,0 +1,49 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from auth.dependencies import get_current_user
+from core.responses import fast_json
+from models import User
+from schemas.user_schema import UserResponse
+from services.user import UserService, get_user_service
+
+router = APIRouter()
+
+USER_NOT_FOUND_MESSAGE = "User not found"
+
+
+@router.get("/users", response_model=list[UserResponse])
+async def list_users(
+    ids: list[UUID] = Query(min_length=1, max_length=1000),
+    service: UserService = Depends(get_user_service),
+    current_user: User = Depends(get_current_user),
+):
+    # Только пакетное получение по ids: постраничного каталога всех
+    # пользователей (с email) нет
+    users = await service.get_by_ids(ids)
+    return fast_json(users, UserResponse)
+
+
+@router.get("/users/{user_id}", response_model=UserResponse)
+async def get_user(
+    user_id: UUID,
+    service: UserService = Depends(get_user_service),
+    current_user: User = Depends(get_current_user),
+):
+    user = await service.get(user_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=USER_NOT_FOUND_MESSAGE
+        )
+    return user_to_response(user)
+
+
+def user_to_response(user: User) -> UserResponse:
+    return UserResponse(
+        id=user.id,
+        name=user.name,
+        email=user.email,
+        created_at=user.created_at,
+        updated_at=user.updated_at,
+    )
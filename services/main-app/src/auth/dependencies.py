@@ -5,6 +5,7 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
 
 from auth.jwt import decode_token
+from auth.memberships import Memberships
 from exceptions import InvalidCredentialsError
 from models import User
 from repositories.user import UserRepository, get_user_repository
@@ -12,12 +13,18 @@ from repositories.user import UserRepository, get_user_repository
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token")
 
 
+async def get_token_payload(token: str = Depends(oauth2_scheme)) -> dict:
+    try:
+        return decode_token(token, expected_type="access")
+    except JWTError:
+        raise InvalidCredentialsError() from None
+
+
 async def get_current_user(
-    token: str = Depends(oauth2_scheme),
+    payload: dict = Depends(get_token_payload),
     user_repo: UserRepository = Depends(get_user_repository),
 ) -> User:
     try:
-        payload = decode_token(token, expected_type="access")
         user_id_str: str = payload.get("sub")
 
         if user_id_str is None:
@@ -25,8 +32,6 @@ async def get_current_user(
 
         user_id = UUID(user_id_str)
 
-    except JWTError:
-        raise InvalidCredentialsError() from None
     except ValueError:
         raise InvalidCredentialsError() from None
 
@@ -36,3 +41,23 @@ async def get_current_user(
         raise InvalidCredentialsError()
 
     return user
+
+
+async def get_current_memberships(
+    payload: dict = Depends(get_token_payload),
+    user: User = Depends(get_current_user),
+    user_repo: UserRepository = Depends(get_user_repository),
+) -> Memberships:
+    """
+    Команды текущего пользователя для проверок доступа: из токена, если его
+    эпоха членства актуальна, иначе (членство менялось после выпуска токена
+    или токен без команд) — из БД. Пользователь, удалённый после проверки
+    токена, — 401, как и в ``get_current_user``.
+    """
+    memberships = Memberships.from_claims(payload)
+    if memberships is not None and memberships.epoch == user.membership_epoch:
+        return memberships
+    memberships = await user_repo.get_memberships(user.id)
+    if memberships is None:
+        raise InvalidCredentialsError()
+    return memberships
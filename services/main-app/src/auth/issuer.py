@@ -0,0 +1,68 @@
+"""
+Выпуск токенов.
+
+Если задан ``issuer_url``, токены подписывает auth-service: пара токенов —
+один запрос ``POST {issuer_url}`` со списком claims, в ответе — токены в
+том же порядке. main-app представляется auth-service по HTTP Basic
+(``issuer_client_id``/``issuer_client_secret``). Иначе они подписываются в процессе (``LocalIssuer``).
+"""
+
+import base64
+from collections.abc import Awaitable, Callable
+
+from auth.jwt import encode_token
+from core.config import get_config
+from core.http import post_json
+
+
+class IssuerError(Exception):
+    """auth-service недоступен или отказал в выпуске токенов."""
+
+
+class LocalIssuer:
+    async def issue(self, *claims: dict) -> list[str]:
+        return [encode_token(item) for item in claims]
+
+
+class RemoteIssuer:
+    def __init__(
+        self,
+        url: str,
+        timeout: float,
+        client_id: str,
+        client_secret: str,
+        post: Callable[[str, dict, float, dict[str, str]], Awaitable[dict]] = post_json,
+    ):
+        self.url = url
+        self.timeout = timeout
+        credentials = base64.b64encode(f"{client_id}:{client_secret}".encode())
+        self.headers = {"Authorization": f"Basic {credentials.decode()}"}
+        # Отправка запроса; в тестах — замена auth-service
+        self.post = post
+
+    async def issue(self, *claims: dict) -> list[str]:
+        try:
+            response = await self.post(
+                self.url, {"claims": claims}, self.timeout, self.headers
+            )
+            tokens = response["tokens"]
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            raise IssuerError(repr(exc)) from exc
+        if len(tokens) != len(claims):
+            raise IssuerError(f"expected {len(claims)} tokens, got {len(tokens)}")
+        return tokens
+
+
+local_issuer = LocalIssuer()
+
+
+def get_token_issuer() -> LocalIssuer | RemoteIssuer:
+    auth_config = get_config().auth
+    if auth_config.issuer_url:
+        return RemoteIssuer(
+            auth_config.issuer_url,
+            auth_config.issuer_timeout,
+            auth_config.issuer_client_id,
+            auth_config.issuer_client_secret,
+        )
+    return local_issuer
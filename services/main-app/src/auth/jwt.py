@@ -1,11 +1,17 @@
+import calendar
 import uuid
 from datetime import datetime, timedelta
+from functools import cache
 from typing import Literal
 from uuid import UUID
 
-from jose import JWTError, jwt
+from jose import JWTError
 
-from core.config import auth_config
+from auth.keys import SigningKey, key_set, load_signing_key
+from auth.memberships import Memberships
+from core.config import Config, get_config, on_reload
+
+auth_config = get_config().auth
 
 SECRET_KEY = auth_config.secret_key
 ALGORITHM = auth_config.algorithm
@@ -13,34 +19,97 @@ ACCESS_TOKEN_EXPIRE_MINUTES = auth_config.access_token_expire_minutes
 REFRESH_TOKEN_EXPIRE_DAYS = auth_config.refresh_token_expire_days
 
 
-def create_access_token(user_id: UUID) -> str:
-    expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+@cache
+def _jwt():
+    # jose.jwt тянет за собой cryptography — импорт при первом токене,
+    # а не при старте воркера
+    from jose import jwt
+
+    return jwt
+
+
+@cache
+def local_signing_key() -> SigningKey:
+    """Ключ локальной замены auth-service (``jwks_url`` не задан)."""
+    key = load_signing_key(get_config().auth.private_key_path)
+    if not get_config().auth.jwks_url:
+        key_set.replace({"keys": [key.public_jwk]})
+    return key
+
 
-    payload = {
+@on_reload
+def _apply_config(config: Config) -> None:
+    global SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES, REFRESH_TOKEN_EXPIRE_DAYS
+    SECRET_KEY = config.auth.secret_key
+    ALGORITHM = config.auth.algorithm
+    ACCESS_TOKEN_EXPIRE_MINUTES = config.auth.access_token_expire_minutes
+    REFRESH_TOKEN_EXPIRE_DAYS = config.auth.refresh_token_expire_days
+    local_signing_key.cache_clear()
+
+
+def _timestamp(moment: datetime) -> int:
+    return calendar.timegm(moment.utctimetuple())
+
+
+def access_claims(user_id: UUID, memberships: Memberships | None = None) -> dict:
+    expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    claims = {
         "sub": str(user_id),
         "type": "access",
-        "exp": expire,
+        "exp": _timestamp(expire),
     }
+    auth_config = get_config().auth
+    if (
+        memberships is not None
+        and auth_config.embed_memberships
+        and len(memberships.team_ids) <= auth_config.max_embedded_teams
+    ):
+        claims |= memberships.claims()
+    return claims
 
-    return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
-
-def create_refresh_token(user_id: UUID, jti: str) -> str:
+def refresh_claims(user_id: UUID, jti: str) -> dict:
     expire = datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-
-    payload = {
+    return {
         "sub": str(user_id),
         "type": "refresh",
         "jti": jti,
-        "exp": expire,
+        "exp": _timestamp(expire),
     }
 
-    return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
+
+def encode_token(claims: dict) -> str:
+    """Подписывает токен в процессе: секретом (HS*) или локальным ключом."""
+    if get_config().auth.symmetric:
+        return _jwt().encode(claims, SECRET_KEY, algorithm=ALGORITHM)
+    signing_key = local_signing_key()
+    return _jwt().encode(
+        claims, signing_key.key, algorithm=ALGORITHM, headers={"kid": signing_key.kid}
+    )
+
+
+def create_access_token(user_id: UUID, memberships: Memberships | None = None) -> str:
+    return encode_token(access_claims(user_id, memberships))
+
+
+def create_refresh_token(user_id: UUID, jti: str) -> str:
+    return encode_token(refresh_claims(user_id, jti))
+
+
+def _verification_key(token: str):
+    if get_config().auth.symmetric:
+        return SECRET_KEY
+    if not get_config().auth.jwks_url:
+        local_signing_key()
+    key = key_set.get(_jwt().get_unverified_header(token).get("kid"))
+    if key is None:
+        raise JWTError("Unknown signing key")
+    return key
 
 
 def decode_token(token: str, expected_type: Literal["access", "refresh"]) -> dict:
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = _jwt().decode(token, _verification_key(token), algorithms=[ALGORITHM])
 
         token_type = payload.get("type")
         if token_type != expected_type:
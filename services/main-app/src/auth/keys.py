@@ -0,0 +1,234 @@
+"""
+Ключи подписи JWT (RS256).
+
+Токены проверяются локально: открытые ключи лежат в памяти воркера
+(``key_set``) и выбираются по ``kid`` из заголовка токена, на каждый
+запрос к auth-service никто не ходит.
+
+- задан ``jwks_url`` — ключи из JWKS auth-service. ``JWKSRefresher``
+  перечитывает документ раз в ``jwks_refresh_seconds`` и досрочно, когда
+  приходит токен с неизвестным ``kid`` (ротация), но не чаще раза в
+  ``jwks_min_refresh_seconds``. Ошибка загрузки оставляет прежние ключи;
+- ``jwks_url`` пуст — локальная замена auth-service: закрытый ключ из
+  ``private_key_path`` (создаётся при первом запуске), в наборе — его
+  открытая часть. Файл общий для воркеров и тестов, запущенных из того же
+  каталога.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from jose.exceptions import JOSEError
+
+from core.config import BASE_DIR, get_config
+from core.http import get_json
+
+ALGORITHM = "RS256"
+
+logger = logging.getLogger(__name__)
+
+
+def _jwk():
+    # jose.jwk тянет cryptography — импорт при первом ключе
+    from jose import jwk
+
+    return jwk
+
+
+def thumbprint(public_jwk: dict) -> str:
+    """``kid`` ключа — отпечаток RFC 7638, одинаковый у auth-service и здесь."""
+    canonical = json.dumps(
+        {name: public_jwk[name] for name in ("e", "kty", "n")},
+        separators=(",", ":"),
+        sort_keys=True,
+    )
+    digest = hashlib.sha256(canonical.encode()).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+@dataclass(frozen=True, slots=True)
+class SigningKey:
+    kid: str
+    # Объект ключа jose: PEM разбирается один раз, а не на каждой подписи
+    key: object
+    public_jwk: dict
+
+    @classmethod
+    def from_pem(cls, pem: bytes) -> "SigningKey":
+        key = _jwk().construct(pem, ALGORITHM)
+        public_jwk = {
+            name: value
+            for name, value in key.public_key().to_dict().items()
+            if name in ("kty", "n", "e")
+        }
+        kid = thumbprint(public_jwk)
+        public_jwk |= {"kid": kid, "alg": ALGORITHM, "use": "sig"}
+        return cls(kid=kid, key=key, public_jwk=public_jwk)
+
+
+def generate_private_key() -> bytes:
+    """PEM нового ключа RSA-2048: через cryptography, если установлена."""
+    try:
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import rsa
+    except ImportError:
+        # Чистый Python (зависимость jose): медленно, но ключ создаётся редко
+        import rsa as pure_rsa
+
+        _, private_key = pure_rsa.newkeys(2048)
+        return private_key.save_pkcs1()
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+
+
+def load_signing_key(path: str | Path) -> SigningKey:
+    """
+    Закрытый ключ локальной замены auth-service; если файла нет, создаёт
+    его. Файл появляется атомарно (link временного файла), поэтому воркеры,
+    стартующие одновременно, получают один и тот же ключ.
+    """
+    path = Path(path)
+    if not path.is_absolute():
+        path = BASE_DIR / path
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}")
+        tmp.write_bytes(generate_private_key())
+        tmp.chmod(0o600)
+        try:
+            os.link(tmp, path)
+        except FileExistsError:
+            pass
+        finally:
+            tmp.unlink()
+    return SigningKey.from_pem(path.read_bytes())
+
+
+class KeySet:
+    """Открытые ключи для проверки подписи, по ``kid``."""
+
+    def __init__(self):
+        self._keys: dict[str, object] = {}
+        # Пришёл токен с неизвестным kid — повод перечитать JWKS досрочно
+        self.missing = asyncio.Event()
+
+    def get(self, kid: str | None) -> object | None:
+        key = self._keys.get(kid)
+        if key is None:
+            self.missing.set()
+        return key
+
+    def replace(self, jwks: dict) -> None:
+        """
+        Заменяет набор ключами из JWKS; неподходящие и повреждённые записи
+        пропускаются. Не JWKS или документ без единого подходящего ключа —
+        ``ValueError``, набор прежний.
+        """
+        if not isinstance(jwks, dict) or not isinstance(jwks.get("keys"), list):
+            raise ValueError("JWKS is not a key set document")
+        keys = {}
+        for entry in jwks["keys"]:
+            if not isinstance(entry, dict):
+                continue
+            if entry.get("kty") != "RSA" or entry.get("alg", ALGORITHM) != ALGORITHM:
+                continue
+            if entry.get("use", "sig") != "sig" or "kid" not in entry:
+                continue
+            try:
+                keys[entry["kid"]] = _jwk().construct(entry, ALGORITHM)
+            except (TypeError, KeyError, ValueError, JOSEError):
+                # Например, запись без n/e: остальные ключи документа годятся
+                continue
+        if not keys:
+            raise ValueError("JWKS has no usable signing keys")
+        self._keys = keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+key_set = KeySet()
+
+
+class JWKSRefresher:
+    """Фоновая задача воркера: держит ``key_set`` в соответствии с JWKS."""
+
+    def __init__(
+        self,
+        keys: KeySet = key_set,
+        url: str | None = None,
+        refresh_seconds: float | None = None,
+        min_refresh_seconds: float | None = None,
+        fetch: Callable[[str], Awaitable[dict]] | None = None,
+    ):
+        auth_config = get_config().auth
+        self.keys = keys
+        self.url = url or auth_config.jwks_url
+        self.refresh_seconds = refresh_seconds or auth_config.jwks_refresh_seconds
+        self.min_refresh_seconds = (
+            auth_config.jwks_min_refresh_seconds
+            if min_refresh_seconds is None
+            else min_refresh_seconds
+        )
+        # Загрузка JWKS по URL; в тестах — замена auth-service
+        self.fetch = fetch or self._fetch
+        # Установлено после первой успешной загрузки
+        self.loaded = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    @staticmethod
+    async def _fetch(url: str) -> dict:
+        return await get_json(url, get_config().auth.issuer_timeout)
+
+    async def _run(self) -> None:
+        delay = 1.0
+        while True:
+            self.keys.missing.clear()
+            fetched_at = time.monotonic()
+            try:
+                self.keys.replace(await self.fetch(self.url))
+            except Exception as exc:
+                # Любая ошибка загрузки или разбора — повтор с задержкой, а не
+                # конец задачи. Прежние ключи остаются: токены проверяются
+                logger.warning("JWKS refresh from %s failed: %r", self.url, exc)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.refresh_seconds)
+                continue
+            delay = 1.0
+            self.loaded.set()
+
+            try:
+                async with asyncio.timeout(self.refresh_seconds):
+                    await self.keys.missing.wait()
+            except TimeoutError:
+                continue
+            # Неизвестный kid: перечитываем, но не чаще min_refresh_seconds
+            await asyncio.sleep(
+                max(0.0, fetched_at + self.min_refresh_seconds - time.monotonic())
+            )
+
+
+jwks_refresher = JWKSRefresher()
@@ -0,0 +1,44 @@
+"""
+Членство в командах внутри access-токена.
+
+Токен несёт ``mep`` — эпоху членства пользователя на момент выпуска — и
+``teams`` — id его команд. Проверки авторизации берут команды из токена,
+если эпоха совпадает с ``User.membership_epoch``: пользователь и так
+загружается на каждый запрос, отдельного запроса к team_member нет.
+Любое изменение team_member увеличивает эпоху (триггер БД), и токены,
+выпущенные раньше, до следующего refresh обращаются к БД.
+"""
+
+from dataclasses import dataclass
+from uuid import UUID
+
+EPOCH_CLAIM = "mep"
+TEAMS_CLAIM = "teams"
+
+
+@dataclass(frozen=True, slots=True)
+class Memberships:
+    epoch: int
+    team_ids: frozenset[UUID]
+
+    def claims(self) -> dict:
+        return {
+            EPOCH_CLAIM: self.epoch,
+            TEAMS_CLAIM: sorted(str(team_id) for team_id in self.team_ids),
+        }
+
+    @classmethod
+    def from_claims(cls, payload: dict) -> "Memberships | None":
+        """Членство из claims токена; None — в токене его нет или оно испорчено."""
+        epoch = payload.get(EPOCH_CLAIM)
+        teams = payload.get(TEAMS_CLAIM)
+        if not isinstance(epoch, int) or not isinstance(teams, list):
+            return None
+        try:
+            team_ids = frozenset(UUID(team_id) for team_id in teams)
+        except (TypeError, ValueError, AttributeError):
+            return None
+        return cls(epoch=epoch, team_ids=team_ids)
+
+    def is_member(self, team_id: UUID) -> bool:
+        return team_id in self.team_ids
@@ -0,0 +1,140 @@
+"""
+Ограничение частоты попыток входа.
+
+Проверка пароля — самая дорогая операция приложения, поэтому лимит
+проверяется до поиска пользователя и хэширования: отдельно на IP клиента
+(перебор с одного адреса) и на email (подбор пароля к одной учётной
+записи с многих адресов).
+
+Лимит — token bucket в форме GCRA: вместо числа токенов и времени
+пополнения на ключ хранится одно число — теоретическое время следующей
+попытки (``tat``). Ключ с ``tat`` в прошлом — полная корзина, его можно
+удалить без потери состояния; так и работает вытеснение по TTL.
+
+- ``backend = "memory"`` — словарь ключ -> ``tat`` в памяти воркера, не
+  больше ``max_keys`` ключей. При N воркерах фактический лимит до N раз
+  выше настроенного;
+- ``backend = "database"`` — общие для воркеров счётчики в таблице
+  ``login_throttle`` (один запрос на ключ).
+"""
+
+import time
+from dataclasses import dataclass
+from itertools import islice
+from typing import Protocol
+
+from fastapi import Depends
+
+from core.config import RateLimitConfig, get_config
+from repositories.login_throttle import (
+    LoginThrottleRepository,
+    get_login_throttle_repository,
+)
+
+# Как часто backend = "database" удаляет ключи с полными корзинами
+SWEEP_INTERVAL_SECONDS = 60.0
+
+
+@dataclass(frozen=True, slots=True)
+class Bucket:
+    # Попыток подряд и секунд на восстановление одной попытки
+    burst: int
+    refill_seconds: float
+
+    @property
+    def tolerance(self) -> float:
+        return self.refill_seconds * (self.burst - 1)
+
+    def admit(self, tat: float, now: float) -> tuple[float, float]:
+        """(новый tat, 0) — попытка разрешена; (прежний tat, ожидание) — нет."""
+        start = max(tat, now)
+        wait = start - self.tolerance - now
+        if wait > 0:
+            return tat, wait
+        return start + self.refill_seconds, 0.0
+
+
+class BucketStore(Protocol):
+    async def acquire(self, key: str, bucket: Bucket) -> float: ...
+
+
+class MemoryBuckets:
+    """``tat`` по ключам в памяти воркера; порядок ключей — по последней попытке."""
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._tat: dict[str, float] = {}
+
+    async def acquire(self, key: str, bucket: Bucket) -> float:
+        now = time.monotonic()
+        tat, wait = bucket.admit(self._tat.pop(key, now), now)
+        self._tat[key] = tat
+        if len(self._tat) > self.max_keys:
+            self._evict(now)
+        return wait
+
+    def _evict(self, now: float) -> None:
+        self._tat = {key: tat for key, tat in self._tat.items() if tat > now}
+        # Словарь ужимается с запасом (до 3/4 предела), чтобы не перебирать
+        # его на каждой следующей попытке: если истёкших ключей не хватило,
+        # уходят самые давние из активных
+        excess = len(self._tat) - self.max_keys * 3 // 4
+        for key in list(islice(self._tat, max(excess, 0))):
+            del self._tat[key]
+
+    def clear(self) -> None:
+        self._tat.clear()
+
+    def __len__(self) -> int:
+        return len(self._tat)
+
+
+class DatabaseBuckets:
+    """Счётчики в ``login_throttle``; раз в минуту воркер удаляет полные корзины."""
+
+    last_sweep = 0.0
+
+    def __init__(self, repository: LoginThrottleRepository):
+        self.repository = repository
+
+    async def acquire(self, key: str, bucket: Bucket) -> float:
+        if time.monotonic() - DatabaseBuckets.last_sweep > SWEEP_INTERVAL_SECONDS:
+            DatabaseBuckets.last_sweep = time.monotonic()
+            await self.repository.delete_expired()
+        return await self.repository.acquire(
+            key, bucket.refill_seconds, bucket.tolerance
+        )
+
+
+class LoginLimiter:
+    def __init__(self, store: BucketStore, config: RateLimitConfig):
+        self.store = store
+        self.ip_bucket = Bucket(config.ip_burst, config.ip_refill_seconds)
+        self.email_bucket = Bucket(config.email_burst, config.email_refill_seconds)
+
+    async def check(self, client_ip: str | None, email: str) -> float:
+        """
+        Учитывает попытку входа. 0 — разрешена, иначе — через сколько
+        секунд можно повторить. Отклонённая по IP попытка не расходует
+        лимит email.
+        """
+        if client_ip is not None:
+            wait = await self.store.acquire(f"ip:{client_ip}", self.ip_bucket)
+            if wait > 0:
+                return wait
+        return await self.store.acquire(f"email:{email.lower()}", self.email_bucket)
+
+
+memory_buckets = MemoryBuckets(get_config().rate_limit.max_keys)
+
+
+async def get_login_limiter(
+    repository: LoginThrottleRepository = Depends(get_login_throttle_repository),
+) -> LoginLimiter | None:
+    """None — ограничение выключено."""
+    config = get_config().rate_limit
+    if not config.enabled:
+        return None
+    if config.backend == "database":
+        return LoginLimiter(DatabaseBuckets(repository), config)
+    return LoginLimiter(memory_buckets, config)
@@ -0,0 +1,56 @@
+"""
+Прозрачный пересчёт устаревших хэшей паролей.
+
+После успешного входа с хэшем другой схемы или старой стоимости
+(``needs_rehash``) пароль хэшируется заново в пуле потоков — цикл событий
+не блокируется на время хэширования, — и хэш сохраняется в фоне, после
+ответа клиенту. Запись условная: хэш заменяется, только если он не
+изменился с момента входа (пароль могли сменить параллельно).
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from uuid import UUID
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from auth.security import hash_password
+from core.database import get_sessionmaker
+from repositories.user import UserRepository
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordRehasher:
+    def __init__(self, session_factory: Callable[[], AsyncSession] | None = None):
+        self.session_factory = session_factory
+        # Пользователи с пересчётом в работе: повторный вход его не дублирует
+        self._pending: dict[UUID, asyncio.Task] = {}
+
+    def schedule(self, user_id: UUID, old_hash: str, password: str) -> None:
+        if user_id in self._pending:
+            return
+        task = asyncio.create_task(self._rehash(user_id, old_hash, password))
+        self._pending[user_id] = task
+        task.add_done_callback(lambda _: self._pending.pop(user_id, None))
+
+    async def drain(self) -> None:
+        """Дожидается начатых пересчётов (остановка воркера, тесты)."""
+        await asyncio.gather(*self._pending.values(), return_exceptions=True)
+
+    async def _rehash(self, user_id: UUID, old_hash: str, password: str) -> None:
+        new_hash = await asyncio.to_thread(hash_password, password)
+        session_factory = self.session_factory or get_sessionmaker()
+        try:
+            async with session_factory() as session:
+                await UserRepository(session).replace_password_hash(
+                    user_id, old_hash, new_hash
+                )
+        except (OSError, SQLAlchemyError) as exc:
+            # Не страшно: хэш пересчитается при следующем входе
+            logger.warning("password rehash failed for user %s: %r", user_id, exc)
+
+
+password_rehasher = PasswordRehasher()
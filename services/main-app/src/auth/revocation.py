@@ -0,0 +1,147 @@
+"""
+Индекс отзыва refresh-токенов в памяти воркера.
+
+Источник истины — таблица ``refresh_token``. В индексе — jti токенов,
+отозванных выходом или вместе с семейством при повторном использовании,
+со сроком действия. Такие refresh и logout отклоняются без запроса к БД;
+запись удаляется, когда срок истёк (дальше токен отклонит проверка
+``exp`` в JWT). Обменянных при ротации токенов в индексе нет: их
+повторное использование должно дойти до БД и отозвать семейство.
+
+Отзывы в других воркерах приходят через LISTEN/NOTIFY (``REVOKED_CHANNEL``).
+Уведомления, потерянные при обрыве соединения, и изменения в БД в обход
+приложения догоняет сверка: после каждого (пере)подключения и раз в
+``revocation_reconcile_seconds`` индекс дополняется отозванными токенами
+из БД.
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime
+
+from sqlalchemy import make_url
+from sqlalchemy.exc import SQLAlchemyError
+
+from core.config import get_config
+from core.database import get_sessionmaker
+from repositories.refresh_token import REVOKED_CHANNEL, RefreshTokenRepository
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationIndex:
+    def __init__(self):
+        self._revoked: dict[str, datetime] = {}
+
+    def is_revoked(self, jti: str) -> bool:
+        expires_at = self._revoked.get(jti)
+        if expires_at is None:
+            return False
+        if expires_at <= datetime.utcnow():
+            del self._revoked[jti]
+            return False
+        return True
+
+    def revoke(self, jti: str, expires_at: datetime) -> None:
+        if expires_at > datetime.utcnow():
+            self._revoked[jti] = expires_at
+
+    def reconcile(self, revoked: list[tuple[str, datetime]]) -> None:
+        """
+        Сверка с БД. Отзыв необратим, поэтому записи только добавляются:
+        уведомление, пришедшее во время запроса к БД, не теряется.
+        """
+        now = datetime.utcnow()
+        self._revoked = {
+            jti: expires_at
+            for jti, expires_at in self._revoked.items()
+            if expires_at > now
+        }
+        for jti, expires_at in revoked:
+            self._revoked[jti] = expires_at
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+
+revocation_index = RevocationIndex()
+
+
+class RevocationListener:
+    """
+    Фоновая задача воркера: слушает ``REVOKED_CHANNEL`` на отдельном
+    соединении asyncpg (не из пула) и периодически сверяет индекс с БД.
+    """
+
+    def __init__(
+        self,
+        index: RevocationIndex = revocation_index,
+        reconcile_seconds: float | None = None,
+    ):
+        self.index = index
+        self.reconcile_seconds = (
+            reconcile_seconds or get_config().auth.revocation_reconcile_seconds
+        )
+        # Установлено, пока LISTEN действует и индекс сверен с БД
+        self.listening = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        data = json.loads(payload)
+        self.index.revoke(data["jti"], datetime.fromisoformat(data["expires_at"]))
+
+    async def reconcile(self) -> None:
+        async with get_sessionmaker()() as session:
+            revoked = await RefreshTokenRepository(session).get_revoked()
+        self.index.reconcile(revoked)
+
+    async def _run(self) -> None:
+        import asyncpg
+
+        dsn = (
+            make_url(get_config().db.url)
+            .set(drivername="postgresql")
+            .render_as_string(hide_password=False)
+        )
+        delay = 1.0
+        while True:
+            connection = None
+            lost = asyncio.Event()
+            try:
+                connection = await asyncpg.connect(dsn)
+                connection.add_termination_listener(lambda _, lost=lost: lost.set())
+                await connection.add_listener(REVOKED_CHANNEL, self._on_notify)
+                # LISTEN уже действует: всё, что отозвано после этой сверки,
+                # придёт уведомлением
+                await self.reconcile()
+                self.listening.set()
+                delay = 1.0
+                while not lost.is_set():
+                    try:
+                        await asyncio.wait_for(lost.wait(), self.reconcile_seconds)
+                    except TimeoutError:
+                        await self.reconcile()
+            except (OSError, asyncpg.PostgresError, SQLAlchemyError) as exc:
+                logger.warning(
+                    "revocation listener failed, retrying in %.0fs: %r", delay, exc
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+            finally:
+                self.listening.clear()
+                if connection is not None:
+                    connection.terminate()
+
+
+revocation_listener = RevocationListener()
@@ -1,11 +1,63 @@
-from passlib.context import CryptContext
+from functools import cache
+from typing import TYPE_CHECKING
 
-pwd_context = CryptContext(schemes=["sha512_crypt"], deprecated="auto")
+from core.config import Config, PasswordConfig, get_config, on_reload
+
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+
+def scheme_options(config: PasswordConfig) -> dict:
+    """
+    Параметры схем для CryptContext. ``min_desired_rounds`` равен текущей
+    стоимости: хэш с меньшей стоимостью требует пересчёта.
+    """
+    options = {
+        "sha512_crypt": {
+            "sha512_crypt__default_rounds": config.sha512_crypt_rounds,
+            "sha512_crypt__min_desired_rounds": config.sha512_crypt_rounds,
+        },
+        "argon2": {
+            "argon2__time_cost": config.argon2_time_cost,
+            "argon2__memory_cost": config.argon2_memory_cost,
+            "argon2__parallelism": config.argon2_parallelism,
+        },
+    }
+    return {
+        name: value
+        for scheme in config.schemes
+        for name, value in options[scheme].items()
+    }
+
+
+def build_context(config: PasswordConfig) -> "CryptContext":
+    # passlib и схемы хэширования загружаются при первом хэше, а не при
+    # импорте приложения
+    from passlib.context import CryptContext
+
+    return CryptContext(
+        schemes=list(config.schemes), deprecated="auto", **scheme_options(config)
+    )
+
+
+@cache
+def get_pwd_context() -> "CryptContext":
+    return build_context(get_config().password)
+
+
+@on_reload
+def _apply_config(config: Config) -> None:
+    get_pwd_context.cache_clear()
 
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """Хэш другой схемы или с устаревшей стоимостью — пересчитать при входе."""
+    return get_pwd_context().needs_update(hashed_password)
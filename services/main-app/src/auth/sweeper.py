@@ -0,0 +1,116 @@
+"""
+Фоновое удаление истёкших refresh-токенов.
+
+Задача запускается в lifespan каждого воркера, но очистку выполняет
+только тот, кто взял advisory lock ``SWEEPER_LOCK_KEY``; остальные в этот
+раз пропускают. Блокировка сессионная и держится только на время
+очистки, поэтому соединение пула не занимается постоянно, а при падении
+воркера лидером в следующий раз станет другой.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from core.config import get_config
+from core.database import get_engine
+from repositories.refresh_token import RefreshTokenRepository
+
+logger = logging.getLogger(__name__)
+
+# Ключ pg_advisory_lock, общий для всех воркеров
+SWEEPER_LOCK_KEY = 7_401_113_502
+
+
+@dataclass(frozen=True, slots=True)
+class SweepResult:
+    purged: int
+    batches: int
+    duration_ms: float
+
+
+class TokenSweeper:
+    def __init__(
+        self,
+        engine: AsyncEngine | None = None,
+        interval: float | None = None,
+        batch_size: int | None = None,
+    ):
+        auth_config = get_config().auth
+        self.engine = engine
+        self.interval = interval or auth_config.sweep_interval_seconds
+        self.batch_size = batch_size or auth_config.sweep_batch_size
+        self.last_result: SweepResult | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def sweep(self) -> SweepResult | None:
+        """
+        Один проход, если удалось стать лидером; иначе ``None``. Каждая
+        пачка — отдельная короткая транзакция.
+        """
+        engine = self.engine or get_engine()
+        async with engine.connect() as connection:
+            locked = await connection.scalar(
+                select(func.pg_try_advisory_lock(SWEEPER_LOCK_KEY))
+            )
+            await connection.commit()
+            if not locked:
+                return None
+
+            started = time.perf_counter()
+            purged = batches = 0
+            try:
+                async with AsyncSession(bind=connection) as session:
+                    repository = RefreshTokenRepository(session)
+                    while True:
+                        deleted = await repository.delete_expired(self.batch_size)
+                        purged += deleted
+                        batches += 1
+                        if deleted < self.batch_size:
+                            break
+            finally:
+                await connection.scalar(
+                    select(func.pg_advisory_unlock(SWEEPER_LOCK_KEY))
+                )
+                await connection.commit()
+
+        self.last_result = SweepResult(
+            purged=purged,
+            batches=batches,
+            duration_ms=(time.perf_counter() - started) * 1000,
+        )
+        return self.last_result
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                result = await self.sweep()
+            except (OSError, SQLAlchemyError) as exc:
+                logger.warning("refresh token sweep failed: %r", exc)
+                continue
+            if result is not None:
+                logger.info(
+                    "refresh token sweep: purged %d rows in %d batches, %.1f ms",
+                    result.purged,
+                    result.batches,
+                    result.duration_ms,
+                )
+
+
+token_sweeper = TokenSweeper()
@@ -0,0 +1,174 @@
+"""
+Подбор стоимости хэширования паролей под целевое время проверки.
+
+Пример (из services/main-app, на железе, где будет работать приложение):
+
+    PYTHONPATH=src python -m cli.calibrate_hashing --target-ms 250
+
+Для каждой доступной схемы замеряется время проверки пароля и
+подбирается наибольшая стоимость, укладывающаяся в цель. В конце
+печатается секция ``[password_settings]`` для settings.toml. Схемы без
+установленного backend (argon2-cffi) пропускаются.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from core.config import PASSWORD_SCHEMES, get_config
+
+PASSWORD = "calibration-Pa55word!"
+
+
+@dataclass(frozen=True, slots=True)
+class Calibration:
+    scheme: str
+    # Параметры для settings.toml (ключ password_settings -> значение)
+    settings: dict[str, int]
+    verify_ms: float
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    config = get_config().password
+    parser = argparse.ArgumentParser(prog="python -m cli.calibrate_hashing")
+    parser.add_argument(
+        "--target-ms",
+        type=float,
+        default=config.target_ms,
+        help="Целевое время одной проверки пароля, мс",
+    )
+    parser.add_argument(
+        "--schemes",
+        nargs="+",
+        choices=PASSWORD_SCHEMES,
+        default=list(PASSWORD_SCHEMES),
+    )
+    parser.add_argument(
+        "--samples", type=int, default=5, help="Замеров на каждую точку"
+    )
+    return parser.parse_args(argv)
+
+
+def measure(handler, samples: int) -> float:
+    """Медиана времени проверки пароля, мс."""
+    hashed = handler.hash(PASSWORD)
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        handler.verify(PASSWORD, hashed)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def fit_linear(
+    make: Callable[[int], object], low: int, high: int, target_ms: float, samples: int
+) -> tuple[int, float]:
+    """
+    Для схем, где время растёт линейно с параметром: оценка по замеру в
+    ``low``, затем уменьшение, пока замер не уложится в цель.
+    """
+    base = measure(make(low), samples)
+    cost = max(low, min(high, int(low * target_ms / base)))
+    elapsed = measure(make(cost), samples)
+    while elapsed > target_ms and cost > low:
+        cost = max(low, int(cost * target_ms / elapsed * 0.95))
+        elapsed = measure(make(cost), samples)
+    return cost, elapsed
+
+
+def calibrate_sha512_crypt(target_ms: float, samples: int) -> Calibration:
+    from passlib.hash import sha512_crypt
+
+    rounds, elapsed = fit_linear(
+        lambda rounds: sha512_crypt.using(rounds=rounds),
+        10_000,
+        999_999_999,
+        target_ms,
+        samples,
+    )
+    return Calibration("sha512_crypt", {"sha512_crypt_rounds": rounds}, elapsed)
+
+
+def calibrate_argon2(target_ms: float, samples: int) -> Calibration:
+    from passlib.hash import argon2
+
+    config = get_config().password
+    memory_cost = config.argon2_memory_cost
+    parallelism = config.argon2_parallelism
+
+    def make(time_cost: int, memory: int):
+        return argon2.using(
+            time_cost=time_cost, memory_cost=memory, parallelism=parallelism
+        )
+
+    # Память — главная защита argon2: уменьшается, только если даже
+    # time_cost = 1 не укладывается в цель
+    while (
+        memory_cost > 8 * parallelism and measure(make(1, memory_cost), 1) > target_ms
+    ):
+        memory_cost //= 2
+    time_cost, elapsed = fit_linear(
+        lambda cost: make(cost, memory_cost), 1, 64, target_ms, samples
+    )
+    return Calibration(
+        "argon2",
+        {
+            "argon2_time_cost": time_cost,
+            "argon2_memory_cost": memory_cost,
+            "argon2_parallelism": parallelism,
+        },
+        elapsed,
+    )
+
+
+CALIBRATORS = {
+    "argon2": calibrate_argon2,
+    "sha512_crypt": calibrate_sha512_crypt,
+}
+
+
+def backend_available(scheme: str) -> bool:
+    from passlib import hash as handlers
+    from passlib.exc import MissingBackendError
+
+    handler = getattr(handlers, scheme)
+    try:
+        return handler.has_backend()
+    except (MissingBackendError, ValueError):
+        # ValueError — backend установлен, но несовместим с passlib
+        return False
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    results = []
+    for scheme in args.schemes:
+        if not backend_available(scheme):
+            print(f"{scheme}: backend is not installed, skipped", file=sys.stderr)
+            continue
+        result = CALIBRATORS[scheme](args.target_ms, args.samples)
+        results.append(result)
+        params = ", ".join(f"{key}={value}" for key, value in result.settings.items())
+        print(f"{scheme}: {params} -> {result.verify_ms:.1f} ms per verification")
+
+    if not results:
+        print("no password hashing backend available", file=sys.stderr)
+        return 1
+
+    # Предпочтение — argon2 (порядок PASSWORD_SCHEMES)
+    best = results[0]
+    current = get_config().password.schemes
+    # Прежние схемы остаются в списке: их хэши проверяются и пересчитываются
+    schemes = [best.scheme, *(scheme for scheme in current if scheme != best.scheme)]
+    print(f"\n# target {args.target_ms:g} ms\n[password_settings]")
+    print("schemes = [" + ", ".join(f'"{scheme}"' for scheme in schemes) + "]")
+    for key, value in best.settings.items():
+        print(f"{key} = {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
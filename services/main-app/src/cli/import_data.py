@@ -0,0 +1,150 @@
+"""
+Импорт NDJSON/CSV (формат выгрузки доски) напрямую в БД.
+
+Пример (из services/main-app):
+
+    PYTHONPATH=src python -m cli.import_data tracker.ndjson.gz \\
+        --checkpoint tracker.checkpoint.json
+
+После каждой закоммиченной пачки номер последней записи пишется в
+checkpoint-файл. Запуск с тем же checkpoint продолжает с места остановки;
+после успешного импорта файл удаляется.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from core.compression import gunzip_stream
+from core.config import get_config
+from enums.export_format import ExportFormat
+from repositories.bulk_import import ImportRepository
+from schemas.bulk_import import ImportSummary
+from services.bulk_import import IMPORT_CHUNK_SIZE, ImportService
+
+READ_SIZE = 1024 * 1024
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m cli.import_data")
+    parser.add_argument("path", type=Path, help="Файл .ndjson/.csv, можно .gz")
+    parser.add_argument(
+        "--format",
+        choices=[item.value for item in ExportFormat],
+        help="Формат файла (по умолчанию — по расширению)",
+    )
+    parser.add_argument("--db-url", help="URL БД (по умолчанию из settings.toml)")
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        help="Файл прогресса для продолжения прерванного импорта",
+    )
+    parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+    return parser.parse_args(argv)
+
+
+def detect_format(path: Path) -> ExportFormat:
+    suffixes = [suffix.lower() for suffix in path.suffixes if suffix.lower() != ".gz"]
+    if suffixes and suffixes[-1] == ".csv":
+        return ExportFormat.CSV
+    return ExportFormat.NDJSON
+
+
+async def read_file(path: Path) -> AsyncIterator[bytes]:
+    with path.open("rb") as file:
+        while chunk := file.read(READ_SIZE):
+            yield chunk
+            # Отдаём управление event loop между чтениями
+            await asyncio.sleep(0)
+
+
+def load_checkpoint(checkpoint: Path | None, source: Path) -> int:
+    if checkpoint is None or not checkpoint.exists():
+        return 0
+
+    state = json.loads(checkpoint.read_text())
+    if state.get("source") != str(source.resolve()):
+        raise SystemExit(f"{checkpoint} относится к другому файлу: {state['source']}")
+    return state["records"]
+
+
+def save_checkpoint(checkpoint: Path, source: Path, summary: ImportSummary) -> None:
+    state = {"source": str(source.resolve()), "records": summary.records}
+    # Запись через временный файл: checkpoint не бывает наполовину записан
+    tmp = checkpoint.with_suffix(checkpoint.suffix + ".tmp")
+    tmp.write_text(json.dumps(state))
+    os.replace(tmp, checkpoint)
+
+
+async def main(args: argparse.Namespace) -> ImportSummary:
+    import_format = (
+        ExportFormat(args.format) if args.format else detect_format(args.path)
+    )
+    skip = load_checkpoint(args.checkpoint, args.path)
+    if skip:
+        print(f"Продолжаем после записи {skip:,}")
+
+    started = time.perf_counter()
+
+    def progress(summary: ImportSummary) -> None:
+        if args.checkpoint:
+            save_checkpoint(args.checkpoint, args.path, summary)
+        elapsed = time.perf_counter() - started
+        done = summary.records - skip
+        rate = done / elapsed if elapsed else 0
+        inserted = sum(table.inserted for table in summary.tables.values())
+        print(
+            f"{summary.records:>12,} records {inserted:>12,} inserted "
+            f"{summary.invalid:>8,} invalid {rate:>10,.0f} records/s",
+            flush=True,
+        )
+
+    chunks = read_file(args.path)
+    if args.path.suffix.lower() == ".gz":
+        chunks = gunzip_stream(chunks)
+
+    engine = create_async_engine(args.db_url or get_config().db.url)
+    try:
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            service = ImportService(ImportRepository(session))
+            summary = await service.import_stream(
+                chunks,
+                import_format,
+                skip=skip,
+                progress=progress,
+                chunk_size=args.chunk_size,
+            )
+    finally:
+        await engine.dispose()
+
+    if args.checkpoint:
+        args.checkpoint.unlink(missing_ok=True)
+    return summary
+
+
+def cli(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    summary = asyncio.run(main(args))
+
+    for kind, table in summary.tables.items():
+        print(
+            f"{kind:<12} {table.staged:>12,} staged {table.inserted:>12,} inserted "
+            f"{table.skipped:>10,} skipped"
+        )
+    for error in summary.errors:
+        print(f"record {error.record}: {error.error}", file=sys.stderr)
+    if summary.invalid > len(summary.errors):
+        print(f"... всего невалидных записей: {summary.invalid:,}", file=sys.stderr)
+
+    return 1 if summary.invalid else 0
+
+
+if __name__ == "__main__":
+    sys.exit(cli())
@@ -0,0 +1,39 @@
+from collections.abc import AsyncIterable, Iterable, Sequence
+
+from sqlalchemy import Table, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+
+async def copy_records(
+    connection: AsyncConnection,
+    table: Table | str,
+    columns: Sequence[str],
+    records: Iterable[tuple] | AsyncIterable[tuple],
+) -> int:
+    """
+    Загружает строки через COPY (asyncpg ``copy_records_to_table``).
+
+    ``records`` читается потоково, поэтому можно передавать генератор на
+    миллионы строк. COPY выполняется в текущей транзакции ``connection``.
+    Возвращает количество загруженных строк.
+    """
+    # Диалект asyncpg открывает транзакцию лениво, на первом запросе. Без этого
+    # COPY через «сырое» соединение закоммитится сам по себе.
+    await connection.execute(text("SELECT 1"))
+
+    raw = await connection.get_raw_connection()
+    driver_connection = raw.driver_connection
+
+    if isinstance(table, Table):
+        table_name, schema_name = table.name, table.schema
+    else:
+        table_name, schema_name = table, None
+
+    status = await driver_connection.copy_records_to_table(
+        table_name,
+        records=records,
+        columns=list(columns),
+        schema_name=schema_name,
+    )
+    # asyncpg возвращает статус вида "COPY 1000"
+    return int(status.split()[-1])
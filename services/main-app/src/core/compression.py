@@ -0,0 +1,126 @@
+import gzip
+import zlib
+from collections import OrderedDict
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from importlib.util import find_spec
+
+GZIP_LEVEL = 6
+
+
+def accepts_encoding(accept_encoding: str | None, encoding: str) -> bool:
+    """Разрешает ли заголовок Accept-Encoding кодировку ``encoding`` (q > 0)."""
+    if not accept_encoding:
+        return False
+
+    for item in accept_encoding.split(","):
+        name, *params = (part.strip() for part in item.split(";"))
+        if name.lower() not in (encoding, "*"):
+            continue
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        return quality > 0
+
+    return False
+
+
+async def gzip_stream(
+    chunks: AsyncIterable[bytes], level: int = GZIP_LEVEL
+) -> AsyncIterator[bytes]:
+    """Сжимает поток чанков в gzip на лету, не буферизуя его целиком."""
+    # wbits=31 — формат gzip (заголовок и CRC), а не «голый» deflate
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    async for chunk in chunks:
+        if data := compressor.compress(chunk):
+            yield data
+    yield compressor.flush()
+
+
+async def gunzip_stream(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Распаковывает gzip-поток по мере поступления чанков."""
+    decompressor = zlib.decompressobj(31)
+    async for chunk in chunks:
+        if data := decompressor.decompress(chunk):
+            yield data
+    if data := decompressor.flush():
+        yield data
+
+
+def _gzip(data: bytes, level: int) -> bytes:
+    # mtime=0: одинаковое тело — одинаковые байты, это важно для кэша
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+# brotli и zstandard необязательны и импортируются при первом сжатии
+def _brotli(data: bytes, level: int) -> bytes:
+    import brotli
+
+    return brotli.compress(data, quality=level)
+
+
+def _zstd(data: bytes, level: int) -> bytes:
+    import zstandard
+
+    return zstandard.ZstdCompressor(level=level).compress(data)
+
+
+# Кодировки, доступные в этом окружении. brotli и zstd — только если
+# установлены соответствующие пакеты.
+COMPRESSORS: dict[str, Callable[[bytes, int], bytes]] = {"gzip": _gzip}
+if find_spec("brotli") is not None:
+    COMPRESSORS["br"] = _brotli
+if find_spec("zstandard") is not None:
+    COMPRESSORS["zstd"] = _zstd
+
+
+def choose_encoding(
+    accept_encoding: str | None, preferred: list[str] | tuple[str, ...]
+) -> str | None:
+    """
+    Первая из ``preferred`` кодировок, которую принимает клиент и которая
+    доступна в окружении. ``None`` — отдавать без сжатия.
+    """
+    for encoding in preferred:
+        if encoding in COMPRESSORS and accepts_encoding(accept_encoding, encoding):
+            return encoding
+    return None
+
+
+def compress(data: bytes, encoding: str, level: int) -> bytes:
+    return COMPRESSORS[encoding](data, level)
+
+
+class PrecompressedCache:
+    """
+    LRU-кэш сжатых тел по ключу (ETag, кодировка).
+
+    ETag вычисляется из содержимого, поэтому одна версия ответа сжимается
+    один раз, а последующие запросы получают готовые байты.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+
+    def get(self, etag: str, encoding: str, body: bytes, level: int) -> bytes:
+        key = (etag, encoding)
+        if (compressed := self._entries.get(key)) is not None:
+            self._entries.move_to_end(key)
+            return compressed
+
+        compressed = compress(body, encoding, level)
+        self._entries[key] = compressed
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return compressed
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,43 +1,540 @@
-from pathlib import Path
+"""
+Конфигурация приложения.
+
+Настройки читаются один раз (settings.toml, .env и переменные окружения
+через Dynaconf), проверяются и замораживаются в ``Config`` — дереве
+неизменяемых dataclass со слотами. Горячие пути читают обычные атрибуты
+без динамического поиска Dynaconf:
+
+    from core.config import get_config
+
+    get_config().auth.secret_key
 
-from dynaconf import Dynaconf
+``reload_config()`` перечитывает источники и вызывает хуки ``on_reload``.
+Пул соединений и middleware создаются один раз при старте — изменения
+их настроек вступают в силу после перезапуска.
+"""
+
+import ipaddress
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 SETTINGS_FILE = BASE_DIR / "settings.toml"
 
-settings = Dynaconf(
-    settings_files=[str(SETTINGS_FILE), ".env"],
-    envvar_prefix=False,
-)
+SYMMETRIC_ALGORITHMS = ("HS256", "HS384", "HS512")
+SUPPORTED_ALGORITHMS = (*SYMMETRIC_ALGORITHMS, "RS256")
+COMPRESSION_LEVELS = {"gzip": (1, 9), "br": (0, 11), "zstd": (1, 22)}
+RATE_LIMIT_BACKENDS = ("memory", "database")
+PASSWORD_SCHEMES = ("argon2", "sha512_crypt")
+# passlib 1.7.4 не работает с пакетом bcrypt >= 4.1 (первый хэш падает
+# с ValueError), а в зависимостях bcrypt 5
+UNSUPPORTED_PASSWORD_SCHEMES = {
+    "bcrypt": "passlib 1.7.4 is incompatible with the installed bcrypt >= 4.1"
+}
+
+
+class ConfigError(ValueError):
+    """Настройки не прошли проверку; в сообщении — все найденные ошибки."""
+
+    def __init__(self, errors: list[str]):
+        self.errors = errors
+        super().__init__(
+            "Invalid settings:\n" + "\n".join(f"  - {error}" for error in errors)
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class AppConfig:
+    name: str
+    version: str
+    host: str = "0.0.0.0"
+    port: int = 8000
 
 
+@dataclass(frozen=True, slots=True)
 class DatabaseConfig:
+    db_name: str
+    db_user: str
+    db_password: str
+    db_host: str
+    db_port: int
+    # Полный URL вместо отдельных полей (DB_SETTINGS__URL)
+    url: str = ""
+    echo: bool = False
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = -1
+    pool_pre_ping: bool = False
+    # Скомпилированных запросов в кэше SQLAlchemy на движок
+    query_cache_size: int = 500
+    # Prepared statements asyncpg на соединение (0 — не кэшировать)
+    prepared_statement_cache_size: int = 100
+
+    def __post_init__(self):
+        if not self.url:
+            url = (
+                f"postgresql+asyncpg://{self.db_user}:{self.db_password}"
+                f"@{self.db_host}:{self.db_port}/{self.db_name}"
+            )
+            object.__setattr__(self, "url", url)
+
+
+@dataclass(frozen=True, slots=True)
+class AuthConfig:
+    secret_key: str
+    algorithm: str
+    access_token_expire_minutes: int
+    refresh_token_expire_days: int = 30
+    # Как часто индекс отзыва refresh-токенов сверяется с БД
+    revocation_reconcile_seconds: float = 60.0
+    # Повторный обмен токена в течение этого окна — параллельный запрос
+    # (другая вкладка), а не кража
+    rotation_grace_seconds: float = 10.0
+    # Фоновое удаление истёкших refresh-токенов
+    sweep_interval_seconds: float = 3600.0
+    sweep_batch_size: int = 1000
+    # RS256: токены выпускает auth-service (issuer_url), открытые ключи
+    # берутся из его JWKS (jwks_url). Пустые URL — локальная замена
+    # auth-service с ключом private_key_path (разработка и тесты)
+    issuer_url: str = ""
+    jwks_url: str = ""
+    # HTTP Basic для POST issuer_url: клиент из clients_settings auth-service
+    issuer_client_id: str = "main_app"
+    issuer_client_secret: str = ""
+    private_key_path: str = ".keys/signing-key.pem"
+    jwks_refresh_seconds: float = 300.0
+    # Не чаще раза в столько секунд JWKS перечитывается из-за неизвестного kid
+    jwks_min_refresh_seconds: float = 30.0
+    issuer_timeout: float = 5.0
+    # Команды пользователя в access-токене (claims mep/teams); при большем
+    # числе команд токен выпускается без них и членство читается из БД
+    embed_memberships: bool = True
+    max_embedded_teams: int = 50
+
     @property
-    def url(self) -> str:
-        db = settings.db_settings
-        return (
-            f"postgresql+asyncpg://{db.db_user}:{db.db_password}"
-            f"@{db.db_host}:{db.db_port}/{db.db_name}"
+    def symmetric(self) -> bool:
+        return self.algorithm in SYMMETRIC_ALGORITHMS
+
+
+@dataclass(frozen=True, slots=True)
+class CompressionConfig:
+    minimum_size: int = 1024
+    encodings: tuple[str, ...] = ("gzip",)
+    content_types: tuple[str, ...] = ("application/json",)
+    cache_entries: int = 256
+    levels: dict[str, int] = field(
+        default_factory=lambda: {"gzip": 6, "br": 4, "zstd": 3}
+    )
+
+    def level(self, encoding: str) -> int:
+        return self.levels[encoding]
+
+
+@dataclass(frozen=True, slots=True)
+class ServerConfig:
+    # 0 — по числу доступных процессу ядер
+    workers: int = 0
+    # 0 — воркеры не перезапускаются
+    max_requests: int = 0
+    max_requests_jitter: int = 0
+    graceful_timeout: int = 30
+    keep_alive: int = 5
+    preload: bool = True
+    # Прокси, которым uvicorn доверяет X-Forwarded-For / X-Forwarded-Proto:
+    # адреса и сети, "*" — любой адрес. От остальных заголовки игнорируются
+    forwarded_allow_ips: tuple[str, ...] = ("127.0.0.1",)
+
+
+@dataclass(frozen=True, slots=True)
+class HealthConfig:
+    # Результат проверки БД переиспользуется столько секунд
+    ping_ttl: float = 1.0
+    ping_timeout: float = 2.0
+    # Доля занятых соединений (pool_size + max_overflow), выше — не готов
+    max_pool_usage: float = 0.9
+    max_loop_lag: float = 0.5
+    loop_lag_interval: float = 0.5
+    check_migrations: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitConfig:
+    enabled: bool = True
+    # memory — счётчики в памяти каждого воркера; database — общие для
+    # всех воркеров (таблица login_throttle)
+    backend: str = "memory"
+    # Попыток подряд и секунд на восстановление одной попытки
+    ip_burst: int = 30
+    ip_refill_seconds: float = 2.0
+    email_burst: int = 10
+    email_refill_seconds: float = 30.0
+    # Предел ключей в памяти воркера
+    max_keys: int = 100_000
+
+
+@dataclass(frozen=True, slots=True)
+class PasswordConfig:
+    # Первая схема — для новых хэшей; остальные только проверяются, и при
+    # входе такой хэш заменяется хэшем первой схемы
+    schemes: tuple[str, ...] = ("sha512_crypt",)
+    # Стоимость схем. Хэш с меньшей стоимостью (или с другими параметрами
+    # argon2) тоже пересчитывается при входе
+    sha512_crypt_rounds: int = 656_000
+    argon2_time_cost: int = 3
+    # КиБ
+    argon2_memory_cost: int = 65_536
+    argon2_parallelism: int = 4
+    # Цель калибровки (python -m cli.calibrate_hashing): время одной
+    # проверки пароля, мс
+    target_ms: float = 250.0
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    app: AppConfig
+    db: DatabaseConfig
+    auth: AuthConfig
+    compression: CompressionConfig
+    server: ServerConfig = field(default_factory=ServerConfig)
+    health: HealthConfig = field(default_factory=HealthConfig)
+    rate_limit: RateLimitConfig = field(default_factory=RateLimitConfig)
+    password: PasswordConfig = field(default_factory=PasswordConfig)
+
+
+_MISSING = object()
+
+
+class _Section:
+    """Чтение секции с проверкой типов; ошибки копятся в общий список."""
+
+    def __init__(self, raw: Any, name: str, errors: list[str]):
+        self.name = name
+        self.errors = errors
+        self.values = raw.get(name) or {}
+        if not hasattr(self.values, "get"):
+            errors.append(f"{name}: expected a table, got {self.values!r}")
+            self.values = {}
+
+    def get(self, key: str, kind: type, default: Any = _MISSING) -> Any:
+        value = self.values.get(key, _MISSING)
+        if value is _MISSING:
+            if default is _MISSING:
+                self.errors.append(f"{self.name}.{key}: required")
+            return default
+
+        if kind is float and isinstance(value, int) and not isinstance(value, bool):
+            return float(value)
+        if (
+            kind is str
+            and isinstance(value, int | float)
+            and not isinstance(value, bool)
+        ):
+            # Переменные окружения Dynaconf парсит как TOML: "123" -> 123
+            return str(value)
+        if kind is int and isinstance(value, bool) or not isinstance(value, kind):
+            self.errors.append(
+                f"{self.name}.{key}: expected {kind.__name__}, got {value!r}"
+            )
+            return default if default is not _MISSING else kind()
+        return value
+
+    def get_strings(self, key: str, default: tuple[str, ...]) -> tuple[str, ...]:
+        values = self.get(key, list, list(default))
+        if not all(isinstance(value, str) for value in values):
+            self.errors.append(f"{self.name}.{key}: expected a list of strings")
+            return default
+        return tuple(values)
+
+
+def _load_sources(settings_file: Path):
+    # Dynaconf импортируется только при загрузке, а не при импорте модуля
+    from dynaconf import Dynaconf
+
+    return Dynaconf(
+        settings_files=[str(settings_file)],
+        envvar_prefix=False,
+        # .env подмешивается в окружение; из форматов файлов нужен только
+        # TOML — Dynaconf не перебирает загрузчики YAML/INI/JSON/py
+        load_dotenv=True,
+        core_loaders=["TOML"],
+    )
+
+
+def load_config(settings_file: Path = SETTINGS_FILE) -> Config:
+    """Читает и проверяет настройки. Ошибки — ``ConfigError`` со списком."""
+    raw = _load_sources(settings_file)
+    errors: list[str] = []
+
+    app = _Section(raw, "app_settings", errors)
+    app_config = AppConfig(
+        name=app.get("app_name", str, "main-app"),
+        version=app.get("app_version", str, "0.0.0"),
+        host=app.get("app_host", str, "0.0.0.0"),
+        port=app.get("app_port", int, 8000),
+    )
+
+    db = _Section(raw, "db_settings", errors)
+    url = db.get("url", str, "")
+    # Части URL нужны, только если полный URL не задан
+    part_default = "" if url else _MISSING
+    db_config = DatabaseConfig(
+        db_name=db.get("db_name", str, part_default),
+        db_user=db.get("db_user", str, part_default),
+        db_password=db.get("db_password", str, part_default),
+        db_host=db.get("db_host", str, part_default),
+        db_port=db.get("db_port", int, 0 if url else _MISSING),
+        url=url,
+        echo=db.get("echo", bool, False),
+        pool_size=db.get("pool_size", int, 5),
+        max_overflow=db.get("max_overflow", int, 10),
+        pool_timeout=db.get("pool_timeout", float, 30.0),
+        pool_recycle=db.get("pool_recycle", int, -1),
+        pool_pre_ping=db.get("pool_pre_ping", bool, False),
+        query_cache_size=db.get("query_cache_size", int, 500),
+        prepared_statement_cache_size=db.get("prepared_statement_cache_size", int, 100),
+    )
+    if db_config.pool_size < 1:
+        errors.append("db_settings.pool_size: must be >= 1")
+    if db_config.max_overflow < 0:
+        errors.append("db_settings.max_overflow: must be >= 0")
+    if db_config.query_cache_size < 0:
+        errors.append("db_settings.query_cache_size: must be >= 0")
+    if db_config.prepared_statement_cache_size < 0:
+        errors.append("db_settings.prepared_statement_cache_size: must be >= 0")
+
+    auth = _Section(raw, "auth_settings", errors)
+    auth_config = AuthConfig(
+        secret_key=auth.get("sekret_key", str, ""),
+        algorithm=auth.get("algorithm", str, "HS256"),
+        access_token_expire_minutes=auth.get("access_token_expire_minutes", int),
+        refresh_token_expire_days=auth.get("refresh_token_expire_days", int, 30),
+        revocation_reconcile_seconds=auth.get(
+            "revocation_reconcile_seconds", float, 60.0
+        ),
+        rotation_grace_seconds=auth.get("rotation_grace_seconds", float, 10.0),
+        sweep_interval_seconds=auth.get("sweep_interval_seconds", float, 3600.0),
+        sweep_batch_size=auth.get("sweep_batch_size", int, 1000),
+        issuer_url=auth.get("issuer_url", str, ""),
+        jwks_url=auth.get("jwks_url", str, ""),
+        issuer_client_id=auth.get("issuer_client_id", str, "main_app"),
+        issuer_client_secret=auth.get("issuer_client_secret", str, ""),
+        private_key_path=auth.get("private_key_path", str, ".keys/signing-key.pem"),
+        jwks_refresh_seconds=auth.get("jwks_refresh_seconds", float, 300.0),
+        jwks_min_refresh_seconds=auth.get("jwks_min_refresh_seconds", float, 30.0),
+        issuer_timeout=auth.get("issuer_timeout", float, 5.0),
+        embed_memberships=auth.get("embed_memberships", bool, True),
+        max_embedded_teams=auth.get("max_embedded_teams", int, 50),
+    )
+    if auth_config.sweep_batch_size < 1:
+        errors.append("auth_settings.sweep_batch_size: must be >= 1")
+    if auth_config.max_embedded_teams < 0:
+        errors.append("auth_settings.max_embedded_teams: must be >= 0")
+    if auth_config.symmetric and auth_config.secret_key == "":
+        errors.append("auth_settings.sekret_key: must not be empty")
+    if auth_config.issuer_url and not auth_config.jwks_url:
+        errors.append("auth_settings.jwks_url: required when issuer_url is set")
+    if auth_config.issuer_url and not auth_config.issuer_client_secret:
+        errors.append(
+            "auth_settings.issuer_client_secret: required when issuer_url is set"
+        )
+    if (auth_config.issuer_url or auth_config.jwks_url) and auth_config.symmetric:
+        errors.append(
+            "auth_settings.algorithm: auth-service tokens need an asymmetric algorithm"
+        )
+    for key in ("jwks_refresh_seconds", "issuer_timeout"):
+        if getattr(auth_config, key) <= 0:
+            errors.append(f"auth_settings.{key}: must be > 0")
+    if auth_config.algorithm not in SUPPORTED_ALGORITHMS:
+        errors.append(
+            f"auth_settings.algorithm: {auth_config.algorithm!r} is not one of "
+            f"{', '.join(SUPPORTED_ALGORITHMS)}"
         )
 
+    compression = _Section(raw, "compression_settings", errors)
+    levels = {
+        "gzip": compression.get("gzip_level", int, 6),
+        "br": compression.get("brotli_level", int, 4),
+        "zstd": compression.get("zstd_level", int, 3),
+    }
+    compression_config = CompressionConfig(
+        minimum_size=compression.get("minimum_size", int, 1024),
+        encodings=compression.get_strings("encodings", ("gzip",)),
+        content_types=compression.get_strings("content_types", ("application/json",)),
+        cache_entries=compression.get("cache_entries", int, 256),
+        levels=levels,
+    )
+    for encoding in compression_config.encodings:
+        if encoding not in COMPRESSION_LEVELS:
+            errors.append(f"compression_settings.encodings: unknown {encoding!r}")
+    for encoding, level in levels.items():
+        low, high = COMPRESSION_LEVELS[encoding]
+        if not low <= level <= high:
+            errors.append(
+                f"compression_settings: {encoding} level {level} is outside "
+                f"{low}..{high}"
+            )
 
-class AuthSettings:
-    @property
-    def secret_key(self) -> str:
-        return settings.auth_settings.sekret_key
+    server = _Section(raw, "server_settings", errors)
+    server_config = ServerConfig(
+        workers=server.get("workers", int, 0),
+        max_requests=server.get("max_requests", int, 0),
+        max_requests_jitter=server.get("max_requests_jitter", int, 0),
+        graceful_timeout=server.get("graceful_timeout", int, 30),
+        keep_alive=server.get("keep_alive", int, 5),
+        preload=server.get("preload", bool, True),
+        forwarded_allow_ips=server.get_strings("forwarded_allow_ips", ("127.0.0.1",)),
+    )
+    for address in server_config.forwarded_allow_ips:
+        if address == "*":
+            continue
+        try:
+            ipaddress.ip_network(address, strict=False)
+        except ValueError:
+            errors.append(
+                f"server_settings.forwarded_allow_ips: {address!r} is not "
+                "an IP address or network"
+            )
+    for key in (
+        "workers",
+        "max_requests",
+        "max_requests_jitter",
+        "graceful_timeout",
+        "keep_alive",
+    ):
+        if getattr(server_config, key) < 0:
+            errors.append(f"server_settings.{key}: must be >= 0")
 
-    @property
-    def algorithm(self) -> str:
-        return settings.auth_settings.algorithm
+    health = _Section(raw, "health_settings", errors)
+    health_config = HealthConfig(
+        ping_ttl=health.get("ping_ttl", float, 1.0),
+        ping_timeout=health.get("ping_timeout", float, 2.0),
+        max_pool_usage=health.get("max_pool_usage", float, 0.9),
+        max_loop_lag=health.get("max_loop_lag", float, 0.5),
+        loop_lag_interval=health.get("loop_lag_interval", float, 0.5),
+        check_migrations=health.get("check_migrations", bool, True),
+    )
+    if not 0 < health_config.max_pool_usage <= 1:
+        errors.append("health_settings.max_pool_usage: must be in (0, 1]")
+    for key in ("ping_timeout", "loop_lag_interval"):
+        if getattr(health_config, key) <= 0:
+            errors.append(f"health_settings.{key}: must be > 0")
 
-    @property
-    def access_token_expire_minutes(self) -> int:
-        return settings.auth_settings.access_token_expire_minutes
+    rate_limit = _Section(raw, "rate_limit_settings", errors)
+    rate_limit_config = RateLimitConfig(
+        enabled=rate_limit.get("enabled", bool, True),
+        backend=rate_limit.get("backend", str, "memory"),
+        ip_burst=rate_limit.get("ip_burst", int, 30),
+        ip_refill_seconds=rate_limit.get("ip_refill_seconds", float, 2.0),
+        email_burst=rate_limit.get("email_burst", int, 10),
+        email_refill_seconds=rate_limit.get("email_refill_seconds", float, 30.0),
+        max_keys=rate_limit.get("max_keys", int, 100_000),
+    )
+    if rate_limit_config.backend not in RATE_LIMIT_BACKENDS:
+        errors.append(
+            f"rate_limit_settings.backend: {rate_limit_config.backend!r} is not "
+            f"one of {', '.join(RATE_LIMIT_BACKENDS)}"
+        )
+    for key in ("ip_burst", "email_burst", "max_keys"):
+        if getattr(rate_limit_config, key) < 1:
+            errors.append(f"rate_limit_settings.{key}: must be >= 1")
+    for key in ("ip_refill_seconds", "email_refill_seconds"):
+        if getattr(rate_limit_config, key) <= 0:
+            errors.append(f"rate_limit_settings.{key}: must be > 0")
 
-    @property
-    def refresh_token_expire_days(self) -> int:
-        return settings.auth_settings.get("refresh_token_expire_days", 30)
+    password = _Section(raw, "password_settings", errors)
+    password_config = PasswordConfig(
+        schemes=password.get_strings("schemes", ("sha512_crypt",)),
+        sha512_crypt_rounds=password.get("sha512_crypt_rounds", int, 656_000),
+        argon2_time_cost=password.get("argon2_time_cost", int, 3),
+        argon2_memory_cost=password.get("argon2_memory_cost", int, 65_536),
+        argon2_parallelism=password.get("argon2_parallelism", int, 4),
+        target_ms=password.get("target_ms", float, 250.0),
+    )
+    if not password_config.schemes:
+        errors.append("password_settings.schemes: must not be empty")
+    for scheme in password_config.schemes:
+        if scheme in UNSUPPORTED_PASSWORD_SCHEMES:
+            errors.append(
+                f"password_settings.schemes: {scheme!r} is not supported: "
+                f"{UNSUPPORTED_PASSWORD_SCHEMES[scheme]}"
+            )
+        elif scheme not in PASSWORD_SCHEMES:
+            errors.append(
+                f"password_settings.schemes: {scheme!r} is not one of "
+                f"{', '.join(PASSWORD_SCHEMES)}"
+            )
+    if not 1000 <= password_config.sha512_crypt_rounds <= 999_999_999:
+        errors.append(
+            "password_settings.sha512_crypt_rounds: must be in 1000..999999999"
+        )
+    for key in ("argon2_time_cost", "argon2_parallelism"):
+        if getattr(password_config, key) < 1:
+            errors.append(f"password_settings.{key}: must be >= 1")
+    if password_config.argon2_memory_cost < 8 * password_config.argon2_parallelism:
+        errors.append(
+            "password_settings.argon2_memory_cost: must be >= 8 * argon2_parallelism"
+        )
+    if password_config.target_ms <= 0:
+        errors.append("password_settings.target_ms: must be > 0")
+
+    if errors:
+        raise ConfigError(errors)
+
+    return Config(
+        app=app_config,
+        db=db_config,
+        auth=auth_config,
+        compression=compression_config,
+        server=server_config,
+        health=health_config,
+        rate_limit=rate_limit_config,
+        password=password_config,
+    )
+
+
+_config: Config | None = None
+_reload_hooks: list[Callable[[Config], None]] = []
+
+
+def get_config() -> Config:
+    """Текущий снимок настроек; при первом вызове загружает и проверяет."""
+    global _config
+    if _config is None:
+        _config = load_config()
+    return _config
+
+
+def reload_config(settings_file: Path = SETTINGS_FILE) -> Config:
+    """
+    Перечитывает настройки и вызывает хуки ``on_reload``. Если новые
+    настройки невалидны, остаётся старый снимок, а ошибка пробрасывается.
+    """
+    global _config
+    _config = load_config(settings_file)
+    for hook in _reload_hooks:
+        hook(_config)
+    return _config
+
+
+def on_reload(hook: Callable[[Config], None]) -> Callable[[Config], None]:
+    """Регистрирует хук, вызываемый после ``reload_config()``."""
+    _reload_hooks.append(hook)
+    return hook
 
 
-db_config = DatabaseConfig()
-auth_config = AuthSettings()
+def __getattr__(name: str):
+    # Старые имена: db_config, auth_config, compression_config, app_config.
+    # Возвращают секцию текущего снимка.
+    sections = {
+        "app_config": "app",
+        "db_config": "db",
+        "auth_config": "auth",
+        "compression_config": "compression",
+    }
+    if name in sections:
+        return getattr(get_config(), sections[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,46 @@
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from functools import cache
 
-from core.config import db_config
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 
-engine = create_async_engine(db_config.url, echo=True)
+from core.config import get_config
 
-async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+@cache
+def get_engine() -> AsyncEngine:
+    """
+    Движок создаётся при первом обращении, а не при импорте: импорт
+    приложения не тянет драйвер asyncpg и диалект, воркер стартует быстрее.
+    """
+    db_config = get_config().db
+    return create_async_engine(
+        db_config.url,
+        echo=db_config.echo,
+        pool_size=db_config.pool_size,
+        max_overflow=db_config.max_overflow,
+        pool_timeout=db_config.pool_timeout,
+        pool_recycle=db_config.pool_recycle,
+        pool_pre_ping=db_config.pool_pre_ping,
+        query_cache_size=db_config.query_cache_size,
+        connect_args={
+            "prepared_statement_cache_size": db_config.prepared_statement_cache_size
+        },
+    )
+
+
+@cache
+def get_sessionmaker() -> async_sessionmaker:
+    return async_sessionmaker(get_engine(), expire_on_commit=False)
 
 
 async def get_session():
-    async with async_session() as session:
+    async with get_sessionmaker()() as session:
         yield session
+
+
+def __getattr__(name: str):
+    # Прежние имена модуля: engine и async_session
+    if name == "engine":
+        return get_engine()
+    if name == "async_session":
+        return get_sessionmaker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,42 @@
+from collections.abc import Callable
+
+from fastapi import HTTPException, Query
+from pydantic import BaseModel
+
+# Поле, которое попадает в ответ всегда, даже если его не запросили
+ALWAYS_INCLUDED = "id"
+
+
+def sparse_fields(
+    schema: type[BaseModel],
+) -> Callable[..., tuple[str, ...] | None]:
+    """
+    Dependency для ``?fields=id,title,status``: ограничивает ответ (и
+    выбираемые из БД колонки) подмножеством полей ``schema``.
+
+    Возвращает ``None``, если параметр не передан, иначе кортеж полей в
+    порядке схемы. Неизвестные поля — 422.
+    """
+    allowed = tuple(schema.model_fields)
+
+    def dependency(
+        fields: str | None = Query(
+            None,
+            description=f"Поля ответа через запятую: {', '.join(allowed)}",
+        ),
+    ) -> tuple[str, ...] | None:
+        if fields is None:
+            return None
+
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = sorted(requested.difference(allowed))
+        if unknown:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Unknown fields: {', '.join(unknown)}",
+            )
+
+        requested.add(ALWAYS_INCLUDED)
+        return tuple(name for name in allowed if name in requested)
+
+    return dependency
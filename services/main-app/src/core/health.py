@@ -0,0 +1,159 @@
+"""
+Проверки готовности воркера для ``/health/ready``.
+
+- БД: дешёвый запрос, результат кэшируется на ``ping_ttl`` секунд, а
+  одновременные пробы ждут одну проверку, а не открывают по соединению;
+- пул: доля занятых соединений от ``pool_size + max_overflow``;
+- цикл событий: наибольшая за последние ``LAG_SAMPLES`` замеров задержка
+  пробуждения фоновой задачи, которая спит ``loop_lag_interval`` секунд;
+- миграции: версии в ``alembic_version`` совпадают с head скриптов.
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Callable
+from functools import cache
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from core.config import BASE_DIR, HealthConfig, get_config
+from core.database import get_engine
+
+MIGRATIONS_DIR = BASE_DIR / "alembic"
+LAG_SAMPLES = 10
+
+
+@cache
+def migration_heads() -> frozenset[str] | None:
+    """Head-ревизии скриптов миграций; ``None``, если скриптов нет рядом."""
+    if not (MIGRATIONS_DIR / "versions").is_dir():
+        return None
+
+    from alembic.script import ScriptDirectory
+
+    return frozenset(ScriptDirectory(str(MIGRATIONS_DIR)).get_heads())
+
+
+class HealthMonitor:
+    def __init__(
+        self,
+        config: HealthConfig | None = None,
+        engine_factory: Callable[[], AsyncEngine] = get_engine,
+        heads: Callable[[], frozenset[str] | None] = migration_heads,
+    ):
+        self.config = config or get_config().health
+        self.engine_factory = engine_factory
+        self.heads = heads
+        self._lag_samples: deque[float] = deque(maxlen=LAG_SAMPLES)
+        self._lag_task: asyncio.Task | None = None
+        self._db_result: dict | None = None
+        self._db_checked_at = 0.0
+        self._db_lock = asyncio.Lock()
+
+    def start(self) -> None:
+        """Запускает замер задержки цикла событий (в lifespan воркера)."""
+        if self._lag_task is None or self._lag_task.done():
+            self._lag_task = asyncio.create_task(self._sample_loop_lag())
+
+    async def stop(self) -> None:
+        if self._lag_task is not None:
+            self._lag_task.cancel()
+            await asyncio.gather(self._lag_task, return_exceptions=True)
+            self._lag_task = None
+
+    @property
+    def loop_lag(self) -> float:
+        return max(self._lag_samples, default=0.0)
+
+    async def _sample_loop_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        interval = self.config.loop_lag_interval
+        while True:
+            started = loop.time()
+            await asyncio.sleep(interval)
+            self._lag_samples.append(max(0.0, loop.time() - started - interval))
+
+    async def ready(self) -> tuple[bool, dict]:
+        """Общий результат и результаты отдельных проверок."""
+        self.start()
+        checks = {
+            "pool": self._pool(),
+            "event_loop": {
+                "ok": self.loop_lag <= self.config.max_loop_lag,
+                "lag_ms": round(self.loop_lag * 1000, 1),
+            },
+        }
+        database = await self._database()
+        checks["database"] = {"ok": database["ok"]}
+        if "error" in database:
+            checks["database"]["error"] = database["error"]
+        if self.config.check_migrations:
+            checks["migrations"] = self._migrations(database.get("versions"))
+
+        return all(check["ok"] for check in checks.values()), checks
+
+    def _pool(self) -> dict:
+        db_config = get_config().db
+        capacity = db_config.pool_size + db_config.max_overflow
+        checked_out = self.engine_factory().pool.checkedout()
+        return {
+            "ok": checked_out < capacity * self.config.max_pool_usage,
+            "checked_out": checked_out,
+            "capacity": capacity,
+        }
+
+    async def _database(self) -> dict:
+        if self._db_fresh():
+            return self._db_result
+        async with self._db_lock:
+            # Пока ждали блокировку, проверку мог выполнить другой запрос
+            if not self._db_fresh():
+                self._db_result = await self._ping()
+                self._db_checked_at = time.monotonic()
+        return self._db_result
+
+    def _db_fresh(self) -> bool:
+        return (
+            self._db_result is not None
+            and time.monotonic() - self._db_checked_at < self.config.ping_ttl
+        )
+
+    async def _ping(self) -> dict:
+        try:
+            async with asyncio.timeout(self.config.ping_timeout):
+                async with self.engine_factory().connect() as connection:
+                    # Запрос служит и пингом, и проверкой наличия таблицы
+                    stamped = await connection.scalar(
+                        text("SELECT to_regclass('alembic_version') IS NOT NULL")
+                    )
+                    versions = (
+                        await connection.scalars(
+                            text("SELECT version_num FROM alembic_version")
+                        )
+                        if stamped
+                        else []
+                    )
+                    return {"ok": True, "versions": frozenset(versions)}
+        except TimeoutError:
+            return {"ok": False, "error": "timeout"}
+        except (OSError, SQLAlchemyError) as exc:
+            return {"ok": False, "error": type(exc).__name__}
+
+    def _migrations(self, versions: frozenset[str] | None) -> dict:
+        expected = self.heads()
+        if expected is None:
+            return {"ok": True, "skipped": "no migration scripts"}
+        if versions is None:
+            # БД недоступна — это уже отражено в проверке database
+            return {"ok": False, "expected": sorted(expected)}
+        return {
+            "ok": versions == expected,
+            "current": sorted(versions),
+            "expected": sorted(expected),
+        }
+
+
+health_monitor = HealthMonitor()
@@ -0,0 +1,39 @@
+"""
+JSON по HTTP к соседним сервисам (JWKS и выпуск токенов в auth-service).
+
+Запросы редкие — раз в несколько минут и на вход пользователя, — поэтому
+хватает urllib в пуле потоков, без отдельного асинхронного клиента.
+Ошибки сети и HTTP-статусы >= 400 — ``OSError``, некорректный JSON —
+``ValueError``.
+"""
+
+import asyncio
+import json
+import urllib.request
+from typing import Any
+
+
+def _request(request: urllib.request.Request, timeout: float) -> Any:
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.load(response)
+
+
+async def get_json(url: str, timeout: float) -> Any:
+    request = urllib.request.Request(url, headers={"Accept": "application/json"})
+    return await asyncio.to_thread(_request, request, timeout)
+
+
+async def post_json(
+    url: str, payload: Any, timeout: float, headers: dict[str, str] | None = None
+) -> Any:
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode(),
+        headers={
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            **(headers or {}),
+        },
+        method="POST",
+    )
+    return await asyncio.to_thread(_request, request, timeout)
@@ -0,0 +1,89 @@
+"""
+Жизненный цикл воркера: прогрев перед приёмом запросов и освобождение
+ресурсов при остановке.
+
+uvicorn начинает принимать соединения только после startup lifespan,
+поэтому первые запросы не платят за подключение к БД, импорт
+passlib / jose и разбор настроек хеширования.
+"""
+
+import asyncio
+import logging
+import uuid
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from auth.jwt import create_access_token, decode_token
+from auth.keys import jwks_refresher
+from auth.rehash import password_rehasher
+from auth.revocation import revocation_listener
+from auth.security import get_pwd_context
+from auth.sweeper import token_sweeper
+from core.config import get_config
+from core.database import get_engine
+from core.health import health_monitor, migration_heads
+
+logger = logging.getLogger(__name__)
+
+
+async def warm_pool(engine: AsyncEngine, connections: int) -> None:
+    """Открывает ``connections`` соединений одновременно и возвращает их в пул."""
+
+    async def ping() -> None:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(ping() for _ in range(connections)))
+
+
+def warm_caches() -> None:
+    """Ленивые модули и объекты, которые иначе создаются на первом запросе."""
+    get_pwd_context().handler()
+    if not get_config().auth.jwks_url:
+        # Локальный ключ подписи: чтение или создание файла, разбор PEM
+        decode_token(create_access_token(uuid.uuid4()), "access")
+    migration_heads()
+
+
+async def load_jwks() -> None:
+    """Запускает обновление JWKS и ждёт первую загрузку ключей."""
+    auth_config = get_config().auth
+    if not auth_config.jwks_url:
+        return
+    jwks_refresher.start()
+    try:
+        await asyncio.wait_for(jwks_refresher.loaded.wait(), auth_config.issuer_timeout)
+    except TimeoutError:
+        # Без ключей токены отклоняются, пока JWKS не загрузится в фоне
+        logger.warning(
+            "JWKS is not loaded after %ss, tokens are rejected until it is",
+            auth_config.issuer_timeout,
+        )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    warm_caches()
+    await load_jwks()
+    try:
+        await warm_pool(get_engine(), get_config().db.pool_size)
+    except (OSError, SQLAlchemyError) as exc:
+        # БД может подняться позже воркера: пул наполнится по ходу работы
+        logger.warning("connection pool warm-up failed: %r", exc)
+    health_monitor.start()
+    revocation_listener.start()
+    token_sweeper.start()
+
+    yield
+
+    # Сюда uvicorn доходит после завершения начатых запросов
+    await password_rehasher.drain()
+    await token_sweeper.stop()
+    await jwks_refresher.stop()
+    await revocation_listener.stop()
+    await health_monitor.stop()
+    await get_engine().dispose()
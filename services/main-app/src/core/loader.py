@@ -0,0 +1,129 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping
+from functools import cache
+from typing import Any
+
+from sqlalchemy import ARRAY, Select, any_, bindparam, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+BatchLoad = Callable[[list[Any]], Awaitable[Mapping[Any, Any]]]
+
+
+class DataLoader:
+    """
+    Собирает ключи, запрошенные в одном проходе event loop, и загружает их
+    одним вызовом ``batch_load``. Результаты запоминаются до ``clear()``.
+
+    ``batch_load`` получает список уникальных ключей и возвращает словарь
+    ключ -> значение; отсутствующие ключи дают ``None``.
+    """
+
+    def __init__(self, batch_load: BatchLoad, lock: asyncio.Lock | None = None):
+        self.batch_load = batch_load
+        # Общий замок для загрузчиков одной сессии: AsyncSession не допускает
+        # параллельных запросов
+        self.lock = lock or asyncio.Lock()
+        self._cache: dict[Hashable, asyncio.Future] = {}
+        self._queue: dict[Hashable, asyncio.Future] = {}
+        self._dispatches: set[asyncio.Task] = set()
+
+    async def load(self, key: Hashable) -> Any | None:
+        future = self._cache.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._cache[key] = future
+            if not self._queue:
+                # Ждём, пока остальные корутины этого прохода добавят свои ключи
+                loop.call_soon(self._dispatch)
+            self._queue[key] = future
+
+        # shield: отмена одного ожидающего не должна отменять загрузку для всех
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[Hashable]) -> list[Any | None]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def clear(self) -> None:
+        self._cache = {
+            key: future for key, future in self._cache.items() if not future.done()
+        }
+
+    def forget(self, key: Hashable) -> None:
+        """Убирает загруженное значение ``key`` из кеша."""
+        future = self._cache.get(key)
+        if future is not None and future.done():
+            del self._cache[key]
+
+    def _dispatch(self) -> None:
+        batch, self._queue = self._queue, {}
+        task = asyncio.ensure_future(self._load_batch(batch))
+        self._dispatches.add(task)
+        task.add_done_callback(self._dispatches.discard)
+
+    async def _load_batch(self, batch: dict[Hashable, asyncio.Future]) -> None:
+        try:
+            async with self.lock:
+                values = await self.batch_load(list(batch))
+        except Exception as e:
+            for key, future in batch.items():
+                # Ошибку не кешируем — следующий load() попробует снова
+                self._cache.pop(key, None)
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(values.get(key))
+
+
+def model_loader(session: AsyncSession, model) -> DataLoader:
+    """
+    Загрузчик ``model`` по id, общий для всех репозиториев одной сессии,
+    т.е. одного запроса: get_by_id в рамках прохода event loop сливаются
+    в один ``SELECT ... WHERE id = ANY(:ids)``.
+
+    Кеш сбрасывается на commit и rollback, чтобы не отдавать удалённые
+    или откаченные объекты; удалённые в flush убираются из него сразу.
+    """
+    loaders = session.info.get("loaders")
+    if loaders is None:
+        loaders = session.info["loaders"] = {}
+        lock = session.info["loaders_lock"] = asyncio.Lock()
+
+        def clear_loaders(*args):
+            for loader in loaders.values():
+                loader.clear()
+
+        def forget_deleted(sync_session, flush_context):
+            # Репозитории только flush-ят: удалённое до commit не должно
+            # находиться через get_by_id в той же транзакции
+            for instance in sync_session.deleted:
+                loader = loaders.get(type(instance))
+                if loader is not None:
+                    loader.forget(instance.id)
+
+        event.listen(session.sync_session, "after_commit", clear_loaders)
+        event.listen(session.sync_session, "after_soft_rollback", clear_loaders)
+        event.listen(session.sync_session, "after_flush", forget_deleted)
+    else:
+        lock = session.info["loaders_lock"]
+
+    loader = loaders.get(model)
+    if loader is None:
+
+        async def batch_load(ids: list) -> dict:
+            result = await session.execute(_select_by_ids(model), {"ids": ids})
+            return {row.id: row for row in result.scalars()}
+
+        loader = loaders[model] = DataLoader(batch_load, lock)
+
+    return loader
+
+
+@cache
+def _select_by_ids(model) -> Select:
+    # Один объект запроса на модель: ключ кэша SQLAlchemy запоминается в нём
+    ids = bindparam("ids", type_=ARRAY(model.__table__.c.id.type))
+    return select(model).where(model.id == any_(ids))
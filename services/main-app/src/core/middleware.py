@@ -0,0 +1,131 @@
+import os
+import random
+import signal
+from collections.abc import Callable
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.compression import choose_encoding, compress
+
+
+class CompressionMiddleware:
+    """
+    Сжатие ответов gzip / brotli / zstd по Accept-Encoding.
+
+    Сжимаются только ответы целиком (не потоковые), не меньше
+    ``minimum_size`` байт и с Content-Type из ``content_types``. Ответы, у
+    которых Content-Encoding уже выставлен (потоковая выгрузка, заранее
+    сжатые тела из кэша), передаются как есть.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        encodings: list[str] | tuple[str, ...] = ("gzip",),
+        content_types: list[str] | tuple[str, ...] = ("application/json",),
+        levels: dict[str, int] | None = None,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = tuple(encodings)
+        self.content_types = frozenset(content_types)
+        self.levels = {"gzip": 6, "br": 4, "zstd": 3, **(levels or {})}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(
+            Headers(scope=scope).get("accept-encoding"), self.encodings
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                # Заголовки отправим, когда станет ясно, сжимаем ли тело
+                start = message
+                return
+
+            if message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            if message.get("more_body", False) or not self._compressible(start, body):
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            compressed = compress(body, encoding, self.levels[encoding])
+            headers = MutableHeaders(raw=start["headers"])
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            await send(start)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
+
+    def _compressible(self, start: Message, body: bytes) -> bool:
+        if len(body) < self.minimum_size:
+            return False
+
+        headers = Headers(raw=start["headers"])
+        if "content-encoding" in headers:
+            return False
+
+        media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        return media_type in self.content_types
+
+
+def _stop_worker() -> None:
+    # uvicorn ловит SIGTERM: перестаёт принимать соединения, дожидается
+    # начатых запросов и выполняет shutdown lifespan
+    os.kill(os.getpid(), signal.SIGTERM)
+
+
+class MaxRequestsMiddleware:
+    """
+    Плавный перезапуск воркера после ``max_requests`` + случайные
+    ``0..jitter`` HTTP-запросов. Разброс выбирается в каждом процессе
+    свой, поэтому воркеры, запущенные одновременно, перезапускаются
+    в разное время. Новый процесс поднимает супервизор ``python -m server``.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_requests: int,
+        jitter: int = 0,
+        on_limit: Callable[[], None] = _stop_worker,
+    ):
+        self.app = app
+        self.limit = max_requests + random.randint(0, jitter)
+        self.on_limit = on_limit
+        self.count = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        self.count += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            if self.count == self.limit:
+                self.on_limit()
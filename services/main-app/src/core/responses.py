@@ -0,0 +1,123 @@
+import hashlib
+from collections.abc import AsyncIterable, Iterable, Sequence
+from functools import cache
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from core.compression import (
+    PrecompressedCache,
+    accepts_encoding,
+    choose_encoding,
+    gzip_stream,
+)
+from core.config import get_config
+
+precompressed_cache = PrecompressedCache(get_config().compression.cache_entries)
+
+
+class FastJSONResponse(Response):
+    """
+    JSON-ответ, сериализуемый pydantic-core (Rust) напрямую в байты.
+
+    Когда эндпоинт возвращает Response, FastAPI не валидирует результат по
+    ``response_model`` и не прогоняет его через jsonable_encoder. Поэтому
+    ``response_model`` можно оставить в декораторе ради OpenAPI, а данные
+    отдавать этим классом.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+@cache
+def _field_names(schema: type[BaseModel]) -> tuple[str, ...]:
+    return tuple(schema.model_fields)
+
+
+def rows_to_dicts(
+    rows: Iterable[Any],
+    schema: type[BaseModel],
+    fields: Sequence[str] | None = None,
+) -> list[dict]:
+    """
+    ORM-объекты или ``Row`` -> словари с полями ``schema``, без создания
+    и валидации pydantic-моделей. UUID, datetime и Enum to_json сериализует
+    так же, как pydantic при обычном ответе.
+
+    ``fields`` — подмножество полей схемы (см. ``core.fields``).
+    """
+    names = fields or _field_names(schema)
+    return [{name: getattr(row, name) for name in names} for row in rows]
+
+
+def fast_json(
+    rows: Iterable[Any],
+    schema: type[BaseModel],
+    fields: Sequence[str] | None = None,
+) -> FastJSONResponse:
+    """Список ``rows`` как JSON в формате ``list[schema]``."""
+    return FastJSONResponse(rows_to_dicts(rows, schema, fields))
+
+
+def streaming_download(
+    chunks: AsyncIterable[bytes],
+    media_type: str,
+    filename: str,
+    accept_encoding: str | None = None,
+) -> StreamingResponse:
+    """
+    Потоковая выгрузка файла. Если клиент принимает gzip, поток сжимается
+    на лету — без буферизации всего ответа.
+    """
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        "Vary": "Accept-Encoding",
+    }
+    if accepts_encoding(accept_encoding, "gzip"):
+        chunks = gzip_stream(chunks)
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(chunks, media_type=media_type, headers=headers)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    # Слабое сравнение (RFC 9110): W/"x" и "x" совпадают
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+def cached_json(request: Request, content: Any) -> Response:
+    """
+    JSON-ответ с ETag по содержимому.
+
+    Если у клиента та же версия (If-None-Match), отдаётся 304 без тела.
+    Иначе тело сжимается один раз на версию и кодировку и берётся из
+    ``precompressed_cache`` — повторные запросы не тратят CPU на сжатие.
+    """
+    body = to_json(content)
+    # Слабый ETag: одна версия отдаётся в разных Content-Encoding
+    etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    compression = get_config().compression
+    encoding = choose_encoding(
+        request.headers.get("accept-encoding"), compression.encodings
+    )
+    if encoding and len(body) >= compression.minimum_size:
+        body = precompressed_cache.get(
+            etag, encoding, body, compression.level(encoding)
+        )
+        headers["Content-Encoding"] = encoding
+
+    return Response(body, media_type="application/json", headers=headers)
@@ -0,0 +1,58 @@
+"""
+Граница транзакции на вызов сервиса.
+
+Репозитории не коммитят: изменения только отправляются в БД (``flush``),
+а транзакцию завершает сервис, оборачивая операцию в ``async with uow``.
+Коммит один — при выходе из внешнего блока; исключение откатывает всё,
+что успели сделать репозитории. Вложенные блоки (сервис вызывает другой
+сервис на той же сессии) коммит не делают.
+
+``UnitOfWork.commit()`` — явный выход: фиксирует транзакцию сразу, не
+дожидаясь конца блока (например, перед долгой внешней операцией).
+Атомарные операции авторизации (ротация refresh-токенов, регистрация,
+счётчики входа) по-прежнему коммитят сами — им граница не нужна.
+"""
+
+from types import TracebackType
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.database import get_session
+
+
+class UnitOfWork:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._depth = 0
+
+    async def __aenter__(self) -> "UnitOfWork":
+        self._depth += 1
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._depth -= 1
+        if self._depth:
+            return
+        if exc_type is None:
+            await self.session.commit()
+        else:
+            await self.session.rollback()
+
+    async def commit(self) -> None:
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
+
+
+async def get_unit_of_work(
+    session: AsyncSession = Depends(get_session),
+) -> UnitOfWork:
+    # Сессия общая с репозиториями запроса: FastAPI кэширует get_session
+    return UnitOfWork(session)
@@ -1,5 +1,9 @@
+from .export_format import ExportFormat
 from .task_status import TaskStatus
+from .token_rotation import TokenRotation
 
 __all__ = [
+    "ExportFormat",
     "TaskStatus",
+    "TokenRotation",
 ]
@@ -0,0 +1,6 @@
+import enum
+
+
+class ExportFormat(enum.Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
@@ -0,0 +1,12 @@
+import enum
+
+
+class TokenRotation(enum.Enum):
+    """Исход попытки обменять refresh-токен на новый."""
+
+    ROTATED = "ROTATED"
+    # Токен только что обменян параллельным запросом (другая вкладка)
+    CONCURRENT = "CONCURRENT"
+    # Повторное использование отозванного токена — семейство отозвано
+    REUSED = "REUSED"
+    EXPIRED = "EXPIRED"
@@ -62,3 +62,25 @@ class UserNotFoundError(Exception):
 
     def __str__(self):
         return f"User {self.user_id} not found"
+
+
+class ColumnNotFoundError(Exception):
+    def __init__(self, column_id):
+        self.column_id = column_id
+        super().__init__()
+
+    def __str__(self):
+        return f"Column {self.column_id} not found"
+
+
+class ColumnLimitExceededError(Exception):
+    def __init__(self, column_id, limit, count):
+        self.column_id = column_id
+        self.limit = limit
+        self.count = count
+        super().__init__()
+
+    def __str__(self):
+        return (
+            f"Column {self.column_id} limit {self.limit} exceeded: {self.count} tasks"
+        )
@@ -1,17 +1,22 @@
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 
+from api.health import router as health_router
 from api.v1.auth import router as auth_router
 from api.v1.boards import router as boards_router
 from api.v1.columns import router as columns_router
+from api.v1.imports import router as imports_router
 from api.v1.comments import router as comments_router
 from api.v1.statistics import router as statistics_router
 from api.v1.task_members import router as task_members_router
 from api.v1.tasks import router as tasks_router
 from api.v1.team_members import router as team_members_router
 from api.v1.teams import router as teams_router
+from api.v1.users import router as users_router
 from api.v1.notifications import router as notification_router
-from core.config import settings
+from core.config import get_config
+from core.lifecycle import lifespan
+from core.middleware import CompressionMiddleware, MaxRequestsMiddleware
 from exceptions import (
     InvalidCredentialsError,
     TeamMemberConflictError,
@@ -19,11 +24,30 @@ from exceptions import (
     UserNotFoundError,
 )
 
+# Настройки проверяются при старте: невалидный settings.toml — ConfigError
+config = get_config()
+
 app = FastAPI(
-    title=settings.app_settings.app_name,
-    version=settings.app_settings.app_version,
+    title=config.app.name,
+    version=config.app.version,
+    lifespan=lifespan,
+)
+
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=config.compression.minimum_size,
+    encodings=config.compression.encodings,
+    content_types=config.compression.content_types,
+    levels=config.compression.levels,
 )
 
+if config.server.max_requests:
+    app.add_middleware(
+        MaxRequestsMiddleware,
+        max_requests=config.server.max_requests,
+        jitter=config.server.max_requests_jitter,
+    )
+
 
 @app.exception_handler(InvalidCredentialsError)
 async def invalid_credentials_handler(request, exc: InvalidCredentialsError):
@@ -68,13 +92,11 @@ app.include_router(tasks_router, prefix="/api/v1")
 app.include_router(comments_router, prefix="/api/v1")
 app.include_router(statistics_router, prefix="/api/v1")
 app.include_router(notification_router, prefix="/api/v1")
+app.include_router(users_router, prefix="/api/v1")
+app.include_router(imports_router, prefix="/api/v1")
+app.include_router(health_router)
 
 
 @app.get("/")
 async def root():
     return {"message": "Main App is running"}
-
-
-@app.get("/health")
-async def health():
-    return {"status": "healthy", "service": "main-app"}
@@ -2,6 +2,7 @@ from .base import Base, BaseModelMixin
 from .board import Board
 from .column import BoardColumn
 from .comment import Comment
+from .login_throttle import LoginThrottle
 from .refresh_token import RefreshToken
 from .task import Task, TaskStatus
 from .task_members import TaskMember
@@ -23,5 +24,6 @@ __all__ = [
     "BoardColumn",
     "TaskMember",
     "RefreshToken",
+    "LoginThrottle",
     "Notification"
 ]
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Float, String
+
+from .base import Base
+
+
+class LoginThrottle(Base):
+    """Счётчики ограничения попыток входа для backend = "database"."""
+
+    __tablename__ = "login_throttle"
+    # Счётчики не жалко потерять при сбое БД, а запись без WAL дешевле
+    __table_args__ = {"prefixes": ["UNLOGGED"]}
+
+    # "ip:<адрес>" или "email:<адрес>"
+    key = Column(String, primary_key=True)
+    # Теоретическое время следующей попытки (GCRA), секунды эпохи
+    tat = Column(Float, nullable=False)
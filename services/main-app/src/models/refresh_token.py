@@ -1,3 +1,5 @@
+import uuid
+
 from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String
 from sqlalchemy.dialects.postgresql.base import UUID
 from sqlalchemy.orm import relationship
@@ -10,7 +12,13 @@ class RefreshToken(Base, BaseModelMixin):
 
     user_id = Column(UUID, ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
     token_jti = Column(String, unique=True, nullable=False, index=True)
-    expires_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
     is_revoked = Column(Boolean, default=False, nullable=False)
+    # Все токены, полученные обменом из одного входа; при повторном
+    # использовании отозванного токена отзывается всё семейство
+    family_id = Column(UUID, nullable=False, default=uuid.uuid4, index=True)
+    revoked_at = Column(DateTime, nullable=True)
+    # jti токена, выданного взамен при обмене
+    replaced_by = Column(String, nullable=True)
 
     user = relationship("User", back_populates="refresh_tokens")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, UniqueConstraint
+from sqlalchemy import DDL, Column, ForeignKey, UniqueConstraint, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -21,3 +21,33 @@ class TeamMember(Base, BaseModelMixin):
     )
 
     user = relationship("User", back_populates="team_member")
+
+
+# Эпоха членства растёт в той же транзакции, что и изменение team_member,
+# какой бы путь его ни менял: API, каскад при удалении команды, импорт.
+# Триггеры уровня инструкции — один UPDATE "user" на запрос, а не на строку.
+# Те же объекты создаёт миграция 3d9a7c51e2f8
+MEMBERSHIP_EPOCH_DDL = (
+    """
+    CREATE OR REPLACE FUNCTION bump_membership_epoch() RETURNS trigger AS $$
+    BEGIN
+        UPDATE "user" SET membership_epoch = membership_epoch + 1
+        WHERE id IN (SELECT user_id FROM changed);
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER team_member_inserted_epoch
+    AFTER INSERT ON team_member REFERENCING NEW TABLE AS changed
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_membership_epoch()
+    """,
+    """
+    CREATE TRIGGER team_member_deleted_epoch
+    AFTER DELETE ON team_member REFERENCING OLD TABLE AS changed
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_membership_epoch()
+    """,
+)
+
+for statement in MEMBERSHIP_EPOCH_DDL:
+    event.listen(TeamMember.__table__, "after_create", DDL(statement))
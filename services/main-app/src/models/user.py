@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String
+from sqlalchemy import Column, Integer, String, text
 from sqlalchemy.orm import relationship
 
 from .base import Base, BaseModelMixin
@@ -13,6 +13,12 @@ class User(Base, BaseModelMixin):
 
     hashed_password = Column(String, nullable=False)
 
+    # Растёт при каждом изменении членства в командах (триггер на
+    # team_member): access-токен со старой эпохой не годится для авторизации
+    membership_epoch = Column(
+        Integer, nullable=False, default=0, server_default=text("0")
+    )
+
     tasks = relationship("Task", back_populates="user", cascade="all, delete-orphan")
 
     comments = relationship(
@@ -0,0 +1,114 @@
+from functools import cache
+from uuid import UUID
+
+from sqlalchemy import Integer, Select, bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.loader import model_loader
+from models import Base
+
+
+class BaseRepository[ModelT: Base]:
+    """
+    Общие для репозиториев get_by_id / get_by_ids / get_all / create /
+    update / delete над ``model``.
+
+    Запросы строятся один раз на класс репозитория, значения передаются
+    через ``bindparam``. SQLAlchemy запоминает ключ кэша у объекта запроса,
+    поэтому повторный вызов не собирает выражение заново и не обходит его
+    дерево, а сразу берёт скомпилированный SQL из кэша движка. На стороне
+    asyncpg тот же текст SQL — один prepared statement на соединение
+    (``db_settings.prepared_statement_cache_size``).
+    """
+
+    model: type[ModelT]
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @classmethod
+    @cache
+    def _select_page(cls) -> Select:
+        return (
+            select(cls.model)
+            .offset(bindparam("skip", type_=Integer))
+            .limit(bindparam("limit", type_=Integer))
+        )
+
+    @classmethod
+    @cache
+    def _select_page_by(cls, column: str) -> Select:
+        """Страница записей с ``column == :value``."""
+        return cls._select_page().where(
+            getattr(cls.model, column) == bindparam("value")
+        )
+
+    @classmethod
+    @cache
+    def _select_page_matching(cls, column: str) -> Select:
+        """Страница записей с ``column ILIKE :pattern``."""
+        return cls._select_page().where(
+            getattr(cls.model, column).ilike(bindparam("pattern"))
+        )
+
+    async def get_by_id(self, entity_id: UUID) -> ModelT | None:
+        return await model_loader(self.db, self.model).load(entity_id)
+
+    async def get_by_ids(self, entity_ids: list[UUID]) -> list[ModelT]:
+        entities = await model_loader(self.db, self.model).load_many(entity_ids)
+
+        return [entity for entity in entities if entity is not None]
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> list[ModelT]:
+        result = await self.db.execute(
+            self._select_page(), {"skip": skip, "limit": limit}
+        )
+
+        return result.scalars().all()
+
+    async def _get_page_by(
+        self, column: str, value, skip: int = 0, limit: int = 100
+    ) -> list[ModelT]:
+        result = await self.db.execute(
+            self._select_page_by(column), {"value": value, "skip": skip, "limit": limit}
+        )
+
+        return result.scalars().all()
+
+    async def _search(
+        self, column: str, substring: str, skip: int = 0, limit: int = 100
+    ) -> list[ModelT]:
+        result = await self.db.execute(
+            self._select_page_matching(column),
+            {"pattern": f"%{substring}%", "skip": skip, "limit": limit},
+        )
+
+        return result.scalars().all()
+
+    async def create(self, data: dict) -> ModelT:
+        entity = self.model(**data)
+        self.db.add(entity)
+        await self.db.flush()
+        return entity
+
+    async def update(self, entity_id: UUID, data: dict) -> ModelT | None:
+        entity = await self.get_by_id(entity_id)
+
+        if entity:
+            for key, value in data.items():
+                setattr(entity, key, value)
+
+            await self.db.flush()
+
+        return entity
+
+    async def delete(self, entity_id: UUID) -> bool:
+        entity = await self.get_by_id(entity_id)
+
+        if entity:
+            await self.db.delete(entity)
+            await self.db.flush()
+
+            return True
+
+        return False
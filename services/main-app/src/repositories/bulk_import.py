@@ -0,0 +1,113 @@
+from fastapi import Depends
+from sqlalchemy import Column, MetaData, Table, exists, func, or_, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.bulk import copy_records
+from core.database import get_session
+from models import Board, BoardColumn, Comment, Task, TaskMember, Team, TeamMember
+
+# Порядок слияния важен: родительские таблицы раньше дочерних
+IMPORT_TABLES: dict[str, Table] = {
+    "team": Team.__table__,
+    "team_member": TeamMember.__table__,
+    "board": Board.__table__,
+    "column": BoardColumn.__table__,
+    "task": Task.__table__,
+    "task_member": TaskMember.__table__,
+    "comment": Comment.__table__,
+}
+
+_staging_metadata = MetaData()
+
+# Временные таблицы той же структуры, что и целевые: import_task и т.д.
+STAGING_TABLES: dict[str, Table] = {
+    kind: Table(
+        f"import_{table.name}",
+        _staging_metadata,
+        *(Column(column.name, column.type) for column in table.columns),
+    )
+    for kind, table in IMPORT_TABLES.items()
+}
+
+IMPORT_COLUMNS: dict[str, list[str]] = {
+    kind: [column.name for column in table.columns]
+    for kind, table in IMPORT_TABLES.items()
+}
+
+
+class ImportRepository:
+    """
+    Импорт в две фазы: строки через COPY попадают во временные таблицы,
+    затем переносятся в основные одним INSERT ... SELECT на таблицу.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def stage(self, kind: str, records: list[tuple]) -> int:
+        connection = await self.db.connection()
+        table = IMPORT_TABLES[kind]
+        # Временная таблица живёт в соединении, а после commit сессия может
+        # получить из пула другое — поэтому IF NOT EXISTS на каждую пачку
+        await connection.execute(
+            text(
+                f'CREATE TEMPORARY TABLE IF NOT EXISTS "import_{table.name}" '
+                f'(LIKE "{table.name}")'
+            )
+        )
+        return await copy_records(
+            connection, STAGING_TABLES[kind].name, IMPORT_COLUMNS[kind], records
+        )
+
+    async def merge(self, kinds: list[str]) -> dict[str, int]:
+        """
+        Переносит загруженные пачки в основные таблицы и коммитит.
+
+        Строки с уже существующим id (или нарушающие другие уникальные
+        ограничения) и строки без родительской записи пропускаются.
+        Возвращает количество вставленных строк по типам.
+        """
+        inserted = {}
+        for kind in IMPORT_TABLES:
+            if kind not in kinds:
+                continue
+            result = await self.db.execute(_merge_statement(kind))
+            inserted[kind] = result.scalar_one()
+
+        names = ", ".join(f'"{STAGING_TABLES[kind].name}"' for kind in kinds)
+        await self.db.execute(text(f"TRUNCATE {names}"))
+        await self.db.commit()
+        return inserted
+
+
+def _merge_statement(kind: str):
+    table = IMPORT_TABLES[kind]
+    staging = STAGING_TABLES[kind]
+
+    conditions = []
+    for foreign_key in table.foreign_keys:
+        value = staging.c[foreign_key.parent.name]
+        parent_exists = exists().where(foreign_key.column == value)
+        if foreign_key.parent.nullable:
+            parent_exists = or_(value.is_(None), parent_exists)
+        conditions.append(parent_exists)
+
+    columns = IMPORT_COLUMNS[kind]
+    statement = (
+        insert(table)
+        .from_select(
+            columns,
+            select(*(staging.c[name] for name in columns)).where(*conditions),
+        )
+        .on_conflict_do_nothing()
+        .returning(table.c.id)
+    )
+    inserted = statement.cte("inserted")
+    return select(func.count()).select_from(inserted)
+
+
+async def get_import_repository(
+    db: AsyncSession = Depends(get_session),
+) -> ImportRepository:
+    return ImportRepository(db)
@@ -4,8 +4,8 @@ from fastapi import Depends
 from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.database import get_session
 from models import Comment
-from src.core.database import get_session
 
 
 class CommentRepository:
@@ -32,8 +32,7 @@ class CommentRepository:
     async def create(self, *, body: str, user_id: UUID, task_id: UUID) -> Comment:
         comment = Comment(body=body, user_id=user_id, task_id=task_id)
         self.session.add(comment)
-        await self.session.commit()
-        await self.session.refresh(comment)
+        await self.session.flush()
         return comment
 
     async def update(
@@ -52,21 +51,13 @@ class CommentRepository:
             .returning(Comment)
         )
         result = await self.session.execute(stmt)
-        comment = result.scalar_one_or_none()
-        if comment is None:
-            return None
-        await self.session.commit()
-        return comment
+        return result.scalar_one_or_none()
 
     async def delete(self, comment_id: UUID) -> bool:
         result = await self.session.execute(
             delete(Comment).where(Comment.id == comment_id).returning(Comment.id)
         )
-        deleted_id = result.scalar_one_or_none()
-        if deleted_id is None:
-            return False
-        await self.session.commit()
-        return True
+        return result.scalar_one_or_none() is not None
 
 
 async def get_comment_repository(
@@ -0,0 +1,104 @@
+from collections.abc import AsyncIterator, Sequence
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy import ColumnElement, RowMapping, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.database import get_session
+from models import Board, BoardColumn, Comment, Task, TaskMember, Team, TeamMember
+
+# Размер пачки, которую курсор забирает с сервера за раз
+YIELD_PER = 1000
+
+# Тип записей и пачка строк: построчная итерация по курсору — это
+# переключение greenlet на каждую строку, пачками в разы дешевле
+ExportBatch = tuple[str, Sequence[RowMapping]]
+
+
+class ExportRepository:
+    """
+    Потоковое чтение доски или команды со всеми колонками, задачами,
+    исполнителями и комментариями через серверный курсор.
+
+    Читаются строки таблиц, а не ORM-объекты: без identity map память
+    не растёт с размером доски.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def stream_board(self, board_id: UUID) -> AsyncIterator[ExportBatch]:
+        async for batch in self._stream_boards(Board.id == board_id):
+            yield batch
+
+    async def stream_team(self, team_id: UUID) -> AsyncIterator[ExportBatch]:
+        plan = [
+            ("team", select(Team.__table__).where(Team.id == team_id)),
+            (
+                "team_member",
+                select(TeamMember.__table__)
+                .where(TeamMember.team_id == team_id)
+                .order_by(TeamMember.created_at, TeamMember.id),
+            ),
+        ]
+        for kind, statement in plan:
+            async for batch in self._stream(kind, statement):
+                yield batch
+
+        async for batch in self._stream_boards(Board.team_id == team_id):
+            yield batch
+
+    async def _stream_boards(
+        self, condition: ColumnElement[bool]
+    ) -> AsyncIterator[ExportBatch]:
+        board_ids = select(Board.id).where(condition)
+        column_ids = select(BoardColumn.id).where(BoardColumn.board_id.in_(board_ids))
+        task_ids = select(Task.id).where(Task.column_id.in_(column_ids))
+
+        plan = [
+            (
+                "board",
+                select(Board.__table__)
+                .where(condition)
+                .order_by(Board.created_at, Board.id),
+            ),
+            (
+                "column",
+                select(BoardColumn.__table__)
+                .where(BoardColumn.board_id.in_(board_ids))
+                .order_by(BoardColumn.board_id, BoardColumn.position, BoardColumn.id),
+            ),
+            (
+                "task",
+                select(Task.__table__)
+                .where(Task.column_id.in_(column_ids))
+                .order_by(Task.column_id, Task.created_at, Task.id),
+            ),
+            (
+                "task_member",
+                select(TaskMember.__table__)
+                .where(TaskMember.task_id.in_(task_ids))
+                .order_by(TaskMember.task_id, TaskMember.id),
+            ),
+            (
+                "comment",
+                select(Comment.__table__)
+                .where(Comment.task_id.in_(task_ids))
+                .order_by(Comment.task_id, Comment.created_at, Comment.id),
+            ),
+        ]
+        for kind, statement in plan:
+            async for batch in self._stream(kind, statement):
+                yield batch
+
+    async def _stream(self, kind: str, statement: Select) -> AsyncIterator[ExportBatch]:
+        result = await self.db.stream(statement.execution_options(yield_per=YIELD_PER))
+        async for rows in result.mappings().partitions():
+            yield kind, rows
+
+
+async def get_export_repository(
+    db: AsyncSession = Depends(get_session),
+) -> ExportRepository:
+    return ExportRepository(db)
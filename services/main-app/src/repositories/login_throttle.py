@@ -0,0 +1,56 @@
+from fastapi import Depends
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.database import get_session
+from models import LoginThrottle
+
+# Часы БД, а не воркера: счётчики общие для всех процессов
+_now = func.extract("epoch", func.now())
+
+
+class LoginThrottleRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def acquire(self, key: str, interval: float, tolerance: float) -> float:
+        """
+        Шаг GCRA для ключа ``key`` одним запросом. 0 — попытка разрешена,
+        иначе — через сколько секунд будет разрешена следующая.
+        """
+        start = func.greatest(LoginThrottle.tat, _now)
+        stmt = (
+            insert(LoginThrottle)
+            .values(key=key, tat=_now + interval)
+            .on_conflict_do_update(
+                index_elements=[LoginThrottle.key],
+                set_={"tat": start + interval},
+                where=start - tolerance <= _now,
+            )
+            .returning(LoginThrottle.tat)
+        )
+        admitted = (await self.db.execute(stmt)).first() is not None
+        wait = 0.0
+        if not admitted:
+            wait = await self.db.scalar(
+                select(LoginThrottle.tat - tolerance - _now).where(
+                    LoginThrottle.key == key
+                )
+            )
+        await self.db.commit()
+        return float(wait)
+
+    async def delete_expired(self) -> int:
+        """Удаляет ключи с полными корзинами; возвращает число удалённых."""
+        result = await self.db.execute(
+            delete(LoginThrottle).where(LoginThrottle.tat < _now)
+        )
+        await self.db.commit()
+        return result.rowcount
+
+
+async def get_login_throttle_repository(
+    db: AsyncSession = Depends(get_session),
+) -> LoginThrottleRepository:
+    return LoginThrottleRepository(db)
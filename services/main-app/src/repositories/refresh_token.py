@@ -1,11 +1,169 @@
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from uuid import UUID
 
 from fastapi import Depends
-from sqlalchemy import select, update
+from sqlalchemy import (
+    CTE,
+    ColumnElement,
+    String,
+    case,
+    delete,
+    false,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from auth.memberships import Memberships
 from core.database import get_session
+from enums import TokenRotation
 from models import RefreshToken
+from repositories.user import membership_columns, to_memberships
+
+# Канал NOTIFY с отозванными jti; payload — {"jti": ..., "expires_at": ...}
+REVOKED_CHANNEL = "refresh_token_revoked"
+
+
+@dataclass(frozen=True, slots=True)
+class Rotation:
+    outcome: TokenRotation
+    # Преемник обменянного токена (для CONCURRENT)
+    replaced_by: str | None
+    expires_at: datetime
+    # Сколько токенов семейства отозвано при повторном использовании
+    family_revoked: int
+    # Членство владельца для нового access-токена — тем же запросом
+    memberships: Memberships
+
+
+def _notify(revoked: CTE):
+    """pg_notify по каждой строке ``revoked`` (token_jti, expires_at)."""
+    payload = func.json_build_object(
+        "jti", revoked.c.token_jti, "expires_at", revoked.c.expires_at
+    )
+    return func.pg_notify(REVOKED_CHANNEL, payload.cast(String))
+
+
+def _revoke_and_notify(condition: ColumnElement[bool], now: datetime):
+    """
+    UPDATE и pg_notify одним запросом. Уведомление уходит только по
+    действительно изменённым строкам и доставляется после commit.
+    """
+    revoked = (
+        update(RefreshToken)
+        .where(condition, RefreshToken.is_revoked.is_(False))
+        .values(is_revoked=True, revoked_at=now, updated_at=now)
+        .returning(RefreshToken.token_jti, RefreshToken.expires_at)
+        .cte("revoked")
+    )
+    return select(revoked.c.token_jti, revoked.c.expires_at, _notify(revoked))
+
+
+def _rotate(
+    jti: str, new_jti: str, expires_at: datetime, now: datetime, grace: timedelta
+):
+    """
+    Обмен токена одним запросом:
+
+    - ``old`` блокирует строку токена (FOR UPDATE). Параллельный обмен того
+      же токена ждёт commit первого и видит уже отозванную строку;
+    - ``rotated`` / ``inserted`` отзывают действующий токен и выпускают
+      новый в том же семействе;
+    - ``family`` — повторное использование отозванного токена: отзывается
+      всё семейство (с NOTIFY). Исключение — токен, обменянный не раньше
+      ``grace`` назад: это параллельный запрос, ему отдаётся преемник.
+
+    Заодно читается членство владельца в командах — для нового access-токена.
+    """
+    old = (
+        select(
+            RefreshToken.id,
+            RefreshToken.user_id,
+            RefreshToken.family_id,
+            RefreshToken.expires_at,
+            RefreshToken.is_revoked,
+            RefreshToken.revoked_at,
+            RefreshToken.replaced_by,
+        )
+        .where(RefreshToken.token_jti == jti)
+        .with_for_update()
+        .cte("old")
+    )
+    active = old.c.is_revoked.is_(False)
+    concurrent = (old.c.replaced_by.is_not(None)) & (old.c.revoked_at >= now - grace)
+
+    rotated = (
+        update(RefreshToken)
+        .where(RefreshToken.id == old.c.id, active, old.c.expires_at > now)
+        .values(is_revoked=True, revoked_at=now, replaced_by=new_jti, updated_at=now)
+        .returning(RefreshToken.user_id, RefreshToken.family_id)
+        .cte("rotated")
+    )
+    inserted = (
+        insert(RefreshToken)
+        .from_select(
+            [
+                RefreshToken.id,
+                RefreshToken.user_id,
+                RefreshToken.token_jti,
+                RefreshToken.family_id,
+                RefreshToken.expires_at,
+                RefreshToken.is_revoked,
+                RefreshToken.created_at,
+                RefreshToken.updated_at,
+            ],
+            select(
+                literal(uuid.uuid4(), RefreshToken.id.type),
+                rotated.c.user_id,
+                literal(new_jti),
+                rotated.c.family_id,
+                literal(expires_at, RefreshToken.expires_at.type),
+                false(),
+                literal(now, RefreshToken.created_at.type),
+                literal(now, RefreshToken.updated_at.type),
+            ),
+        )
+        .returning(RefreshToken.id)
+        .cte("inserted")
+    )
+    family = (
+        update(RefreshToken)
+        .where(
+            RefreshToken.family_id == old.c.family_id,
+            RefreshToken.is_revoked.is_(False),
+            old.c.is_revoked.is_(True),
+            or_(old.c.replaced_by.is_(None), old.c.revoked_at < now - grace),
+        )
+        .values(is_revoked=True, revoked_at=now, updated_at=now)
+        .returning(RefreshToken.token_jti, RefreshToken.expires_at)
+        .cte("family")
+    )
+
+    outcome = case(
+        (active & (old.c.expires_at <= now), TokenRotation.EXPIRED.value),
+        (active, TokenRotation.ROTATED.value),
+        (concurrent, TokenRotation.CONCURRENT.value),
+        else_=TokenRotation.REUSED.value,
+    )
+    notified = select(func.count(_notify(family))).scalar_subquery()
+    return (
+        select(
+            outcome.label("outcome"),
+            old.c.replaced_by,
+            old.c.expires_at,
+            notified.label("family_revoked"),
+            *membership_columns(old.c.user_id),
+        )
+        .select_from(old)
+        # Изменяющие CTE выполняются, даже если основной запрос их не читает
+        .add_cte(inserted)
+    )
 
 
 class RefreshTokenRepository:
@@ -24,38 +182,82 @@ class RefreshTokenRepository:
         )
         return result.scalar_one_or_none()
 
-    async def revoke(self, jti: str) -> None:
-        await self.db.execute(
-            update(RefreshToken)
+    async def rotate(
+        self, jti: str, new_jti: str, expires_at: datetime, grace: timedelta
+    ) -> Rotation | None:
+        """Обменивает токен ``jti`` на ``new_jti`` одним запросом; None — токена нет."""
+        result = await self.db.execute(
+            _rotate(jti, new_jti, expires_at, datetime.utcnow(), grace)
+        )
+        row = result.first()
+        await self.db.commit()
+        if row is None:
+            return None
+        return Rotation(
+            outcome=TokenRotation(row.outcome),
+            replaced_by=row.replaced_by,
+            expires_at=row.expires_at,
+            family_revoked=row.family_revoked,
+            memberships=to_memberships(row.membership_epoch, row.team_ids),
+        )
+
+    async def revoke_family(self, jti: str) -> list[tuple[str, datetime]]:
+        """
+        Отзывает семейство токена ``jti`` (выход из сессии). Возвращает
+        (jti, expires_at) токенов, отозванных этим вызовом.
+        """
+        family_id = (
+            select(RefreshToken.family_id)
             .where(RefreshToken.token_jti == jti)
-            .values(is_revoked=True)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            _revoke_and_notify(RefreshToken.family_id == family_id, datetime.utcnow())
         )
+        revoked = [(row.token_jti, row.expires_at) for row in result]
         await self.db.commit()
+        return revoked
 
-    async def revoke_all_user_tokens(self, user_id: UUID) -> None:
-        await self.db.execute(
-            update(RefreshToken)
-            .where(RefreshToken.user_id == user_id)
-            .values(is_revoked=True)
+    async def revoke_all_user_tokens(self, user_id: UUID) -> list[tuple[str, datetime]]:
+        """Отзывает все токены пользователя; возвращает (jti, expires_at) отозванных."""
+        result = await self.db.execute(
+            _revoke_and_notify(RefreshToken.user_id == user_id, datetime.utcnow())
         )
+        revoked = [(row.token_jti, row.expires_at) for row in result]
         await self.db.commit()
+        return revoked
 
-    async def delete_expired(self) -> None:
+    async def get_revoked(self) -> list[tuple[str, datetime]]:
         """
-        Удалить все истекшие токены из БД (очистка). Вызывать периодически
-            для очистки старых записей.#todo celery or background task
+        Отозванные выходом или при повторном использовании, но ещё не
+        истёкшие токены: (jti, expires_at). Обменянные токены (replaced_by)
+        не входят: их повторное использование должно дойти до БД.
         """
-        from datetime import datetime
-
         result = await self.db.execute(
-            select(RefreshToken).where(RefreshToken.expires_at < datetime.utcnow())
+            select(RefreshToken.token_jti, RefreshToken.expires_at).where(
+                RefreshToken.is_revoked.is_(True),
+                RefreshToken.replaced_by.is_(None),
+                RefreshToken.expires_at > datetime.utcnow(),
+            )
         )
-        expired_tokens = result.scalars().all()
-
-        for token in expired_tokens:
-            await self.db.delete(token)
+        return [(row.token_jti, row.expires_at) for row in result]
 
+    async def delete_expired(self, batch_size: int = 1000) -> int:
+        """
+        Удаляет одну пачку истёкших токенов; возвращает число удалённых.
+        Строки, заблокированные другими транзакциями, пропускаются.
+        """
+        expired = (
+            select(RefreshToken.id)
+            .where(RefreshToken.expires_at < datetime.utcnow())
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.db.execute(
+            delete(RefreshToken).where(RefreshToken.id.in_(expired.scalar_subquery()))
+        )
         await self.db.commit()
+        return result.rowcount
 
     async def get_user_tokens(
         self, user_id: UUID, skip: int = 0, limit: int = 100
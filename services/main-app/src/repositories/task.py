@@ -1,85 +1,142 @@
+from collections.abc import Sequence
+from functools import lru_cache
 from uuid import UUID
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import (
+    ARRAY,
+    ColumnElement,
+    Integer,
+    Row,
+    Select,
+    and_,
+    any_,
+    bindparam,
+    func,
+    or_,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.database import get_session
 from models import Task
-
-
-class TaskRepository:
-    def __init__(self, db: AsyncSession):
-        self.db = db
-
-    async def get_by_id(self, task_id: UUID) -> Task | None:
-        result = await self.db.execute(select(Task).where(Task.id == task_id))
-
-        return result.scalar_one_or_none()
-
-    async def get_all(self, skip: int = 0, limit: int = 100) -> list[Task]:
-        result = await self.db.execute(select(Task).offset(skip).limit(limit))
-
-        return result.scalars().all()
+from repositories.base import BaseRepository
+
+
+class TaskRepository(BaseRepository[Task]):
+    model = Task
+
+    async def get_by_id(
+        self, task_id: UUID, fields: Sequence[str] | None = None
+    ) -> Task | Row | None:
+        if fields:
+            result = await self.db.execute(
+                _select_fields_by_id(tuple(fields)), {"id": task_id}
+            )
+            return result.first()
+
+        return await super().get_by_id(task_id)
+
+    async def get_by_ids(
+        self, task_ids: list[UUID], fields: Sequence[str] | None = None
+    ) -> list[Task] | list[Row]:
+        if fields:
+            result = await self.db.execute(
+                _select_fields_by_ids(tuple(fields)), {"ids": task_ids}
+            )
+            rows = {row.id: row for row in result}
+            return [rows[task_id] for task_id in task_ids if task_id in rows]
+
+        return await super().get_by_ids(task_ids)
+
+    async def get_all(
+        self, skip: int = 0, limit: int = 100, fields: Sequence[str] | None = None
+    ) -> list[Task] | list[Row]:
+        """
+        С ``fields`` выбираются только эти колонки и возвращаются ``Row``
+        без загрузки ORM-объектов — например, без тяжёлого description.
+        """
+        if fields:
+            result = await self.db.execute(
+                _select_fields_page(tuple(fields)), {"skip": skip, "limit": limit}
+            )
+            return result.all()
+
+        return await super().get_all(skip=skip, limit=limit)
 
     async def get_by_user_id(
         self, user_id: UUID, skip: int = 0, limit: int = 100
     ) -> list[Task]:
+        return await self._get_page_by("user_id", user_id, skip, limit)
+
+    async def get_by_column_id(
+        self, column_id: UUID, skip: int = 0, limit: int = 100
+    ) -> list[Task]:
+        return await self._get_page_by("column_id", column_id, skip, limit)
+
+    async def count_after_move(
+        self, column_id: UUID, ids: list[UUID] | None, filters: dict | None
+    ) -> int:
+        """Сколько задач окажется в колонке, если перенести в неё выбранные."""
         result = await self.db.execute(
-            select(Task).where(Task.user_id == user_id).offset(skip).limit(limit)
+            select(func.count())
+            .select_from(Task)
+            .where(or_(Task.column_id == column_id, _selection(ids, filters)))
         )
 
-        return result.scalars().all()
+        return result.scalar_one()
 
-    async def get_by_column_id(
-        self, column_id: UUID, skip: int = 0, limit: int = 100
+    async def bulk_update(
+        self, values: dict, ids: list[UUID] | None, filters: dict | None
     ) -> list[Task]:
+        """Один UPDATE ... WHERE ... RETURNING по списку id или фильтру."""
         result = await self.db.execute(
-            select(Task).where(Task.column_id == column_id).offset(skip).limit(limit)
+            update(Task)
+            .where(_selection(ids, filters))
+            .values(**values)
+            .returning(Task)
         )
 
         return result.scalars().all()
 
-    async def create(self, task_date: dict) -> Task:
-        task = Task(**task_date)
-        self.db.add(task)
-        await self.db.commit()
-        await self.db.refresh(task)
-        return task
+    async def search_by_title(
+        self, title_pattern: str, skip: int = 0, limit: int = 100
+    ) -> list[Task]:
+        return await self._search("title", title_pattern, skip, limit)
 
-    async def update(self, task_id: UUID, task_date: dict) -> Task:
-        task = await self.get_by_id(task_id)
 
-        if task:
-            for key, value in task_date.items():
-                setattr(task, key, value)
+def _columns(fields: Sequence[str]) -> list[ColumnElement]:
+    return [Task.__table__.c[name] for name in fields]
 
-            await self.db.commit()
-            await self.db.refresh(task)
 
-        return task
+# Запросы по набору колонок кэшируются как и запросы BaseRepository; наборы
+# приходят из ?fields= и ограничены колонками задачи, но кэш всё же с лимитом
+@lru_cache(maxsize=256)
+def _select_fields_by_id(fields: tuple[str, ...]) -> Select:
+    return select(*_columns(fields)).where(Task.id == bindparam("id"))
 
-    async def delete(self, task_id: UUID) -> bool:
-        task = await self.get_by_id(task_id)
 
-        if task:
-            await self.db.delete(task)
-            await self.db.commit()
+@lru_cache(maxsize=256)
+def _select_fields_by_ids(fields: tuple[str, ...]) -> Select:
+    ids = bindparam("ids", type_=ARRAY(Task.__table__.c.id.type))
+    return select(*_columns(fields)).where(Task.id == any_(ids))
 
-            return True
 
-        return False
+@lru_cache(maxsize=256)
+def _select_fields_page(fields: tuple[str, ...]) -> Select:
+    return (
+        select(*_columns(fields))
+        .offset(bindparam("skip", type_=Integer))
+        .limit(bindparam("limit", type_=Integer))
+    )
 
-    async def search_by_title(
-        self, title_pattern: str, skip: int = 0, limit: int = 100
-    ) -> list[Task]:
-        result = await self.db.execute(
-            select(Task)
-            .where(Task.title.ilike(f"%{title_pattern}%"))
-            .offset(skip)
-            .limit(limit)
-        )
-        return result.scalars().all()
+
+def _selection(ids: list[UUID] | None, filters: dict | None) -> ColumnElement[bool]:
+    if ids is not None:
+        # Один параметр-массив вместо IN (...) с параметром на каждый id
+        return Task.id == any_(ids)
+    return and_(*(getattr(Task, key) == value for key, value in filters.items()))
 
 
 async def get_task_reposetory(
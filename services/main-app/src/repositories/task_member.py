@@ -17,11 +17,9 @@ class TaskMemberRepository:
     async def create(self, task_member: TaskMember) -> TaskMember:
         self.db.add(task_member)
         try:
-            await self.db.commit()
-            await self.db.refresh(task_member)
+            await self.db.flush()
             return task_member
         except IntegrityError as e:
-            await self.db.rollback()
             if "uq_task_member_user_task" in str(e.orig):
                 raise TaskMemberAlreadyExistsError(
                     task_member.task_id, task_member.user_id
@@ -49,7 +47,6 @@ class TaskMemberRepository:
             TaskMember.task_id == task_id, TaskMember.user_id == user_id
         )
         await self.db.execute(stmt)
-        await self.db.commit()
 
 
 async def get_task_member_repository(
@@ -1,43 +1,40 @@
 from uuid import UUID
 
 from fastapi import Depends
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.database import get_session
 from exceptions import TeamNotFoundError
 from models import Team
+from repositories.base import BaseRepository
 
 
-class TeamRepository:
-    def __init__(self, db: AsyncSession):
-        self.db = db
+class TeamRepository(BaseRepository[Team]):
+    """
+    Команды создаются и меняются сущностями, а не словарями: ``add`` /
+    ``save`` / ``remove`` вместо ``create`` / ``update`` / ``delete`` базы.
+    """
+
+    model = Team
 
     async def get_by_id(self, team_id: UUID) -> Team:
-        result = await self.db.execute(select(Team).where(Team.id == team_id))
-        team = result.scalar_one_or_none()
+        team = await super().get_by_id(team_id)
         if not team:
             raise TeamNotFoundError(team_id)
         return team
 
-    async def get_all(self, skip: int = 0, limit: int = 100) -> list[Team]:
-        result = await self.db.execute(select(Team).offset(skip).limit(limit))
-        return result.scalars().all()
-
-    async def create(self, team: Team) -> Team:
+    async def add(self, team: Team) -> Team:
         self.db.add(team)
-        await self.db.commit()
-        await self.db.refresh(team)
+        await self.db.flush()
         return team
 
-    async def update(self, team: Team) -> Team:
-        await self.db.commit()
-        await self.db.refresh(team)
+    async def save(self, team: Team) -> Team:
+        await self.db.flush()
         return team
 
-    async def delete(self, team: Team) -> None:
+    async def remove(self, team: Team) -> None:
         await self.db.delete(team)
-        await self.db.commit()
+        await self.db.flush()
 
 
 async def get_team_repository(
@@ -17,9 +17,8 @@ class TeamMemberRepository:
     async def create(self, team_member: TeamMember) -> TeamMember:
         self.db.add(team_member)
         try:
-            await self.db.commit()
+            await self.db.flush()
         except IntegrityError as e:
-            await self.db.rollback()
             error_str = str(e.orig)
             if "uq_team_member_user_id_team_id" in error_str:
                 raise TeamMemberConflictError(
@@ -30,7 +29,6 @@ class TeamMemberRepository:
             if "user_id" in error_str and "foreign key" in error_str.lower():
                 raise UserNotFoundError(team_member.user_id) from e
             raise
-        await self.db.refresh(team_member)
         return team_member
 
     async def get_many(
@@ -54,7 +52,6 @@ class TeamMemberRepository:
             TeamMember.team_id == team_id, TeamMember.user_id == user_id
         )
         await self.db.execute(stmt)
-        await self.db.commit()
 
 
 async def get_team_member_repository(
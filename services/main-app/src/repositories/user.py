@@ -1,43 +1,150 @@
+import uuid
+from datetime import datetime
+from functools import cache
 from uuid import UUID
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    bindparam,
+    false,
+    func,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from auth.memberships import Memberships
 from core.database import get_session
-from models import User
+from models import RefreshToken, TeamMember, User
+from repositories.base import BaseRepository
 
 
-class UserRepository:
-    def __init__(self, db: AsyncSession):
-        self.db = db
+def membership_columns(user_id: ColumnElement) -> tuple[ColumnElement, ColumnElement]:
+    """
+    Эпоха членства и массив id команд пользователя ``user_id`` — скалярные
+    подзапросы, читаются в одном снимке с остальным запросом.
+    """
+    epoch = select(User.membership_epoch).where(User.id == user_id)
+    team_ids = select(func.array_agg(TeamMember.team_id)).where(
+        TeamMember.user_id == user_id
+    )
+    return (
+        epoch.scalar_subquery().label("membership_epoch"),
+        team_ids.scalar_subquery().label("team_ids"),
+    )
 
-    async def get_by_id(self, user_id: UUID) -> User | None:
-        result = await self.db.execute(select(User).where(User.id == user_id))
-        return result.scalar_one_or_none()
+
+def to_memberships(epoch: int, team_ids: list[UUID] | None) -> Memberships:
+    return Memberships(epoch=epoch, team_ids=frozenset(team_ids or ()))
+
+
+class UserRepository(BaseRepository[User]):
+    """Пользователи пишутся сущностями, как и команды (см. ``TeamRepository``)."""
+
+    model = User
+
+    @classmethod
+    @cache
+    def _select_by_email(cls) -> Select:
+        return select(cls.model).where(cls.model.email == bindparam("email"))
 
     async def get_by_email(self, email: str) -> User | None:
-        result = await self.db.execute(select(User).where(User.email == email))
+        result = await self.db.execute(self._select_by_email(), {"email": email})
         return result.scalar_one_or_none()
 
-    async def create(self, user: User) -> User:
+    async def get_memberships(self, user_id: UUID) -> Memberships | None:
+        """Команды пользователя и эпоха членства одним запросом; None — нет пользователя."""
+        result = await self.db.execute(
+            select(*membership_columns(literal(user_id, User.id.type)))
+        )
+        row = result.one()
+        if row.membership_epoch is None:
+            return None
+        return to_memberships(row.membership_epoch, row.team_ids)
+
+    async def add(self, user: User) -> User:
         self.db.add(user)
-        await self.db.commit()
-        await self.db.refresh(user)
+        await self.db.flush()
         return user
 
-    async def get_all(self, skip: int = 0, limit: int = 100) -> list[User]:
-        result = await self.db.execute(select(User).offset(skip).limit(limit))
-        return list(result.scalars().all())
+    async def replace_password_hash(
+        self, user_id: UUID, old_hash: str, new_hash: str
+    ) -> bool:
+        """Заменяет хэш, только если он всё ещё ``old_hash``; True — заменён."""
+        result = await self.db.execute(
+            update(User)
+            .where(User.id == user_id, User.hashed_password == old_hash)
+            .values(hashed_password=new_hash)
+        )
+        await self.db.commit()
+        return result.rowcount == 1
 
-    async def update(self, user: User) -> User:
+    async def register(self, user: User, jti: str, expires_at: datetime) -> int | None:
+        """
+        Создаёт пользователя и его первый refresh-токен одним запросом.
+        Возвращает эпоху членства нового пользователя; None — email занят.
+        """
+        now = datetime.utcnow()
+        created = (
+            insert(User)
+            .values(
+                id=user.id,
+                name=user.name,
+                email=user.email,
+                hashed_password=user.hashed_password,
+                created_at=now,
+                updated_at=now,
+            )
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User.id, User.membership_epoch)
+            .cte("created")
+        )
+        # Строка токена появляется, только если пользователь вставлен
+        token = (
+            insert(RefreshToken)
+            .from_select(
+                [
+                    RefreshToken.id,
+                    RefreshToken.user_id,
+                    RefreshToken.token_jti,
+                    RefreshToken.family_id,
+                    RefreshToken.expires_at,
+                    RefreshToken.is_revoked,
+                    RefreshToken.created_at,
+                    RefreshToken.updated_at,
+                ],
+                select(
+                    literal(uuid.uuid4(), RefreshToken.id.type),
+                    created.c.id,
+                    literal(jti),
+                    literal(uuid.uuid4(), RefreshToken.family_id.type),
+                    literal(expires_at, RefreshToken.expires_at.type),
+                    false(),
+                    literal(now, RefreshToken.created_at.type),
+                    literal(now, RefreshToken.updated_at.type),
+                ),
+            )
+            .returning(RefreshToken.id)
+            .cte("token")
+        )
+        result = await self.db.execute(
+            select(created.c.membership_epoch).add_cte(token)
+        )
+        epoch = result.scalar_one_or_none()
         await self.db.commit()
-        await self.db.refresh(user)
+        return epoch
+
+    async def save(self, user: User) -> User:
+        await self.db.flush()
         return user
 
-    async def delete(self, user: User) -> None:
+    async def remove(self, user: User) -> None:
         await self.db.delete(user)
-        await self.db.commit()
+        await self.db.flush()
 
 
 async def get_user_repository(
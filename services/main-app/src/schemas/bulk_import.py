@@ -0,0 +1,116 @@
+import uuid
+from datetime import UTC, datetime
+from typing import Annotated, Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+
+from enums.task_status import TaskStatus
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+class ImportRecordBase(BaseModel):
+    """
+    Общие поля записей импорта. Формат совпадает с выгрузкой
+    ``/boards/{id}/export``: её можно загрузить обратно как есть.
+    """
+
+    id: UUID = Field(default_factory=uuid.uuid4)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
+
+    @field_validator("*", mode="after")
+    @classmethod
+    def naive_utc(cls, value):
+        # Колонки в БД — timestamp without time zone в UTC
+        if isinstance(value, datetime) and value.tzinfo is not None:
+            return value.astimezone(UTC).replace(tzinfo=None)
+        return value
+
+
+class ImportTeam(ImportRecordBase):
+    type: Literal["team"]
+    name: str
+    description: str | None = None
+
+
+class ImportTeamMember(ImportRecordBase):
+    type: Literal["team_member"]
+    team_id: UUID
+    user_id: UUID
+
+
+class ImportBoard(ImportRecordBase):
+    type: Literal["board"]
+    title: str
+    description: str | None = None
+    is_public: bool = False
+    owner_id: UUID
+    team_id: UUID | None = None
+
+
+class ImportColumn(ImportRecordBase):
+    type: Literal["column"]
+    title: str
+    position: int = 0
+    limit: int | None = None
+    board_id: UUID
+
+
+class ImportTask(ImportRecordBase):
+    type: Literal["task"]
+    title: str
+    description: str | None = None
+    status: TaskStatus = TaskStatus.PENDING
+    due_date: datetime | None = None
+    user_id: UUID
+    column_id: UUID
+
+
+class ImportTaskMember(ImportRecordBase):
+    type: Literal["task_member"]
+    task_id: UUID
+    user_id: UUID
+
+
+class ImportComment(ImportRecordBase):
+    type: Literal["comment"]
+    body: str
+    user_id: UUID
+    task_id: UUID
+
+
+ImportRecord = Annotated[
+    ImportTeam
+    | ImportTeamMember
+    | ImportBoard
+    | ImportColumn
+    | ImportTask
+    | ImportTaskMember
+    | ImportComment,
+    Field(discriminator="type"),
+]
+
+import_record_adapter = TypeAdapter(ImportRecord)
+
+
+class ImportRecordError(BaseModel):
+    record: int
+    error: str
+
+
+class ImportTableSummary(BaseModel):
+    staged: int = 0
+    inserted: int = 0
+    # Уже существующие id или отсутствующие родительские записи
+    skipped: int = 0
+
+
+class ImportSummary(BaseModel):
+    records: int = 0
+    invalid: int = 0
+    tables: dict[str, ImportTableSummary] = Field(default_factory=dict)
+    errors: list[ImportRecordError] = Field(default_factory=list)
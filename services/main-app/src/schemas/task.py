@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 
 from enums.task_status import TaskStatus
 
@@ -23,6 +23,39 @@ class UpdateTaskRequest(BaseModel):
     column_id: UUID | None = None
 
 
+MAX_BULK_TASK_IDS = 1000
+
+
+class BulkTaskFilter(BaseModel):
+    column_id: UUID | None = None
+    status: TaskStatus | None = None
+    user_id: UUID | None = None
+
+
+class BulkTaskChanges(BaseModel):
+    status: TaskStatus | None = None
+    column_id: UUID | None = None
+
+
+class BulkUpdateTasksRequest(BaseModel):
+    """Задачи выбираются либо списком ``ids``, либо фильтром ``filter``."""
+
+    ids: list[UUID] | None = Field(None, min_length=1, max_length=MAX_BULK_TASK_IDS)
+    filter: BulkTaskFilter | None = None
+    changes: BulkTaskChanges
+
+    @model_validator(mode="after")
+    def check_selection(self):
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Exactly one of `ids` or `filter` must be provided")
+        # Пустой фильтр обновил бы все задачи в системе
+        if self.filter is not None and not self.filter.model_dump(exclude_none=True):
+            raise ValueError("`filter` must contain at least one condition")
+        if not self.changes.model_dump(exclude_none=True):
+            raise ValueError("`changes` must contain at least one field")
+        return self
+
+
 class TaskResponse(BaseModel):
     id: UUID
     title: str
@@ -33,3 +66,8 @@ class TaskResponse(BaseModel):
     column_id: UUID
     created_at: datetime
     updated_at: datetime
+
+
+class BulkUpdateTasksResponse(BaseModel):
+    updated: int
+    tasks: list[TaskResponse]
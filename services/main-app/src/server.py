@@ -0,0 +1,97 @@
+"""
+Запуск приложения в продакшене: управляющий процесс uvicorn и воркеры.
+
+    PYTHONPATH=src python -m server
+    PYTHONPATH=src python -m server --port 8080 --workers 4
+
+Число воркеров, перезапуск после N запросов и время на плавную остановку
+берутся из ``[server_settings]`` в settings.toml. На SIGTERM / SIGINT
+управляющий процесс останавливает воркеры: каждый перестаёт принимать
+соединения, дожидается начатых запросов (не дольше ``graceful_timeout``)
+и закрывает пул соединений с БД. Умерший или перезапущенный воркер
+супервизор поднимает заново.
+
+Перезапуск после ``max_requests`` делает ``MaxRequestsMiddleware``, а не
+``limit_max_requests`` uvicorn: разброс ``max_requests_jitter`` есть не во
+всех поддерживаемых версиях uvicorn. С одним воркером супервизора нет —
+перезапущенный процесс поднимает restart policy контейнера.
+"""
+
+import argparse
+import importlib
+import os
+import sys
+
+import uvicorn
+
+from core.config import ServerConfig, get_config
+
+APP = "main:app"
+
+
+def available_cores() -> int:
+    """Ядра, доступные процессу (с учётом taskset / cpuset контейнера)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def worker_count(server_config: ServerConfig, cores: int | None = None) -> int:
+    """
+    Воркеры асинхронные и упираются в CPU, а не в ожидание, поэтому по
+    одному на ядро, а не ``2 * cores + 1``, как для синхронных воркеров.
+    """
+    if server_config.workers:
+        return server_config.workers
+    return cores if cores is not None else available_cores()
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m server")
+    parser.add_argument("--host", help="По умолчанию app_settings.app_host")
+    parser.add_argument("--port", type=int, help="По умолчанию app_settings.app_port")
+    parser.add_argument("--workers", type=int, help="По умолчанию server_settings")
+    parser.add_argument(
+        "--no-preload",
+        action="store_true",
+        help="Не импортировать приложение в управляющем процессе",
+    )
+    return parser.parse_args(argv)
+
+
+def server_options(args: argparse.Namespace) -> dict:
+    """Аргументы ``uvicorn.run``."""
+    config = get_config()
+    server_config = config.server
+    return {
+        "host": args.host or config.app.host,
+        "port": args.port or config.app.port,
+        "workers": args.workers or worker_count(server_config),
+        "timeout_graceful_shutdown": server_config.graceful_timeout,
+        "timeout_keep_alive": server_config.keep_alive,
+        # IP клиента из X-Forwarded-For — только от доверенных прокси
+        "proxy_headers": True,
+        "forwarded_allow_ips": ",".join(server_config.forwarded_allow_ips),
+        # Воркер сообщает о готовности только после прогрева в lifespan
+        "lifespan": "on",
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    options = server_options(args)
+
+    if get_config().server.preload and not args.no_preload:
+        # Ошибка настроек или импорта видна сразу, а не в цикле перезапуска
+        # воркеров. Воркеры запускаются через spawn и импортируют
+        # приложение заново.
+        importlib.import_module(APP.partition(":")[0])
+
+    # С workers > 1 uvicorn запускает супервизор; app передаётся строкой,
+    # чтобы каждый воркер импортировал его сам
+    uvicorn.run(APP, **options)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
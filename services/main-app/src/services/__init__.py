@@ -4,6 +4,7 @@ from .task_member import TaskMemberService, get_task_member_service
 from .team import TeamService, get_team_service
 from .team_member import TeamMemberService, get_team_member_service
 from .notification import NotificationService, get_notification_service
+from .user import UserService, get_user_service
 
 __all__ = [
     "TeamService",
@@ -17,5 +18,7 @@ __all__ = [
     "CommentService",
     "get_comment_service",
     "NotificationService",
-    "get_notification_service"
+    "get_notification_service",
+    "UserService",
+    "get_user_service",
 ]
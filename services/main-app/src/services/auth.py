@@ -1,17 +1,21 @@
+import asyncio
+import math
+import uuid
 from datetime import datetime, timedelta
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 from jose import JWTError
 
-from auth.jwt import (
-    create_access_token,
-    create_refresh_token,
-    decode_token,
-    generate_jti,
-)
-from auth.security import hash_password, verify_password
-from core.config import auth_config
+from auth.issuer import IssuerError, LocalIssuer, RemoteIssuer, get_token_issuer
+from auth.jwt import access_claims, decode_token, generate_jti, refresh_claims
+from auth.memberships import Memberships
+from auth.rate_limit import LoginLimiter, get_login_limiter
+from auth.rehash import password_rehasher
+from auth.revocation import revocation_index
+from auth.security import hash_password, needs_rehash, verify_password
+from core.config import get_config
+from enums import TokenRotation
 from models import RefreshToken, User
 from repositories.refresh_token import (
     RefreshTokenRepository,
@@ -29,31 +33,55 @@ from schemas.auth_schemas import (
 
 class AuthService:
     def __init__(
-        self, user_repo: UserRepository, refresh_token_repo: RefreshTokenRepository
+        self,
+        user_repo: UserRepository,
+        refresh_token_repo: RefreshTokenRepository,
+        issuer: LocalIssuer | RemoteIssuer,
+        limiter: LoginLimiter | None = None,
     ):
         self.user_repo = user_repo
         self.refresh_token_repo = refresh_token_repo
+        self.issuer = issuer
+        self.limiter = limiter
 
     async def register(self, data: UserRegister) -> TokenPair:
-        existing_user = await self.user_repo.get_by_email(data.email)
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="User with this email already exists",
-            )
-
-        hashed_password = hash_password(data.password)
+        hashed_password = await asyncio.to_thread(hash_password, data.password)
 
         user = User(
+            id=uuid.uuid4(),
             name=data.name,
             email=data.email,
             hashed_password=hashed_password,
         )
-        user = await self.user_repo.create(user)
+        jti = generate_jti()
+        expires_at = datetime.utcnow() + timedelta(
+            days=get_config().auth.refresh_token_expire_days
+        )
+        # Проверка email, пользователь и refresh-токен — одним запросом:
+        # параллельная регистрация того же email получает конфликт, а не 500
+        epoch = await self.user_repo.register(user, jti, expires_at)
+        if epoch is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="User with this email already exists",
+            )
 
-        return await self._create_token_pair(user.id)
+        # Новый пользователь ни в одной команде не состоит
+        memberships = Memberships(epoch=epoch, team_ids=frozenset())
+        return await self._issue_pair(user.id, jti, memberships)
+
+    async def login(self, data: UserLogin, client_ip: str | None = None) -> TokenPair:
+        # До поиска пользователя и проверки пароля: перебор не должен
+        # стоить серверу хэширования
+        if self.limiter is not None:
+            wait = await self.limiter.check(client_ip, data.email)
+            if wait > 0:
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Too many login attempts",
+                    headers={"Retry-After": str(math.ceil(wait))},
+                )
 
-    async def login(self, data: UserLogin) -> TokenPair:
         user = await self.user_repo.get_by_email(data.email)
         if not user:
             raise HTTPException(
@@ -61,13 +89,21 @@ class AuthService:
                 detail="Incorrect email or password",
             )
 
-        if not verify_password(data.password, user.hashed_password):
+        # Стоимость хэша настраивается, и проверка не должна держать цикл
+        # событий — она идёт в пуле потоков
+        if not await asyncio.to_thread(
+            verify_password, data.password, user.hashed_password
+        ):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password",
             )
 
-        return await self._create_token_pair(user.id)
+        if needs_rehash(user.hashed_password):
+            password_rehasher.schedule(user.id, user.hashed_password, data.password)
+
+        memberships = await self.user_repo.get_memberships(user.id)
+        return await self._create_token_pair(user.id, memberships)
 
     async def refresh(self, data: RefreshRequest) -> TokenPair:
         try:
@@ -81,33 +117,51 @@ class AuthService:
                 detail="Invalid or expired refresh token",
             ) from None
 
-        token_in_db = await self.refresh_token_repo.get_by_jti(jti)
+        if revocation_index.is_revoked(jti):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Refresh token has been revoked",
+            )
 
-        if not token_in_db:
+        auth_config = get_config().auth
+        new_jti = generate_jti()
+        expires_at = datetime.utcnow() + timedelta(
+            days=auth_config.refresh_token_expire_days
+        )
+        # Одна инструкция: отзыв старого токена и выпуск нового либо
+        # отзыв семейства при повторном использовании
+        rotation = await self.refresh_token_repo.rotate(
+            jti,
+            new_jti,
+            expires_at,
+            grace=timedelta(seconds=auth_config.rotation_grace_seconds),
+        )
+
+        if rotation is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Refresh token not found",
             )
 
-        if token_in_db.is_revoked:
+        if rotation.outcome is TokenRotation.EXPIRED:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Refresh token has been revoked",
+                detail="Refresh token has expired",
             )
 
-        if token_in_db.expires_at < datetime.utcnow():
+        if rotation.outcome is TokenRotation.REUSED:
+            revocation_index.revoke(jti, rotation.expires_at)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Refresh token has expired",
+                detail="Refresh token has been revoked",
             )
 
-        access_token = create_access_token(user_id)
+        if rotation.outcome is TokenRotation.CONCURRENT:
+            # Токен только что обменян параллельным запросом — отдаём тот
+            # же преемник, семейство остаётся действующим
+            new_jti = rotation.replaced_by
 
-        return TokenPair(
-            access_token=access_token,
-            refresh_token=data.refresh_token,  # старый refresh
-            token_type="bearer",
-        )
+        return await self._issue_pair(user_id, new_jti, rotation.memberships)
 
     async def logout(self, data: LogoutRequest) -> None:
         try:
@@ -120,15 +174,21 @@ class AuthService:
                 detail="Invalid refresh token",
             ) from None
 
-        await self.refresh_token_repo.revoke(jti)
+        if revocation_index.is_revoked(jti):
+            return
+
+        revoked = await self.refresh_token_repo.revoke_family(jti)
+        for revoked_jti, expires_at in revoked:
+            revocation_index.revoke(revoked_jti, expires_at)
 
-    async def _create_token_pair(self, user_id: UUID) -> TokenPair:
-        access_token = create_access_token(user_id)
+    async def _create_token_pair(
+        self, user_id: UUID, memberships: Memberships | None = None
+    ) -> TokenPair:
         jti = generate_jti()
-        refresh_token = create_refresh_token(user_id, jti)
+        token_pair = await self._issue_pair(user_id, jti, memberships)
 
         expires_at = datetime.utcnow() + timedelta(
-            days=auth_config.refresh_token_expire_days
+            days=get_config().auth.refresh_token_expire_days
         )
         token_in_db = RefreshToken(
             user_id=user_id,
@@ -138,6 +198,21 @@ class AuthService:
         )
         await self.refresh_token_repo.create(token_in_db)
 
+        return token_pair
+
+    async def _issue_pair(
+        self, user_id: UUID, jti: str, memberships: Memberships | None = None
+    ) -> TokenPair:
+        try:
+            access_token, refresh_token = await self.issuer.issue(
+                access_claims(user_id, memberships), refresh_claims(user_id, jti)
+            )
+        except IssuerError:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Token issuer is unavailable",
+            ) from None
+
         return TokenPair(
             access_token=access_token,
             refresh_token=refresh_token,
@@ -148,5 +223,7 @@ class AuthService:
 async def get_auth_service(
     user_repo: UserRepository = Depends(get_user_repository),
     refresh_token_repo: RefreshTokenRepository = Depends(get_refresh_token_repository),
+    issuer: LocalIssuer | RemoteIssuer = Depends(get_token_issuer),
+    limiter: LoginLimiter | None = Depends(get_login_limiter),
 ) -> AuthService:
-    return AuthService(user_repo, refresh_token_repo)
+    return AuthService(user_repo, refresh_token_repo, issuer, limiter)
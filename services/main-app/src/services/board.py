@@ -2,18 +2,23 @@ from uuid import UUID
 
 from fastapi import Depends
 
+from core.unit_of_work import UnitOfWork, get_unit_of_work
 from models import Board
 from repositories.board import BoardRepository, get_board_repository
 from schemas.board import CreateBoardRequest, UpdateBoardRequest
 
 
 class BoardService:
-    def __init__(self, repository: BoardRepository):
+    def __init__(self, repository: BoardRepository, uow: UnitOfWork):
         self.repository = repository
+        self.uow = uow
 
     async def get(self, board_id: UUID) -> Board | None:
         return await self.repository.get_by_id(board_id)
 
+    async def get_by_ids(self, board_ids: list[UUID]) -> list[Board]:
+        return await self.repository.get_by_ids(list(dict.fromkeys(board_ids)))
+
     async def get_many(self, skip: int = 0, limit: int = 100) -> list[Board]:
         return await self.repository.get_all(skip=skip, limit=limit)
 
@@ -25,7 +30,8 @@ class BoardService:
             "owner_id": board_data.owner_id,
             "team_id": board_data.team_id,
         }
-        return await self.repository.create(data)
+        async with self.uow:
+            return await self.repository.create(data)
 
     async def update(self, board_id: UUID, board_data: UpdateBoardRequest) -> Board:
         data = {}
@@ -38,13 +44,16 @@ class BoardService:
         if board_data.team_id is not None:
             data["team_id"] = board_data.team_id
 
-        return await self.repository.update(board_id, data)
+        async with self.uow:
+            return await self.repository.update(board_id, data)
 
     async def delete(self, board_id: UUID) -> bool:
-        return await self.repository.delete(board_id)
+        async with self.uow:
+            return await self.repository.delete(board_id)
 
 
 async def get_board_service(
     repository: BoardRepository = Depends(get_board_repository),
+    uow: UnitOfWork = Depends(get_unit_of_work),
 ) -> BoardService:
-    return BoardService(repository)
+    return BoardService(repository, uow)
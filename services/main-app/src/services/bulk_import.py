@@ -0,0 +1,182 @@
+import csv
+import enum
+from collections import defaultdict
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+
+from fastapi import Depends
+from pydantic import ValidationError
+
+from enums.export_format import ExportFormat
+from repositories.bulk_import import (
+    IMPORT_COLUMNS,
+    ImportRepository,
+    get_import_repository,
+)
+from schemas.bulk_import import (
+    ImportRecordError,
+    ImportSummary,
+    ImportTableSummary,
+    import_record_adapter,
+)
+
+# Записей на одну транзакцию: COPY во временные таблицы и слияние
+IMPORT_CHUNK_SIZE = 10_000
+MAX_REPORTED_ERRORS = 100
+
+
+class ImportService:
+    def __init__(self, repository: ImportRepository):
+        self.repository = repository
+
+    async def import_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        import_format: ExportFormat,
+        skip: int = 0,
+        progress: Callable[[ImportSummary], None] | None = None,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+    ) -> ImportSummary:
+        """
+        Импортирует поток NDJSON или CSV в формате выгрузки доски.
+
+        Записи валидируются по мере чтения и коммитятся пачками по
+        ``chunk_size``. После каждой пачки ``summary.records`` — номер
+        последней закоммиченной записи: передав его как ``skip``, прерванный
+        импорт можно продолжить. Повторная загрузка тех же записей ничего
+        не дублирует — строки с существующими id пропускаются.
+        """
+        summary = ImportSummary(records=skip)
+        batches: dict[str, list[tuple]] = defaultdict(list)
+        pending = 0
+
+        async for number, raw in parse_records(chunks, import_format):
+            if number <= skip:
+                continue
+
+            try:
+                record = _validate(raw, import_format)
+            except ValidationError as e:
+                summary.invalid += 1
+                if len(summary.errors) < MAX_REPORTED_ERRORS:
+                    summary.errors.append(
+                        ImportRecordError(record=number, error=_describe(e))
+                    )
+            else:
+                batches[record.type].append(_to_row(record))
+
+            pending += 1
+            if pending >= chunk_size:
+                await self._flush(batches, summary, number)
+                pending = 0
+                if progress:
+                    progress(summary)
+
+        if pending:
+            await self._flush(batches, summary, summary.records + pending)
+            if progress:
+                progress(summary)
+
+        return summary
+
+    async def _flush(
+        self, batches: dict[str, list[tuple]], summary: ImportSummary, position: int
+    ) -> None:
+        staged = {}
+        for kind, rows in batches.items():
+            if rows:
+                staged[kind] = await self.repository.stage(kind, rows)
+
+        inserted = await self.repository.merge(list(staged)) if staged else {}
+
+        for kind, count in staged.items():
+            table = summary.tables.setdefault(kind, ImportTableSummary())
+            table.staged += count
+            table.inserted += inserted[kind]
+            table.skipped += count - inserted[kind]
+
+        summary.records = position
+        batches.clear()
+
+
+async def parse_records(
+    chunks: AsyncIterable[bytes], import_format: ExportFormat
+) -> AsyncIterator[tuple[int, bytes | dict]]:
+    """
+    Разбивает поток на записи, нумеруя их с 1: для NDJSON — сырые строки,
+    для CSV — словари по заголовку без пустых полей.
+    """
+    number = 0
+    if import_format == ExportFormat.NDJSON:
+        async for line in _lines(chunks):
+            if line.strip():
+                number += 1
+                yield number, line
+        return
+
+    header = None
+    async for text in _csv_records(chunks):
+        values = next(csv.reader([text]), None)
+        if not values:
+            continue
+        if header is None:
+            header = [values[0].lstrip("\ufeff"), *values[1:]]
+            continue
+        number += 1
+        # Пустая ячейка в CSV — отсутствующее значение
+        yield (
+            number,
+            {key: value for key, value in zip(header, values, strict=False) if value},
+        )
+
+
+async def _lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    tail = b""
+    async for chunk in chunks:
+        lines = (tail + chunk).split(b"\n")
+        tail = lines.pop()
+        for line in lines:
+            yield line
+    if tail:
+        yield tail
+
+
+async def _csv_records(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """
+    Логические записи CSV. Поле в кавычках может содержать перевод строки —
+    пока число кавычек нечётное, запись продолжается на следующей строке.
+    """
+    pending = ""
+    async for line in _lines(chunks):
+        pending += line.decode() + "\n"
+        if pending.count('"') % 2 == 0:
+            yield pending.rstrip("\r\n")
+            pending = ""
+    if pending:
+        yield pending.rstrip("\r\n")
+
+
+def _validate(raw: bytes | dict, import_format: ExportFormat):
+    if import_format == ExportFormat.NDJSON:
+        return import_record_adapter.validate_json(raw)
+    return import_record_adapter.validate_python(raw)
+
+
+def _describe(error: ValidationError) -> str:
+    first = error.errors()[0]
+    location = ".".join(str(part) for part in first["loc"])
+    return f"{location}: {first['msg']}" if location else first["msg"]
+
+
+def _to_row(record) -> tuple:
+    values = []
+    for name in IMPORT_COLUMNS[record.type]:
+        value = getattr(record, name)
+        # SQLAlchemy хранит Enum по имени, COPY пишет значение как есть
+        values.append(value.name if isinstance(value, enum.Enum) else value)
+    return tuple(values)
+
+
+async def get_import_service(
+    repository: ImportRepository = Depends(get_import_repository),
+) -> ImportService:
+    return ImportService(repository)
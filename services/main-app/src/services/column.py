@@ -2,18 +2,23 @@ from uuid import UUID
 
 from fastapi import Depends
 
+from core.unit_of_work import UnitOfWork, get_unit_of_work
 from models import BoardColumn
 from repositories.column import ColumnRepository, get_column_repository
 from schemas.column import CreateColumnRequest, UpdateColumnRequest
 
 
 class ColumnService:
-    def __init__(self, repository: ColumnRepository):
+    def __init__(self, repository: ColumnRepository, uow: UnitOfWork):
         self.repository = repository
+        self.uow = uow
 
     async def get(self, column_id: UUID) -> BoardColumn | None:
         return await self.repository.get_by_id(column_id)
 
+    async def get_by_ids(self, column_ids: list[UUID]) -> list[BoardColumn]:
+        return await self.repository.get_by_ids(list(dict.fromkeys(column_ids)))
+
     async def get_many(self, skip: int = 0, limit: int = 100) -> list[BoardColumn]:
         return await self.repository.get_all(skip=skip, limit=limit)
 
@@ -24,7 +29,8 @@ class ColumnService:
             "limit": column_data.limit,
             "board_id": column_data.board_id,
         }
-        return await self.repository.create(data)
+        async with self.uow:
+            return await self.repository.create(data)
 
     async def update(
         self, column_id: UUID, column_data: UpdateColumnRequest
@@ -37,13 +43,16 @@ class ColumnService:
         if column_data.limit is not None:
             data["limit"] = column_data.limit
 
-        return await self.repository.update(column_id, data)
+        async with self.uow:
+            return await self.repository.update(column_id, data)
 
     async def delete(self, column_id: UUID) -> bool:
-        return await self.repository.delete(column_id)
+        async with self.uow:
+            return await self.repository.delete(column_id)
 
 
 async def get_column_service(
     repository: ColumnRepository = Depends(get_column_repository),
+    uow: UnitOfWork = Depends(get_unit_of_work),
 ) -> ColumnService:
-    return ColumnService(repository)
+    return ColumnService(repository, uow)
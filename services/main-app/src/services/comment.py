@@ -2,14 +2,16 @@ from uuid import UUID
 
 from fastapi import Depends
 
-from src.exceptions import CommentNotFoundError
-from src.repositories import CommentRepository, get_comment_repository
-from src.schemas import CommentCreate, CommentOut, CommentUpdate
+from core.unit_of_work import UnitOfWork, get_unit_of_work
+from exceptions import CommentNotFoundError
+from repositories import CommentRepository, get_comment_repository
+from schemas import CommentCreate, CommentOut, CommentUpdate
 
 
 class CommentService:
-    def __init__(self, repository: CommentRepository):
+    def __init__(self, repository: CommentRepository, uow: UnitOfWork):
         self.repository = repository
+        self.uow = uow
 
     async def get_all(
         self, task_id: UUID | None = None, user_id: UUID | None = None
@@ -24,12 +26,12 @@ class CommentService:
         return comment
 
     async def create(self, comment_data: CommentCreate) -> CommentOut:
-        comment = await self.repository.create(
-            body=comment_data.body,
-            user_id=comment_data.user_id,
-            task_id=comment_data.task_id,
-        )
-        return comment
+        async with self.uow:
+            return await self.repository.create(
+                body=comment_data.body,
+                user_id=comment_data.user_id,
+                task_id=comment_data.task_id,
+            )
 
     async def update(self, comment_id: UUID, comment_data: CommentUpdate) -> CommentOut:
         update_dict = {
@@ -41,18 +43,21 @@ class CommentService:
         if not update_dict:
             return await self.get_by_id(comment_id)
 
-        comment = await self.repository.update(comment_id, **update_dict)
-        if comment is None:
-            raise CommentNotFoundError(comment_id)
-        return comment
+        async with self.uow:
+            comment = await self.repository.update(comment_id, **update_dict)
+            if comment is None:
+                raise CommentNotFoundError(comment_id)
+            return comment
 
     async def delete(self, comment_id: UUID) -> None:
-        deleted = await self.repository.delete(comment_id)
-        if not deleted:
-            raise CommentNotFoundError(comment_id)
+        async with self.uow:
+            deleted = await self.repository.delete(comment_id)
+            if not deleted:
+                raise CommentNotFoundError(comment_id)
 
 
 async def get_comment_service(
     repository: CommentRepository = Depends(get_comment_repository),
+    uow: UnitOfWork = Depends(get_unit_of_work),
 ) -> CommentService:
-    return CommentService(repository)
+    return CommentService(repository, uow)
@@ -0,0 +1,121 @@
+import csv
+import enum
+import io
+from collections.abc import AsyncIterable, AsyncIterator
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import Depends
+from pydantic_core import to_json
+
+from enums.export_format import ExportFormat
+from models import Board, BoardColumn, Comment, Task, TaskMember, Team, TeamMember
+from repositories.export import (
+    ExportBatch,
+    ExportRepository,
+    get_export_repository,
+)
+
+# Чанки меньше этого размера копятся в буфере, чтобы не слать по строке
+CHUNK_SIZE = 64 * 1024
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+EXPORT_TABLES = [
+    Team.__table__,
+    TeamMember.__table__,
+    Board.__table__,
+    BoardColumn.__table__,
+    Task.__table__,
+    TaskMember.__table__,
+    Comment.__table__,
+]
+
+# В CSV все типы записей в одной таблице: колонка type и объединение полей
+CSV_HEADER = ["type"] + list(
+    dict.fromkeys(column.name for table in EXPORT_TABLES for column in table.columns)
+)
+CSV_POSITIONS = {name: position for position, name in enumerate(CSV_HEADER)}
+
+
+class ExportService:
+    def __init__(self, repository: ExportRepository):
+        self.repository = repository
+
+    def export_board(
+        self, board_id: UUID, export_format: ExportFormat
+    ) -> AsyncIterator[bytes]:
+        return encode(self.repository.stream_board(board_id), export_format)
+
+    def export_team(
+        self, team_id: UUID, export_format: ExportFormat
+    ) -> AsyncIterator[bytes]:
+        return encode(self.repository.stream_team(team_id), export_format)
+
+
+def encode(
+    batches: AsyncIterable[ExportBatch], export_format: ExportFormat
+) -> AsyncIterator[bytes]:
+    if export_format == ExportFormat.CSV:
+        return _encode_csv(batches)
+    return _encode_ndjson(batches)
+
+
+async def _encode_ndjson(batches: AsyncIterable[ExportBatch]) -> AsyncIterator[bytes]:
+    buffer = bytearray()
+    async for kind, rows in batches:
+        for row in rows:
+            buffer += to_json({"type": kind, **row})
+            buffer += b"\n"
+            if len(buffer) >= CHUNK_SIZE:
+                yield bytes(buffer)
+                buffer.clear()
+
+    if buffer:
+        yield bytes(buffer)
+
+
+async def _encode_csv(batches: AsyncIterable[ExportBatch]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADER)
+
+    async for kind, rows in batches:
+        if not rows:
+            continue
+        # Позиции колонок этой таблицы в общем заголовке — один раз на пачку
+        positions = [CSV_POSITIONS[name] for name in rows[0].keys()]
+        for row in rows:
+            line = [""] * len(CSV_HEADER)
+            line[0] = kind
+            for position, value in zip(positions, row.values(), strict=True):
+                line[position] = _csv_value(value)
+            writer.writerow(line)
+            if buffer.tell() >= CHUNK_SIZE:
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _csv_value(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+async def get_export_service(
+    repository: ExportRepository = Depends(get_export_repository),
+) -> ExportService:
+    return ExportService(repository)
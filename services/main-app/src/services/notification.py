@@ -2,14 +2,16 @@ from uuid import UUID
 
 from fastapi import Depends
 
+from core.unit_of_work import UnitOfWork, get_unit_of_work
 from models import Notification
 from repositories.notification import NotificationRepository, get_notification_reposetory
 from schemas.notification import CreateNotificationRequest, UpdateNotificationRequest
 
 
 class NotificationService:
-    def __init__(self, repository: NotificationRepository):
+    def __init__(self, repository: NotificationRepository, uow: UnitOfWork):
         self.repository = repository
+        self.uow = uow
 
     async def get(self, notification_id: UUID) -> Notification | None:
         return await self.repository.get_by_id(notification_id)
@@ -23,7 +25,8 @@ class NotificationService:
             "user_id": notification_data.user_id,
             "task_id": notification_data.task_id,
         }
-        return await self.repository.create(data)
+        async with self.uow:
+            return await self.repository.create(data)
 
     async def update(self, notification_id: UUID, notification_data: UpdateNotificationRequest) -> Notification:
         data = {}
@@ -34,13 +37,16 @@ class NotificationService:
         if notification_data.task_id is not None:
             data["task_id"] = notification_data.task_id
 
-        return await self.repository.update(notification_id, data)
+        async with self.uow:
+            return await self.repository.update(notification_id, data)
 
     async def delete(self, notification_id: UUID) -> bool:
-        return await self.repository.delete(notification_id)
+        async with self.uow:
+            return await self.repository.delete(notification_id)
 
 
 async def get_notification_service(
     repository: NotificationRepository = Depends(get_notification_reposetory),
+    uow: UnitOfWork = Depends(get_unit_of_work),
 ) -> NotificationService:
-    return NotificationService(repository)
+    return NotificationService(repository, uow)
@@ -1,27 +1,49 @@
+from collections.abc import Sequence
 from uuid import UUID
 
 from fastapi import Depends
+from sqlalchemy import Row
 
+from core.unit_of_work import UnitOfWork, get_unit_of_work
+from exceptions import ColumnLimitExceededError, ColumnNotFoundError
 from models import Task
+from repositories.column import ColumnRepository, get_column_repository
 from repositories.task import TaskRepository, get_task_reposetory
 from repositories.notification import NotificationRepository, get_notification_reposetory
-from schemas.task import CreateTaskRequest, UpdateTaskRequest
+from schemas.task import BulkUpdateTasksRequest, CreateTaskRequest, UpdateTaskRequest
 
 
 class TaskService:
     def __init__(
         self,
         task_repository: TaskRepository,
-        notification_repository: NotificationRepository
+        notification_repository: NotificationRepository,
+        column_repository: ColumnRepository,
+        uow: UnitOfWork,
     ):
         self.task_repository = task_repository
         self.notification_repository = notification_repository
+        self.column_repository = column_repository
+        self.uow = uow
 
-    async def get(self, task_id: UUID) -> Task | None:
-        return await self.task_repository.get_by_id(task_id)
+    async def get(
+        self, task_id: UUID, fields: Sequence[str] | None = None
+    ) -> Task | Row | None:
+        return await self.task_repository.get_by_id(task_id, fields=fields)
 
-    async def get_many(self, skip: int = 0, limit: int = 100) -> list[Task]:
-        return await self.task_repository.get_all(skip=skip, limit=limit)
+    async def get_by_ids(
+        self, task_ids: list[UUID], fields: Sequence[str] | None = None
+    ) -> list[Task] | list[Row]:
+        return await self.task_repository.get_by_ids(
+            list(dict.fromkeys(task_ids)), fields=fields
+        )
+
+    async def get_many(
+        self, skip: int = 0, limit: int = 100, fields: Sequence[str] | None = None
+    ) -> list[Task] | list[Row]:
+        return await self.task_repository.get_all(
+            skip=skip, limit=limit, fields=fields
+        )
 
     async def create(self, task_data: CreateTaskRequest) -> Task:
         data = {
@@ -32,16 +54,18 @@ class TaskService:
             "user_id": task_data.user_id,
             "column_id": task_data.column_id,
         }
-        task = await self.task_repository.create(data)
-        await self.notification_repository.create({
-            "message": f"Task `{task.title}` has been created",
-            "user_id": task.user_id,
-            "task_id": task.id
-        })
+        # Задача и уведомление о ней коммитятся одной транзакцией
+        async with self.uow:
+            task = await self.task_repository.create(data)
+            await self.notification_repository.create({
+                "message": f"Task `{task.title}` has been created",
+                "user_id": task.user_id,
+                "task_id": task.id
+            })
         return task
 
-    async def update(self, task_id: UUID, task_data: UpdateTaskRequest) -> Task:
-        data, notification_data = {}
+    async def update(self, task_id: UUID, task_data: UpdateTaskRequest) -> Task | None:
+        data = {}
         if task_data.title is not None:
             data["title"] = task_data.title
         if task_data.description is not None:
@@ -53,27 +77,69 @@ class TaskService:
         if task_data.column_id is not None:
             data["column_id"] = task_data.column_id
 
-        task = await self.task_repository.update(task_id, data)
-        await self.notification_repository.create({
-            "message": f"Task `{task.title}` has been updated",
-            "user_id": task.user_id,
-            "task_id": task_id
-        })
-        await self.notification_repository.update()
+        async with self.uow:
+            task = await self.task_repository.update(task_id, data)
+            if not task:
+                return None
+            await self.notification_repository.create({
+                "message": f"Task `{task.title}` has been updated",
+                "user_id": task.user_id,
+                "task_id": task_id
+            })
         return task
 
+    async def bulk_update(self, request: BulkUpdateTasksRequest) -> list[Task]:
+        values = request.changes.model_dump(exclude_none=True)
+        filters = request.filter.model_dump(exclude_none=True) if request.filter else None
+
+        # Уведомления и UPDATE коммитятся одной транзакцией; блокировка
+        # колонки держится до её конца
+        async with self.uow:
+            if request.changes.column_id is not None:
+                # Блокировка колонки сериализует параллельные переносы в неё,
+                # иначе два запроса вместе могут превысить WIP-лимит
+                column = await self.column_repository.get_by_id_for_update(
+                    request.changes.column_id
+                )
+                if not column:
+                    raise ColumnNotFoundError(request.changes.column_id)
+                if column.limit is not None:
+                    count = await self.task_repository.count_after_move(
+                        column.id, request.ids, filters
+                    )
+                    if count > column.limit:
+                        raise ColumnLimitExceededError(column.id, column.limit, count)
+
+            tasks = await self.task_repository.bulk_update(values, request.ids, filters)
+            await self.notification_repository.create_many([
+                {
+                    "message": f"Task `{task.title}` has been updated",
+                    "user_id": task.user_id,
+                    "task_id": task.id
+                }
+                for task in tasks
+            ])
+        return tasks
+
     async def delete(self, task_id: UUID) -> bool:
-        task = self.task_repository.get_by_id(task_id)
-        await self.notification_repository.create({
-            "message": f"Task `{task.title}` has been deleted",
-            "user_id": task.user_id,
-            "task_id": task_id
-        })
-        await self.task_repository.delete(task_id)
+        async with self.uow:
+            task = await self.task_repository.get_by_id(task_id)
+            if not task:
+                return False
+            await self.notification_repository.create({
+                "message": f"Task `{task.title}` has been deleted",
+                "user_id": task.user_id,
+                "task_id": task_id
+            })
+            return await self.task_repository.delete(task_id)
 
 
 async def get_task_service(
     task_repository: TaskRepository = Depends(get_task_reposetory),
-    notification_repository: NotificationRepository = Depends(get_notification_reposetory)
+    notification_repository: NotificationRepository = Depends(get_notification_reposetory),
+    column_repository: ColumnRepository = Depends(get_column_repository),
+    uow: UnitOfWork = Depends(get_unit_of_work),
 ) -> TaskService:
-    return TaskService(task_repository, notification_repository)
\ No newline at end of file
+    return TaskService(
+        task_repository, notification_repository, column_repository, uow
+    )
\ No newline at end of file
@@ -2,6 +2,7 @@ from uuid import UUID
 
 from fastapi import Depends
 
+from core.unit_of_work import UnitOfWork, get_unit_of_work
 from models import TaskMember
 from repositories.task_member import (
     TaskMemberRepository,
@@ -11,15 +12,17 @@ from schemas.task_member import CreateTaskMemberRequest
 
 
 class TaskMemberService:
-    def __init__(self, repository: TaskMemberRepository):
+    def __init__(self, repository: TaskMemberRepository, uow: UnitOfWork):
         self.repository = repository
+        self.uow = uow
 
     async def create(self, data: CreateTaskMemberRequest) -> TaskMember:
         task_member = TaskMember(
             task_id=data.task_id,
             user_id=data.user_id,
         )
-        return await self.repository.create(task_member)
+        async with self.uow:
+            return await self.repository.create(task_member)
 
     async def get_many(
         self,
@@ -36,10 +39,12 @@ class TaskMemberService:
         )
 
     async def delete(self, task_id: UUID, user_id: UUID) -> None:
-        await self.repository.delete(task_id, user_id)
+        async with self.uow:
+            await self.repository.delete(task_id, user_id)
 
 
 async def get_task_member_service(
     repository: TaskMemberRepository = Depends(get_task_member_repository),
+    uow: UnitOfWork = Depends(get_unit_of_work),
 ) -> TaskMemberService:
-    return TaskMemberService(repository)
+    return TaskMemberService(repository, uow)
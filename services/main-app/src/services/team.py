@@ -2,41 +2,50 @@ from uuid import UUID
 
 from fastapi import Depends
 
+from core.unit_of_work import UnitOfWork, get_unit_of_work
 from models import Team
 from repositories.team import TeamRepository, get_team_repository
 from schemas.team import CreateTeamRequest, UpdateTeamRequest
 
 
 class TeamService:
-    def __init__(self, repository: TeamRepository):
+    def __init__(self, repository: TeamRepository, uow: UnitOfWork):
         self.repository = repository
+        self.uow = uow
 
     async def get(self, team_id: UUID) -> Team:
         return await self.repository.get_by_id(team_id)
 
+    async def get_by_ids(self, team_ids: list[UUID]) -> list[Team]:
+        return await self.repository.get_by_ids(list(dict.fromkeys(team_ids)))
+
     async def get_many(self, skip: int = 0, limit: int = 100) -> list[Team]:
         return await self.repository.get_all(skip=skip, limit=limit)
 
     async def create(self, team_data: CreateTeamRequest) -> Team:
         team = Team(name=team_data.name, description=team_data.description)
-        return await self.repository.create(team)
+        async with self.uow:
+            return await self.repository.add(team)
 
     async def update(self, team_id: UUID, team_data: UpdateTeamRequest) -> Team:
-        team = await self.repository.get_by_id(team_id)
+        async with self.uow:
+            team = await self.repository.get_by_id(team_id)
 
-        if team_data.name is not None:
-            team.name = team_data.name
-        if team_data.description is not None:
-            team.description = team_data.description
+            if team_data.name is not None:
+                team.name = team_data.name
+            if team_data.description is not None:
+                team.description = team_data.description
 
-        return await self.repository.update(team)
+            return await self.repository.save(team)
 
     async def delete(self, team_id: UUID) -> None:
-        team = await self.repository.get_by_id(team_id)
-        await self.repository.delete(team)
+        async with self.uow:
+            team = await self.repository.get_by_id(team_id)
+            await self.repository.remove(team)
 
 
 async def get_team_service(
     repository: TeamRepository = Depends(get_team_repository),
+    uow: UnitOfWork = Depends(get_unit_of_work),
 ) -> TeamService:
-    return TeamService(repository)
+    return TeamService(repository, uow)
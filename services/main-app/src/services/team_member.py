@@ -2,6 +2,7 @@ from uuid import UUID
 
 from fastapi import Depends
 
+from core.unit_of_work import UnitOfWork, get_unit_of_work
 from models import TeamMember
 from repositories.team_member import (
     TeamMemberRepository,
@@ -11,15 +12,17 @@ from schemas.team_member import CreateTeamMemberRequest
 
 
 class TeamMemberService:
-    def __init__(self, repository: TeamMemberRepository):
+    def __init__(self, repository: TeamMemberRepository, uow: UnitOfWork):
         self.repository = repository
+        self.uow = uow
 
     async def create(self, data: CreateTeamMemberRequest) -> TeamMember:
         team_member = TeamMember(
             team_id=data.team_id,
             user_id=data.user_id,
         )
-        return await self.repository.create(team_member)
+        async with self.uow:
+            return await self.repository.create(team_member)
 
     async def get_many(
         self,
@@ -36,10 +39,12 @@ class TeamMemberService:
         )
 
     async def delete(self, team_id: UUID, user_id: UUID) -> None:
-        await self.repository.delete(team_id, user_id)
+        async with self.uow:
+            await self.repository.delete(team_id, user_id)
 
 
 async def get_team_member_service(
     repository: TeamMemberRepository = Depends(get_team_member_repository),
+    uow: UnitOfWork = Depends(get_unit_of_work),
 ) -> TeamMemberService:
-    return TeamMemberService(repository)
+    return TeamMemberService(repository, uow)
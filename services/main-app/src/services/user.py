@@ -0,0 +1,23 @@
+from uuid import UUID
+
+from fastapi import Depends
+
+from models import User
+from repositories.user import UserRepository, get_user_repository
+
+
+class UserService:
+    def __init__(self, repository: UserRepository):
+        self.repository = repository
+
+    async def get(self, user_id: UUID) -> User | None:
+        return await self.repository.get_by_id(user_id)
+
+    async def get_by_ids(self, user_ids: list[UUID]) -> list[User]:
+        return await self.repository.get_by_ids(list(dict.fromkeys(user_ids)))
+
+
+async def get_user_service(
+    repository: UserRepository = Depends(get_user_repository),
+) -> UserService:
+    return UserService(repository)
@@ -61,9 +61,7 @@ class TestGetMe:
         """Запрос с истёкшим токеном должен вернуть 401."""
         from datetime import datetime, timedelta
 
-        from jose import jwt
-
-        from core.config import auth_config
+        from auth.jwt import encode_token
 
         user = User(
             name="Expired Token User",
@@ -80,11 +78,7 @@ class TestGetMe:
             "type": "access",
             "exp": datetime.utcnow() - timedelta(hours=1),  # Истёк час назад
         }
-        expired_token = jwt.encode(
-            expired_payload,
-            auth_config.secret_key,
-            algorithm=auth_config.algorithm,
-        )
+        expired_token = encode_token(expired_payload)
 
         response = await http_client.get(
             "/api/v1/auth/me",
@@ -0,0 +1,162 @@
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from auth.dependencies import get_current_memberships
+from auth.jwt import access_claims, create_access_token, decode_token
+from auth.memberships import Memberships
+from auth.security import hash_password
+from core.config import get_config
+from exceptions import InvalidCredentialsError
+from models import Team, TeamMember, User
+from repositories.user import UserRepository
+
+
+async def _create_member(db_session: AsyncSession, email: str) -> tuple[User, Team]:
+    user = User(name="Member", email=email, hashed_password=hash_password("Pass123!"))
+    team = Team(name="Team")
+    db_session.add_all([user, team])
+    await db_session.commit()
+    db_session.add(TeamMember(team_id=team.id, user_id=user.id))
+    await db_session.commit()
+    await db_session.refresh(user)
+    return user, team
+
+
+class TestMembershipClaims:
+    """Команды пользователя в access-токене"""
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_login_embeds_memberships(
+        self, http_client: AsyncClient, db_session: AsyncSession
+    ):
+        """Токен после логина несёт команды и текущую эпоху членства."""
+        user, team = await _create_member(db_session, "member-login@test.com")
+
+        response = await http_client.post(
+            "/api/v1/auth/login",
+            json={"email": "member-login@test.com", "password": "Pass123!"},
+        )
+
+        assert response.status_code == 200
+        payload = decode_token(response.json()["access_token"], "access")
+        assert payload["teams"] == [str(team.id)]
+        assert payload["mep"] == user.membership_epoch
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_refresh_embeds_memberships(
+        self, http_client: AsyncClient, db_session: AsyncSession
+    ):
+        """refresh читает актуальное членство тем же запросом, что и ротацию."""
+        user, team = await _create_member(db_session, "member-refresh@test.com")
+        response = await http_client.post(
+            "/api/v1/auth/login",
+            json={"email": "member-refresh@test.com", "password": "Pass123!"},
+        )
+        await db_session.execute(
+            delete(TeamMember).where(TeamMember.user_id == user.id)
+        )
+        await db_session.commit()
+        await db_session.refresh(user)
+
+        response = await http_client.post(
+            "/api/v1/auth/refresh",
+            json={"refresh_token": response.json()["refresh_token"]},
+        )
+
+        assert response.status_code == 200
+        payload = decode_token(response.json()["access_token"], "access")
+        assert payload["teams"] == []
+        assert payload["mep"] == user.membership_epoch
+
+    def test_too_many_teams_not_embedded(self):
+        """Больше max_embedded_teams команд — токен без членства."""
+        memberships = Memberships(
+            epoch=1,
+            team_ids=frozenset(
+                uuid.uuid4() for _ in range(get_config().auth.max_embedded_teams + 1)
+            ),
+        )
+
+        claims = access_claims(uuid.uuid4(), memberships)
+
+        assert "teams" not in claims
+        assert "mep" not in claims
+
+
+class TestMembershipEpoch:
+    """Эпоха членства и проверка устаревших токенов"""
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_epoch_bumped_on_membership_change(self, db_session: AsyncSession):
+        """Добавление, удаление и каскад при удалении команды увеличивают эпоху."""
+        user, team = await _create_member(db_session, "member-epoch@test.com")
+        assert user.membership_epoch == 1
+
+        other = Team(name="Other")
+        db_session.add(other)
+        await db_session.commit()
+        db_session.add(TeamMember(team_id=other.id, user_id=user.id))
+        await db_session.commit()
+        await db_session.refresh(user)
+        assert user.membership_epoch == 2
+
+        await db_session.delete(other)
+        await db_session.commit()
+        await db_session.refresh(user)
+        assert user.membership_epoch == 3
+
+        memberships = await UserRepository(db_session).get_memberships(user.id)
+        assert memberships == Memberships(epoch=3, team_ids=frozenset({team.id}))
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_current_token_used_without_query(self, db_session: AsyncSession):
+        """Токен с актуальной эпохой — членство из claims, без запроса к БД."""
+        user, team = await _create_member(db_session, "member-fresh@test.com")
+        repo = UserRepository(db_session)
+        token = create_access_token(user.id, await repo.get_memberships(user.id))
+
+        async def no_query(user_id):
+            raise AssertionError("membership query for a current token")
+
+        repo.get_memberships = no_query
+        memberships = await get_current_memberships(
+            decode_token(token, "access"), user, repo
+        )
+
+        assert memberships.team_ids == {team.id}
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_stale_token_falls_back_to_database(self, db_session: AsyncSession):
+        """После изменения членства старый токен не используется для авторизации."""
+        user, team = await _create_member(db_session, "member-stale@test.com")
+        repo = UserRepository(db_session)
+        token = create_access_token(user.id, await repo.get_memberships(user.id))
+
+        await db_session.execute(
+            delete(TeamMember).where(TeamMember.user_id == user.id)
+        )
+        await db_session.commit()
+        await db_session.refresh(user)
+
+        memberships = await get_current_memberships(
+            decode_token(token, "access"), user, repo
+        )
+
+        assert not memberships.is_member(team.id)
+        assert memberships.epoch == user.membership_epoch
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_deleted_user_is_unauthorized(self, db_session: AsyncSession):
+        """Пользователь удалён между проверкой токена и чтением членства — 401."""
+        user, _ = await _create_member(db_session, "member-deleted@test.com")
+        repo = UserRepository(db_session)
+        token = create_access_token(user.id)
+        await db_session.delete(user)
+        await db_session.commit()
+
+        with pytest.raises(InvalidCredentialsError):
+            await get_current_memberships(decode_token(token, "access"), user, repo)
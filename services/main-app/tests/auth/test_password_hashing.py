@@ -0,0 +1,124 @@
+import pytest
+from httpx import AsyncClient
+from passlib.exc import MissingBackendError
+from passlib.hash import argon2, sha512_crypt
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from auth.rehash import PasswordRehasher, password_rehasher
+from auth.security import build_context, hash_password, needs_rehash, verify_password
+from core.config import PasswordConfig, get_config
+from models import User
+
+# Хэш схемы по умолчанию, но дешевле настроенного
+OUTDATED_ROUNDS = 5000
+
+
+def _outdated_hash(password: str) -> str:
+    return sha512_crypt.using(rounds=OUTDATED_ROUNDS).hash(password)
+
+
+async def _create_user(db_session: AsyncSession, email: str, hashed: str) -> User:
+    user = User(name="Rehash", email=email, hashed_password=hashed)
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+class TestPasswordContext:
+    """Схемы и стоимость хэширования из password_settings"""
+
+    def test_needs_rehash(self):
+        """Хэш со стоимостью ниже настроенной требует пересчёта, текущий — нет."""
+        assert needs_rehash(_outdated_hash("Secret123!"))
+        assert not needs_rehash(hash_password("Secret123!"))
+
+    def test_deprecated_scheme_still_verifies(self):
+        """Хэш схемы из хвоста списка проверяется и помечается на пересчёт."""
+        try:
+            argon2.get_backend()
+        except MissingBackendError:
+            pytest.skip("argon2-cffi is not installed")
+        config = PasswordConfig(
+            schemes=("argon2", "sha512_crypt"),
+            argon2_time_cost=1,
+            argon2_memory_cost=1024,
+            argon2_parallelism=1,
+        )
+        context = build_context(config)
+        legacy = context.handler("sha512_crypt").hash("Secret123!")
+
+        assert context.verify("Secret123!", legacy)
+        assert context.needs_update(legacy)
+        assert context.identify(context.hash("Secret123!")) == "argon2"
+
+    def test_configured_rounds(self):
+        rounds = get_config().password.sha512_crypt_rounds
+        assert f"$rounds={rounds}$" in hash_password("Secret123!")
+
+
+class TestRehash:
+    """Пересчёт устаревшего хэша после успешного входа"""
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_rehasher_replaces_hash(self, db_session: AsyncSession):
+        old_hash = _outdated_hash("Secret123!")
+        user = await _create_user(db_session, "rehash-replace@test.com", old_hash)
+        rehasher = PasswordRehasher(
+            async_sessionmaker(
+                bind=db_session.bind, join_transaction_mode="create_savepoint"
+            )
+        )
+
+        rehasher.schedule(user.id, old_hash, "Secret123!")
+        await rehasher.drain()
+
+        await db_session.refresh(user)
+        assert user.hashed_password != old_hash
+        assert not needs_rehash(user.hashed_password)
+        assert verify_password("Secret123!", user.hashed_password)
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_rehasher_keeps_changed_hash(self, db_session: AsyncSession):
+        """Пароль сменили, пока шёл пересчёт: новый хэш не перезаписывается."""
+        old_hash = _outdated_hash("Secret123!")
+        changed = hash_password("Changed123!")
+        user = await _create_user(db_session, "rehash-changed@test.com", changed)
+        rehasher = PasswordRehasher(
+            async_sessionmaker(
+                bind=db_session.bind, join_transaction_mode="create_savepoint"
+            )
+        )
+
+        rehasher.schedule(user.id, old_hash, "Secret123!")
+        await rehasher.drain()
+
+        await db_session.refresh(user)
+        assert user.hashed_password == changed
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_login_schedules_rehash(
+        self,
+        http_client: AsyncClient,
+        db_session: AsyncSession,
+        app_url: str | None,
+        monkeypatch,
+    ):
+        """Вход с устаревшим хэшем успешен и ставит пересчёт в фон."""
+        if app_url:
+            pytest.skip("фоновые задачи живут в процессе приложения")
+        old_hash = _outdated_hash("Secret123!")
+        user = await _create_user(db_session, "rehash-login@test.com", old_hash)
+        scheduled = []
+        monkeypatch.setattr(
+            password_rehasher,
+            "schedule",
+            lambda *args: scheduled.append(args),
+        )
+
+        response = await http_client.post(
+            "/api/v1/auth/login",
+            json={"email": "rehash-login@test.com", "password": "Secret123!"},
+        )
+
+        assert response.status_code == 200
+        assert scheduled == [(user.id, old_hash, "Secret123!")]
@@ -0,0 +1,108 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from auth.rate_limit import Bucket, DatabaseBuckets, LoginLimiter, MemoryBuckets
+from auth.security import hash_password
+from core.config import RateLimitConfig, get_config
+from models import User
+from repositories.login_throttle import LoginThrottleRepository
+
+
+class TestBucket:
+    """GCRA: burst попыток подряд, затем одна в refill_seconds"""
+
+    def test_burst_then_refill(self):
+        bucket = Bucket(burst=3, refill_seconds=10.0)
+        tat = now = 100.0
+
+        for _ in range(3):
+            tat, wait = bucket.admit(tat, now)
+            assert wait == 0
+
+        tat, wait = bucket.admit(tat, now)
+        assert wait == pytest.approx(10.0)
+
+        tat, wait = bucket.admit(tat, now + 10.0)
+        assert wait == 0
+        _, wait = bucket.admit(tat, now + 10.0)
+        assert wait == pytest.approx(10.0)
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_memory_keys_bounded(self):
+        """Число ключей в памяти не растёт выше max_keys."""
+        store = MemoryBuckets(max_keys=8)
+        bucket = Bucket(burst=1, refill_seconds=3600.0)
+
+        for index in range(100):
+            await store.acquire(f"ip:10.0.0.{index}", bucket)
+
+        assert len(store) <= 8
+        # Самый свежий ключ остаётся и продолжает ограничиваться
+        assert await store.acquire("ip:10.0.0.99", bucket) > 0
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_ip_limit_does_not_spend_email(self):
+        """Попытка, отклонённая по IP, не расходует лимит email."""
+        config = RateLimitConfig(ip_burst=1, email_burst=1)
+        limiter = LoginLimiter(MemoryBuckets(max_keys=100), config)
+
+        assert await limiter.check("10.0.0.1", "victim@test.com") == 0
+        assert await limiter.check("10.0.0.1", "other@test.com") > 0
+        assert await limiter.check("10.0.0.2", "other@test.com") == 0
+
+
+class TestDatabaseBuckets:
+    """Общие для воркеров счётчики в login_throttle"""
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_shared_counter(self, db_session: AsyncSession):
+        bucket = Bucket(burst=2, refill_seconds=60.0)
+        first = DatabaseBuckets(LoginThrottleRepository(db_session))
+        second = DatabaseBuckets(LoginThrottleRepository(db_session))
+
+        assert await first.acquire("email:shared@test.com", bucket) == 0
+        assert await second.acquire("email:shared@test.com", bucket) == 0
+        wait = await first.acquire("email:shared@test.com", bucket)
+
+        assert 0 < wait <= 60.0
+
+
+class TestLoginRateLimit:
+    """429 на /auth/login и /auth/token до проверки пароля"""
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_email_limit(
+        self, http_client: AsyncClient, db_session: AsyncSession
+    ):
+        """После email_burst неудачных попыток отклоняется даже верный пароль."""
+        db_session.add(
+            User(
+                name="Target",
+                email="throttle-target@test.com",
+                hashed_password=hash_password("SecurePass123!"),
+            )
+        )
+        await db_session.commit()
+
+        for _ in range(get_config().rate_limit.email_burst):
+            response = await http_client.post(
+                "/api/v1/auth/login",
+                json={"email": "throttle-target@test.com", "password": "wrong"},
+            )
+            assert response.status_code == 401
+
+        response = await http_client.post(
+            "/api/v1/auth/login",
+            json={"email": "throttle-target@test.com", "password": "SecurePass123!"},
+        )
+        assert response.status_code == 429
+        assert response.json()["detail"] == "Too many login attempts"
+        assert int(response.headers["Retry-After"]) > 0
+
+        # Лимит общий для JSON-входа и OAuth2-формы; регистр email не важен
+        response = await http_client.post(
+            "/api/v1/auth/token",
+            data={"username": "Throttle-Target@test.com", "password": "wrong"},
+        )
+        assert response.status_code == 429
@@ -2,9 +2,10 @@ from datetime import datetime, timedelta
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from auth.jwt import create_refresh_token, generate_jti
+from auth.jwt import create_refresh_token, decode_token, generate_jti
 from auth.security import hash_password
 from models import RefreshToken, User
 
@@ -55,8 +56,21 @@ class TestRefresh:
         assert "access_token" in data
         assert "refresh_token" in data
         assert data["token_type"] == "bearer"
-        # В текущей реализации refresh_token остаётся тот же (reuse strategy)
-        assert data["refresh_token"] == refresh_token
+        # Ротация: выдаётся новый refresh_token, старый отозван
+        assert data["refresh_token"] != refresh_token
+
+        new_jti = decode_token(data["refresh_token"], "refresh")["jti"]
+        await db_session.refresh(token_record)
+        assert token_record.is_revoked is True
+        assert token_record.replaced_by == new_jti
+        assert token_record.revoked_at is not None
+
+        result = await db_session.execute(
+            select(RefreshToken).where(RefreshToken.token_jti == new_jti)
+        )
+        new_record = result.scalar_one()
+        assert new_record.family_id == token_record.family_id
+        assert new_record.is_revoked is False
 
     @pytest.mark.asyncio(loop_scope="session")
     async def test_refresh_invalid_token(self, http_client: AsyncClient):
@@ -212,3 +226,142 @@ class TestRefresh:
         )
 
         assert response.status_code == 401
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_refresh_rotation_chain(
+        self,
+        http_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """Каждый выданный refresh_token можно обменять ровно один раз."""
+        user = User(
+            name="Test User",
+            email="rotation-chain@example.com",
+            hashed_password=hash_password("SecurePass123!"),
+        )
+        db_session.add(user)
+        await db_session.commit()
+        await db_session.refresh(user)
+
+        response = await http_client.post(
+            "/api/v1/auth/login",
+            json={"email": "rotation-chain@example.com", "password": "SecurePass123!"},
+        )
+        refresh_token = response.json()["refresh_token"]
+
+        for _ in range(3):
+            response = await http_client.post(
+                "/api/v1/auth/refresh", json={"refresh_token": refresh_token}
+            )
+            assert response.status_code == 200
+            assert response.json()["refresh_token"] != refresh_token
+            refresh_token = response.json()["refresh_token"]
+
+        result = await db_session.execute(
+            select(RefreshToken).where(RefreshToken.user_id == user.id)
+        )
+        tokens = result.scalars().all()
+        assert len(tokens) == 4
+        assert len({token.family_id for token in tokens}) == 1
+        assert [token.is_revoked for token in tokens].count(False) == 1
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_refresh_concurrent_reuse_gets_successor(
+        self,
+        http_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """
+        Повтор только что обменянного токена (вторая вкладка) получает
+        того же преемника, семейство не отзывается.
+        """
+        user = User(
+            name="Test User",
+            email="rotation-tabs@example.com",
+            hashed_password=hash_password("SecurePass123!"),
+        )
+        db_session.add(user)
+        await db_session.commit()
+        await db_session.refresh(user)
+
+        jti = generate_jti()
+        refresh_token = create_refresh_token(user.id, jti)
+        db_session.add(
+            RefreshToken(
+                user_id=user.id,
+                token_jti=jti,
+                expires_at=datetime.utcnow() + timedelta(days=30),
+            )
+        )
+        await db_session.commit()
+
+        first = await http_client.post(
+            "/api/v1/auth/refresh", json={"refresh_token": refresh_token}
+        )
+        second = await http_client.post(
+            "/api/v1/auth/refresh", json={"refresh_token": refresh_token}
+        )
+
+        assert first.status_code == second.status_code == 200
+        successor = decode_token(first.json()["refresh_token"], "refresh")["jti"]
+        assert decode_token(second.json()["refresh_token"], "refresh")["jti"] == (
+            successor
+        )
+
+        response = await http_client.post(
+            "/api/v1/auth/refresh",
+            json={"refresh_token": first.json()["refresh_token"]},
+        )
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_refresh_reuse_revokes_family(
+        self,
+        http_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """Повторное использование старого токена отзывает всё семейство."""
+        user = User(
+            name="Test User",
+            email="rotation-reuse@example.com",
+            hashed_password=hash_password("SecurePass123!"),
+        )
+        db_session.add(user)
+        await db_session.commit()
+        await db_session.refresh(user)
+
+        jti = generate_jti()
+        stolen = create_refresh_token(user.id, jti)
+        db_session.add(
+            RefreshToken(
+                user_id=user.id,
+                token_jti=jti,
+                expires_at=datetime.utcnow() + timedelta(days=30),
+            )
+        )
+        await db_session.commit()
+
+        response = await http_client.post(
+            "/api/v1/auth/refresh", json={"refresh_token": stolen}
+        )
+        current = response.json()["refresh_token"]
+
+        # Обмен был давно — окно параллельных запросов прошло
+        await db_session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.token_jti == jti)
+            .values(revoked_at=datetime.utcnow() - timedelta(hours=1))
+        )
+        await db_session.commit()
+
+        response = await http_client.post(
+            "/api/v1/auth/refresh", json={"refresh_token": stolen}
+        )
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Refresh token has been revoked"
+
+        # Действующий токен семейства тоже отозван
+        response = await http_client.post(
+            "/api/v1/auth/refresh", json={"refresh_token": current}
+        )
+        assert response.status_code == 401
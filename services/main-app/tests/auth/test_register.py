@@ -1,9 +1,10 @@
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from models import User
+from auth.jwt import decode_token
+from models import RefreshToken, User
 
 
 class TestRegister:
@@ -74,6 +75,72 @@ class TestRegister:
         data = response.json()
         assert data["detail"] == "User with this email already exists"
 
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_register_single_statement(
+        self,
+        http_client: AsyncClient,
+        db_session: AsyncSession,
+        db_engine,
+        app_url: str | None,
+    ):
+        """Пользователь и refresh-токен создаются одним запросом к БД."""
+        if app_url:
+            pytest.skip("запросы приложения считаются в его процессе")
+        queries = []
+
+        def count(connection, cursor, statement, *args):
+            # SAVEPOINT — обёртка тестовой транзакции вокруг commit приложения
+            if "SAVEPOINT" not in statement:
+                queries.append(statement)
+
+        payload = {
+            "name": "Single Statement",
+            "email": "single-statement@example.com",
+            "password": "SecurePass123!",
+        }
+        event.listen(db_engine.sync_engine, "before_cursor_execute", count)
+        try:
+            response = await http_client.post("/api/v1/auth/register", json=payload)
+            assert response.status_code == 201
+            assert len(queries) == 1
+
+            queries.clear()
+            response = await http_client.post("/api/v1/auth/register", json=payload)
+            assert response.status_code == 400
+            assert len(queries) == 1
+        finally:
+            event.remove(db_engine.sync_engine, "before_cursor_execute", count)
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_register_stores_refresh_token(
+        self,
+        http_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """Refresh-токен из регистрации сохранён и принадлежит новому пользователю."""
+        payload = {
+            "name": "Token Owner",
+            "email": "token-owner@example.com",
+            "password": "SecurePass123!",
+        }
+
+        response = await http_client.post("/api/v1/auth/register", json=payload)
+
+        assert response.status_code == 201
+        claims = decode_token(response.json()["refresh_token"], "refresh")
+        token = await db_session.scalar(
+            select(RefreshToken).where(RefreshToken.token_jti == claims["jti"])
+        )
+        assert token is not None
+        assert str(token.user_id) == claims["sub"]
+        assert token.is_revoked is False
+
+        response = await http_client.post(
+            "/api/v1/auth/refresh",
+            json={"refresh_token": response.json()["refresh_token"]},
+        )
+        assert response.status_code == 200
+
     @pytest.mark.asyncio(loop_scope="session")
     async def test_register_invalid_email(self, http_client: AsyncClient):
         """Регистрация с невалидным email должна вернуть 422."""
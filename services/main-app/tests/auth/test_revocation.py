@@ -0,0 +1,176 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import delete, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from auth.jwt import create_refresh_token, generate_jti
+from auth.revocation import RevocationIndex, RevocationListener
+from auth.security import hash_password
+from enums import TokenRotation
+from models import RefreshToken, User
+from repositories.refresh_token import RefreshTokenRepository
+
+
+class TestRevocationIndex:
+    """Индекс отзыва refresh-токенов в памяти воркера."""
+
+    def test_revoked_until_expiry(self):
+        """Отозванный jti помнится до истечения срока токена."""
+        index = RevocationIndex()
+        index.revoke("a", datetime.utcnow() + timedelta(days=1))
+        index.revoke("b", datetime.utcnow() - timedelta(seconds=1))
+
+        assert index.is_revoked("a")
+        # Истёкший токен отклонит проверка exp, хранить его незачем
+        assert not index.is_revoked("b")
+        assert len(index) == 1
+
+    def test_reconcile(self):
+        """Сверка добавляет отзывы из БД и не теряет локальные."""
+        index = RevocationIndex()
+        expires_at = datetime.utcnow() + timedelta(days=1)
+        index.revoke("local", expires_at)
+        index.revoke("expired", datetime.utcnow() + timedelta(microseconds=1))
+
+        index.reconcile([("from-db", expires_at)])
+
+        assert index.is_revoked("local")
+        assert index.is_revoked("from-db")
+        assert len(index) == 2
+
+
+async def _create_user_with_token(session: AsyncSession, email: str):
+    user = User(
+        name="Test User",
+        email=email,
+        hashed_password=hash_password("SecurePass123!"),
+    )
+    session.add(user)
+    await session.commit()
+    await session.refresh(user)
+
+    jti = generate_jti()
+    session.add(
+        RefreshToken(
+            user_id=user.id,
+            token_jti=jti,
+            expires_at=datetime.utcnow() + timedelta(days=30),
+            is_revoked=False,
+        )
+    )
+    await session.commit()
+    return user, jti
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_refresh_single_statement(
+    http_client: AsyncClient,
+    db_session: AsyncSession,
+    db_engine,
+    app_url: str | None,
+):
+    """Обмен токена — один запрос к БД; после logout — ни одного."""
+    if app_url:
+        pytest.skip("запросы приложения считаются в его процессе")
+    user, jti = await _create_user_with_token(db_session, "revocation-hot@test.com")
+    refresh_token = create_refresh_token(user.id, jti)
+
+    queries = []
+
+    def count(connection, cursor, statement, *args):
+        # SAVEPOINT — обёртка тестовой транзакции вокруг commit приложения
+        if "SAVEPOINT" not in statement:
+            queries.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", count)
+    try:
+        response = await http_client.post(
+            "/api/v1/auth/refresh", json={"refresh_token": refresh_token}
+        )
+        assert response.status_code == 200
+        assert len(queries) == 1
+        refresh_token = response.json()["refresh_token"]
+
+        response = await http_client.post(
+            "/api/v1/auth/logout", json={"refresh_token": refresh_token}
+        )
+        assert response.status_code == 204
+
+        queries.clear()
+        response = await http_client.post(
+            "/api/v1/auth/refresh", json={"refresh_token": refresh_token}
+        )
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", count)
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Refresh token has been revoked"
+    assert queries == []
+
+
+@pytest.fixture
+async def committed_session(db_engine):
+    """
+    Сессии с настоящим commit: NOTIFY и блокировки строк работают только
+    между транзакциями. Созданные пользователи удаляются после теста.
+    """
+    session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+        await session.execute(delete(User).where(User.email.like("revocation-%")))
+        await session.commit()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_concurrent_rotation(db_engine, committed_session):
+    """
+    Два одновременных обмена одного токена: один выпускает преемника,
+    второй ждёт блокировку строки и получает того же преемника.
+    """
+    _, jti = await _create_user_with_token(
+        committed_session, "revocation-race@test.com"
+    )
+    session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
+    expires_at = datetime.utcnow() + timedelta(days=30)
+
+    async def rotate(new_jti: str):
+        async with session_factory() as session:
+            return await RefreshTokenRepository(session).rotate(
+                jti, new_jti, expires_at, grace=timedelta(seconds=10)
+            )
+
+    first, second = await asyncio.gather(rotate("race-a"), rotate("race-b"))
+
+    outcomes = sorted([first.outcome.value, second.outcome.value])
+    assert outcomes == [TokenRotation.CONCURRENT.value, TokenRotation.ROTATED.value]
+    concurrent = first if first.outcome is TokenRotation.CONCURRENT else second
+    winner = "race-a" if concurrent is second else "race-b"
+    assert concurrent.replaced_by == winner
+    assert concurrent.family_revoked == 0
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_revocation_notifies_other_workers(test_app, committed_session):
+    """Отзыв доходит до индекса другого воркера через LISTEN/NOTIFY."""
+    index = RevocationIndex()
+    listener = RevocationListener(index, reconcile_seconds=3600)
+    listener.start()
+    try:
+        _, jti = await _create_user_with_token(
+            committed_session, "revocation-notify@test.com"
+        )
+        await asyncio.wait_for(listener.listening.wait(), 10)
+        assert not index.is_revoked(jti)
+
+        await RefreshTokenRepository(committed_session).revoke_family(jti)
+
+        for _ in range(100):
+            if index.is_revoked(jti):
+                break
+            await asyncio.sleep(0.05)
+        assert index.is_revoked(jti)
+    finally:
+        await listener.stop()
@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from auth.security import hash_password
+from auth.sweeper import SWEEPER_LOCK_KEY, TokenSweeper
+from models import RefreshToken, User
+
+
+@pytest.fixture
+async def committed_tokens(db_engine):
+    """
+    Пользователь с 5 истёкшими и 2 действующими токенами. Очистка
+    коммитит пачки, поэтому данные фиксируются и удаляются после теста.
+    """
+    session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
+    async with session_factory() as session:
+        user = User(
+            name="Sweeper User",
+            email="sweeper@test.com",
+            hashed_password=hash_password("SecurePass123!"),
+        )
+        session.add(user)
+        await session.commit()
+
+        now = datetime.utcnow()
+        for number, days in enumerate((-3, -2, -1, -1, -1, 1, 30)):
+            session.add(
+                RefreshToken(
+                    user_id=user.id,
+                    token_jti=f"sweeper-{number}",
+                    expires_at=now + timedelta(days=days),
+                )
+            )
+        await session.commit()
+
+        yield user
+
+        await session.execute(delete(User).where(User.id == user.id))
+        await session.commit()
+
+
+async def _count_tokens(db_engine, user) -> int:
+    async with db_engine.connect() as connection:
+        return await connection.scalar(
+            select(func.count())
+            .select_from(RefreshToken)
+            .where(RefreshToken.user_id == user.id)
+        )
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_sweep_deletes_expired_in_batches(db_engine, committed_tokens):
+    """Удаляются только истёкшие токены, пачками не больше batch_size."""
+    sweeper = TokenSweeper(engine=db_engine, interval=3600, batch_size=2)
+
+    result = await sweeper.sweep()
+
+    assert result.purged == 5
+    assert result.batches == 3
+    assert result.duration_ms > 0
+    assert sweeper.last_result is result
+    assert await _count_tokens(db_engine, committed_tokens) == 2
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_sweep_runs_on_leader_only(db_engine, committed_tokens):
+    """Пока блокировку держит другой воркер, очистка пропускается."""
+    sweeper = TokenSweeper(engine=db_engine, interval=3600, batch_size=2)
+
+    async with db_engine.connect() as leader:
+        await leader.scalar(select(func.pg_advisory_lock(SWEEPER_LOCK_KEY)))
+        assert await sweeper.sweep() is None
+        await leader.scalar(select(func.pg_advisory_unlock(SWEEPER_LOCK_KEY)))
+        await leader.commit()
+
+    assert await _count_tokens(db_engine, committed_tokens) == 7
+    assert (await sweeper.sweep()).purged == 5
@@ -0,0 +1,32 @@
+import random
+
+from benchmarks.datagen.generator import IdSpace, allocate, poisson
+
+
+def test_allocate_keeps_total_and_skew():
+    weights = [1 / rank**1.1 for rank in range(1, 11)]
+    counts = allocate(1000, weights)
+
+    assert sum(counts) == 1000
+    assert counts == sorted(counts, reverse=True)
+    assert counts[0] > counts[-1] * 5
+
+
+def test_allocate_uniform():
+    assert allocate(10, [1.0, 1.0, 1.0]) == [4, 3, 3]
+
+
+def test_poisson_mean_is_close():
+    rng = random.Random(0)
+    samples = [poisson(rng, 2.0) for _ in range(20_000)]
+    assert abs(sum(samples) / len(samples) - 2.0) < 0.05
+    assert poisson(rng, 0) == 0
+
+
+def test_id_space_is_reproducible_from_seed():
+    first = IdSpace(random.Random(42))
+    second = IdSpace(random.Random(42))
+
+    assert first(0) == second(0)
+    assert first(1) != first(0)
+    assert IdSpace(random.Random(43))(0) != first(0)
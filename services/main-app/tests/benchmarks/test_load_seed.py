@@ -0,0 +1,50 @@
+import random
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, async_sessionmaker
+
+from benchmarks.load.seed import SeedConfig, seed
+from models import Board, BoardColumn, Task, Team, TeamMember, User
+
+
+def _sessions(
+    db_engine: AsyncEngine, db_connection: AsyncConnection | None
+) -> async_sessionmaker:
+    # Как у приложения в тесте: сессия, закрытая без commit, откатывает своё
+    if db_connection is None:
+        return async_sessionmaker(db_engine, expire_on_commit=False)
+    return async_sessionmaker(
+        bind=db_connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_seed_is_committed(db_engine, db_connection):
+    """Засеянные данные видны из новой сессии после закрытия сессии сида."""
+    config = SeedConfig(
+        users=3, teams=1, boards=2, columns_per_board=2, tasks_per_column=3
+    )
+    sessions = _sessions(db_engine, db_connection)
+
+    async with sessions() as session:
+        data = await seed(session, config, random.Random(0))
+
+    async with sessions() as session:
+        counts = {
+            model: await session.scalar(select(func.count()).select_from(model))
+            for model in (User, Team, TeamMember, Board, BoardColumn, Task)
+        }
+        users = await session.scalars(select(User.id).where(User.id.in_(data.user_ids)))
+
+    assert set(users) == set(data.user_ids)
+    assert counts == {
+        User: 3,
+        Team: 1,
+        TeamMember: 3,
+        Board: 2,
+        BoardColumn: 4,
+        Task: 12,
+    }
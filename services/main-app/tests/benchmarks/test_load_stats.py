@@ -0,0 +1,59 @@
+import pytest
+
+from benchmarks.load.__main__ import parse_args
+from benchmarks.load.scenarios import parse_mix
+from benchmarks.load.stats import StatsCollector, compare, percentile
+
+
+def test_percentile_nearest_rank():
+    values = [0.5, 0.1, 0.4, 0.2, 0.3]
+    assert percentile(values, 50) == 0.3
+    assert percentile(values, 95) == 0.5
+    assert percentile(values, 0) == 0.1
+    assert percentile([], 99) == 0.0
+
+
+def test_summary_per_route_and_totals():
+    collector = StatsCollector()
+    collector.record("GET /a", 0.010, True)
+    collector.record("GET /a", 0.030, False)
+    collector.record("POST /b", 0.020, True)
+
+    summary = collector.summary(elapsed=2.0)
+
+    assert summary["totals"]["requests"] == 3
+    assert summary["totals"]["errors"] == 1
+    assert summary["totals"]["throughput_rps"] == 1.5
+    assert summary["routes"]["GET /a"]["error_rate"] == 0.5
+    assert summary["routes"]["GET /a"]["p99_ms"] == 30.0
+    assert summary["routes"]["POST /b"]["p50_ms"] == 20.0
+
+
+def test_compare_reports_p95_and_error_regressions():
+    base = {"routes": {"GET /a": {"requests": 10, "p95_ms": 10.0, "error_rate": 0.0}}}
+    slower = {"routes": {"GET /a": {"requests": 10, "p95_ms": 13.0, "error_rate": 0.1}}}
+    same = {"routes": {"GET /a": {"requests": 10, "p95_ms": 11.0, "error_rate": 0.0}}}
+
+    assert len(compare(base, slower, max_regression=0.2)) == 2
+    assert compare(base, same, max_regression=0.2) == []
+
+
+def test_parse_mix():
+    assert parse_mix("board_read=3,login_burst=1") == {
+        "board_read": 3,
+        "login_burst": 1,
+    }
+    with pytest.raises(ValueError):
+        parse_mix("unknown=1")
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [["--columns-per-board", "1"], ["--tasks-per-column", "0"], ["--users", "0"]],
+)
+def test_parse_args_rejects_unusable_dataset(argv, capsys):
+    """Датасет, на котором сценарии упали бы посреди прогона, — ошибка CLI."""
+    with pytest.raises(SystemExit) as exc_info:
+        parse_args(argv)
+    assert exc_info.value.code == 2
+    assert f"{argv[0]} must be >= " in capsys.readouterr().err
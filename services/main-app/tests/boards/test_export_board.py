@@ -0,0 +1,212 @@
+import csv
+import io
+import json
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.compression import accepts_encoding
+from models import Board, BoardColumn, Comment, Task, TaskMember, Team, TeamMember, User
+
+IDENTITY = {"Accept-Encoding": "identity"}
+
+
+async def create_board(db_session: AsyncSession, user: User, team: Team | None = None):
+    board = Board(
+        title="Export Board",
+        owner_id=user.id,
+        team_id=team.id if team else None,
+    )
+    db_session.add(board)
+    await db_session.commit()
+
+    columns = [
+        BoardColumn(title=f"Column {i}", position=i, board_id=board.id)
+        for i in range(2)
+    ]
+    db_session.add_all(columns)
+    await db_session.commit()
+
+    tasks = [
+        Task(title=f"Task {i}", user_id=user.id, column_id=columns[i % 2].id)
+        for i in range(3)
+    ]
+    db_session.add_all(tasks)
+    await db_session.commit()
+
+    db_session.add_all(
+        [
+            TaskMember(task_id=tasks[0].id, user_id=user.id),
+            Comment(
+                body='First, with "quotes"\nand newline',
+                user_id=user.id,
+                task_id=tasks[0].id,
+            ),
+            Comment(body="Second", user_id=user.id, task_id=tasks[1].id),
+        ]
+    )
+    await db_session.commit()
+    return board, columns, tasks
+
+
+def count_types(records: list[dict]) -> dict[str, int]:
+    counts = {}
+    for record in records:
+        counts[record["type"]] = counts.get(record["type"], 0) + 1
+    return counts
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_export_board_ndjson(
+    default_auth_client: AsyncClient,
+    default_auth_user: User,
+    db_session: AsyncSession,
+):
+    """NDJSON: по строке на запись, родительские записи раньше дочерних."""
+    board, columns, tasks = await create_board(db_session, default_auth_user)
+    # Задача с другой доски в выгрузку не попадает
+    await create_board(db_session, default_auth_user)
+
+    response = await default_auth_client.get(
+        f"/api/v1/boards/{board.id}/export", headers=IDENTITY
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "content-encoding" not in response.headers
+    assert "attachment" in response.headers["content-disposition"]
+
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert count_types(records) == {
+        "board": 1,
+        "column": 2,
+        "task": 3,
+        "task_member": 1,
+        "comment": 2,
+    }
+    assert [record["type"] for record in records][:3] == ["board", "column", "column"]
+
+    task_records = [record for record in records if record["type"] == "task"]
+    assert {record["id"] for record in task_records} == {str(task.id) for task in tasks}
+    assert task_records[0]["status"] == "PENDING"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_export_board_csv(
+    default_auth_client: AsyncClient,
+    default_auth_user: User,
+    db_session: AsyncSession,
+):
+    """CSV: общий заголовок с колонкой type, экранирование через csv."""
+    board, _, _ = await create_board(db_session, default_auth_user)
+
+    response = await default_auth_client.get(
+        f"/api/v1/boards/{board.id}/export",
+        params={"format": "csv"},
+        headers=IDENTITY,
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert count_types(rows) == {
+        "board": 1,
+        "column": 2,
+        "task": 3,
+        "task_member": 1,
+        "comment": 2,
+    }
+    bodies = {row["body"] for row in rows if row["type"] == "comment"}
+    assert bodies == {'First, with "quotes"\nand newline', "Second"}
+    assert rows[0]["is_public"] == "false"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_export_board_gzip(
+    default_auth_client: AsyncClient,
+    default_auth_user: User,
+    db_session: AsyncSession,
+):
+    """При Accept-Encoding: gzip поток сжимается на лету."""
+    board, _, _ = await create_board(db_session, default_auth_user)
+
+    response = await default_auth_client.get(
+        f"/api/v1/boards/{board.id}/export", headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    # httpx распаковывает gzip сам
+    assert len(response.text.splitlines()) == 9
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_export_board_not_found(default_auth_client: AsyncClient):
+    """Выгрузка несуществующей доски — 404."""
+    response = await default_auth_client.get(f"/api/v1/boards/{uuid.uuid4()}/export")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_export_board_unknown_format(
+    default_auth_client: AsyncClient,
+    default_auth_user: User,
+    db_session: AsyncSession,
+):
+    """Неизвестный формат — 422."""
+    board, _, _ = await create_board(db_session, default_auth_user)
+
+    response = await default_auth_client.get(
+        f"/api/v1/boards/{board.id}/export", params={"format": "xml"}
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_export_team(
+    default_auth_client: AsyncClient,
+    default_auth_user: User,
+    db_session: AsyncSession,
+):
+    """Выгрузка команды: команда, участники и все её доски."""
+    team = Team(name="Export Team")
+    db_session.add(team)
+    await db_session.commit()
+    db_session.add(TeamMember(team_id=team.id, user_id=default_auth_user.id))
+    await db_session.commit()
+
+    await create_board(db_session, default_auth_user, team)
+    await create_board(db_session, default_auth_user, team)
+    await create_board(db_session, default_auth_user)
+
+    response = await default_auth_client.get(
+        f"/api/v1/teams/{team.id}/export", headers=IDENTITY
+    )
+    assert response.status_code == 200
+
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert count_types(records) == {
+        "team": 1,
+        "team_member": 1,
+        "board": 2,
+        "column": 4,
+        "task": 6,
+        "task_member": 2,
+        "comment": 4,
+    }
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, False),
+        ("gzip", True),
+        ("deflate, gzip;q=0.5", True),
+        ("gzip;q=0", False),
+        ("*", True),
+        ("identity", False),
+        ("br, GZIP", True),
+    ],
+)
+def test_accepts_encoding(header, expected):
+    assert accepts_encoding(header, "gzip") is expected
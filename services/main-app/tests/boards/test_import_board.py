@@ -0,0 +1,195 @@
+import gzip
+import json
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Board, BoardColumn, Comment, Task, TaskMember, User
+
+IDENTITY = {"Accept-Encoding": "identity"}
+NDJSON = {"Content-Type": "application/x-ndjson"}
+
+
+async def create_board(db_session: AsyncSession, user: User) -> Board:
+    board = Board(title="Import Board", owner_id=user.id)
+    db_session.add(board)
+    await db_session.commit()
+
+    column = BoardColumn(title="Column", position=0, board_id=board.id)
+    db_session.add(column)
+    await db_session.commit()
+
+    tasks = [
+        Task(title=f"Task {i}", user_id=user.id, column_id=column.id) for i in range(3)
+    ]
+    db_session.add_all(tasks)
+    await db_session.commit()
+
+    db_session.add_all(
+        [
+            TaskMember(task_id=tasks[0].id, user_id=user.id),
+            Comment(
+                body='Multi-line, "quoted"\nbody', user_id=user.id, task_id=tasks[0].id
+            ),
+        ]
+    )
+    await db_session.commit()
+    return board
+
+
+async def export_and_delete(
+    client: AsyncClient, db_session: AsyncSession, board: Board, export_format: str
+) -> bytes:
+    response = await client.get(
+        f"/api/v1/boards/{board.id}/export",
+        params={"format": export_format},
+        headers=IDENTITY,
+    )
+    assert response.status_code == 200
+
+    # Колонки, задачи и комментарии удаляются каскадно
+    await db_session.execute(text("DELETE FROM board WHERE id = :id"), {"id": board.id})
+    await db_session.commit()
+    return response.content
+
+
+async def count(db_session: AsyncSession, model) -> int:
+    return await db_session.scalar(select(func.count()).select_from(model))
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize(
+    "export_format, content_type",
+    [("ndjson", "application/x-ndjson"), ("csv", "text/csv")],
+)
+async def test_import_round_trip(
+    default_auth_client: AsyncClient,
+    default_auth_user: User,
+    db_session: AsyncSession,
+    export_format: str,
+    content_type: str,
+):
+    """Выгрузка доски загружается обратно без изменений."""
+    board = await create_board(db_session, default_auth_user)
+    body = await export_and_delete(
+        default_auth_client, db_session, board, export_format
+    )
+    assert await count(db_session, Task) == 0
+
+    response = await default_auth_client.post(
+        "/api/v1/import",
+        params={"format": export_format},
+        content=body,
+        headers={"Content-Type": content_type},
+    )
+    assert response.status_code == 200
+    summary = response.json()
+    assert summary["records"] == 7
+    assert summary["invalid"] == 0
+    assert {kind: table["inserted"] for kind, table in summary["tables"].items()} == {
+        "board": 1,
+        "column": 1,
+        "task": 3,
+        "task_member": 1,
+        "comment": 1,
+    }
+
+    db_session.expunge_all()
+    restored = await db_session.get(Board, board.id)
+    assert restored.title == "Import Board"
+    assert await count(db_session, Task) == 3
+    comment = await db_session.scalar(select(Comment))
+    assert comment.body == 'Multi-line, "quoted"\nbody'
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_import_is_idempotent(
+    default_auth_client: AsyncClient,
+    default_auth_user: User,
+    db_session: AsyncSession,
+):
+    """Повторный импорт тех же записей ничего не дублирует."""
+    board = await create_board(db_session, default_auth_user)
+    body = await export_and_delete(default_auth_client, db_session, board, "ndjson")
+
+    await default_auth_client.post("/api/v1/import", content=body, headers=NDJSON)
+    response = await default_auth_client.post(
+        "/api/v1/import", content=body, headers=NDJSON
+    )
+    assert response.status_code == 200
+    tables = response.json()["tables"]
+    assert all(table["inserted"] == 0 for table in tables.values())
+    assert tables["task"]["skipped"] == 3
+    assert await count(db_session, Task) == 3
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_import_reports_invalid_and_orphans(
+    default_auth_client: AsyncClient,
+    default_auth_user: User,
+    db_session: AsyncSession,
+):
+    """Невалидные записи попадают в errors с номером, сироты пропускаются."""
+    board_id = str(uuid.uuid4())
+    lines = [
+        {
+            "type": "board",
+            "id": board_id,
+            "title": "B",
+            "owner_id": str(default_auth_user.id),
+        },
+        {"type": "column", "board_id": board_id},
+        {"type": "column", "title": "Orphan", "board_id": str(uuid.uuid4())},
+        {"type": "unknown"},
+        {"type": "column", "title": "Ok", "board_id": board_id},
+    ]
+    body = "\n".join(json.dumps(line) for line in lines).encode()
+
+    response = await default_auth_client.post(
+        "/api/v1/import", content=body, headers=NDJSON
+    )
+    assert response.status_code == 200
+    summary = response.json()
+    assert summary["invalid"] == 2
+    assert [error["record"] for error in summary["errors"]] == [2, 4]
+    assert "title" in summary["errors"][0]["error"]
+    assert summary["tables"]["column"] == {"staged": 2, "inserted": 1, "skipped": 1}
+    assert await count(db_session, BoardColumn) == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_import_skip_and_gzip(
+    default_auth_client: AsyncClient,
+    default_auth_user: User,
+    db_session: AsyncSession,
+):
+    """skip продолжает импорт с места остановки; тело можно сжать gzip."""
+    board = await create_board(db_session, default_auth_user)
+    body = await export_and_delete(default_auth_client, db_session, board, "ndjson")
+
+    # Первые две записи (доска и колонка) «уже загружены» в прошлый раз
+    first = b"\n".join(body.splitlines()[:2])
+    await default_auth_client.post("/api/v1/import", content=first, headers=NDJSON)
+
+    response = await default_auth_client.post(
+        "/api/v1/import",
+        params={"skip": 2},
+        content=gzip.compress(body),
+        headers={**NDJSON, "Content-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    summary = response.json()
+    assert summary["records"] == 7
+    assert "board" not in summary["tables"]
+    assert summary["tables"]["task"]["inserted"] == 3
+    assert await count(db_session, TaskMember) == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_import_unauthenticated(http_client: AsyncClient):
+    """Импорт без токена запрещён."""
+    response = await http_client.post("/api/v1/import", content=b"")
+    assert response.status_code == 401
@@ -1,11 +1,20 @@
+import asyncio
 import os
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass
 
 import pytest
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import make_url, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
 
 from auth.jwt import create_access_token
 from auth.security import hash_password
@@ -27,69 +36,192 @@ def load_env_settings() -> TestSettings:
     """
     Загружает настройки из переменных окружения.
 
-    Если APP_URL задан — используется внешнее приложение (как раньше).
-    Если не задан — приложение запускается in-process через ASGI.
+    Если заданы APP_URL и DB_CONNECTION_STRING — используется внешнее приложение.
+    Если задан только DB_CONNECTION_STRING — приложение запускается in-process,
+    а тестовые БД создаются на указанном сервере.
+    Если не задано ничего — PostgreSQL поднимается в testcontainers.
     """
     app_url = os.environ.get("APP_URL")
     db_connection_string = os.environ.get("DB_CONNECTION_STRING")
+    db_url = (
+        f"postgresql+asyncpg://{db_connection_string}" if db_connection_string else ""
+    )
 
     if app_url and db_connection_string:
         # Режим внешнего окружения (docker-compose)
-        db_url = f"postgresql+asyncpg://{db_connection_string}"
         return TestSettings(
             app_url=app_url,
             db_url=db_url,
             use_external_app=True,
         )
     else:
-        # Режим автоматического окружения (testcontainers)
+        # Режим in-process: свой сервер или testcontainers
         return TestSettings(
             app_url=None,
-            db_url="",  # Будет заполнено из testcontainers
+            db_url=db_url,  # Пустой — будет заполнено из testcontainers
             use_external_app=False,
         )
 
 
 # ============================================================================
-# Testcontainers фикстуры (автоматическое окружение)
+# Шаблонная БД (один раз на весь прогон, в том числе под pytest-xdist)
 # ============================================================================
+#
+# Схема создаётся один раз в шаблонной БД. Каждый процесс (воркер xdist или
+# единственный процесс без xdist) клонирует её через CREATE DATABASE ...
+# TEMPLATE, а каждый тест работает внутри транзакции, которая откатывается
+# в конце. Поэтому тесты не зависят от порядка и запускаются параллельно:
+#
+#     pytest -n auto
+#
+# Режим внешнего приложения (APP_URL) работает по-старому: общая БД и
+# очистка таблиц после каждого теста, параллельный запуск не поддерживается.
+
+SERVER_URL_ENV = "KANBAN_TEST_DB_SERVER"
+TEMPLATE_DB_ENV = "KANBAN_TEST_TEMPLATE_DB"
+
+template_key = pytest.StashKey[tuple]()
+
+
+def _database_url(server_url: str, database: str) -> str:
+    return (
+        make_url(server_url)
+        .set(database=database)
+        .render_as_string(hide_password=False)
+    )
 
 
-@pytest.fixture(scope="session")
-def postgres_container():
+def _admin_engine(server_url: str) -> AsyncEngine:
+    return create_async_engine(
+        server_url, isolation_level="AUTOCOMMIT", poolclass=NullPool
+    )
+
+
+async def _create_template(server_url: str, template: str) -> None:
+    from models import Base
+
+    admin = _admin_engine(server_url)
+    async with admin.connect() as conn:
+        await conn.execute(text(f'DROP DATABASE IF EXISTS "{template}"'))
+        await conn.execute(text(f'CREATE DATABASE "{template}"'))
+    await admin.dispose()
+
+    engine = create_async_engine(
+        _database_url(server_url, template), poolclass=NullPool
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await _stamp_heads(conn)
+    await engine.dispose()
+
+
+async def _stamp_heads(conn: AsyncConnection) -> None:
+    """Схема из моделей соответствует head миграций (как alembic stamp heads)."""
+    from core.health import migration_heads
+
+    await conn.execute(
+        text(
+            "CREATE TABLE alembic_version "
+            "(version_num VARCHAR(32) NOT NULL PRIMARY KEY)"
+        )
+    )
+    for head in migration_heads():
+        await conn.execute(
+            text("INSERT INTO alembic_version VALUES (:head)"), {"head": head}
+        )
+
+
+async def _clone_template(server_url: str, template: str, database: str) -> None:
+    admin = _admin_engine(server_url)
+    async with admin.connect() as conn:
+        await conn.execute(text(f'DROP DATABASE IF EXISTS "{database}"'))
+        # Параллельные CREATE DATABASE из одного шаблона могут столкнуться
+        for attempt in range(10):
+            try:
+                await conn.execute(
+                    text(f'CREATE DATABASE "{database}" TEMPLATE "{template}"')
+                )
+                break
+            except DBAPIError:
+                if attempt == 9:
+                    raise
+                await asyncio.sleep(0.2 * (attempt + 1))
+    await admin.dispose()
+
+
+async def _drop_database(server_url: str, database: str) -> None:
+    admin = _admin_engine(server_url)
+    async with admin.connect() as conn:
+        await conn.execute(text(f'DROP DATABASE IF EXISTS "{database}" WITH (FORCE)'))
+    await admin.dispose()
+
+
+def pytest_configure(config):
     """
-    Поднимает PostgreSQL контейнер для тестов.
-    Используется только если APP_URL не задан.
+    Готовит сервер PostgreSQL и шаблонную БД в главном процессе.
+
+    Воркеры xdist запускаются позже и наследуют переменные окружения,
+    поэтому контейнер и шаблон — общие на весь прогон.
     """
-    settings = load_env_settings()
+    if hasattr(config, "workerinput") or config.option.collectonly:
+        return
 
+    settings = load_env_settings()
     if settings.use_external_app:
-        yield None
         return
 
-    from testcontainers.postgres import PostgresContainer
+    container = None
+    server_url = settings.db_url
+    if not server_url:
+        from testcontainers.postgres import PostgresContainer
+
+        container = PostgresContainer(
+            image="postgres:latest",
+            username="test_user",
+            password="test_password",
+            dbname="test_db",
+        )
+        container.start()
+        # Получаем URL из testcontainers и конвертируем для asyncpg
+        server_url = container.get_connection_url().replace(
+            "postgresql+psycopg2://", "postgresql+asyncpg://"
+        )
+
+    template = f"kanban_test_template_{os.getpid()}"
+    asyncio.run(_create_template(server_url, template))
+
+    os.environ[SERVER_URL_ENV] = server_url
+    os.environ[TEMPLATE_DB_ENV] = template
+    config.stash[template_key] = (container, server_url, template)
 
-    with PostgresContainer(
-        image="postgres:latest",
-        username="test_user",
-        password="test_password",
-        dbname="test_db",
-    ) as postgres:
-        yield postgres
+
+def pytest_unconfigure(config):
+    if template_key not in config.stash:
+        return
+
+    container, server_url, template = config.stash[template_key]
+    asyncio.run(_drop_database(server_url, template))
+    if container is not None:
+        container.stop()
 
 
 @pytest.fixture(scope="session")
-def db_url(postgres_container) -> str:
-    """URL для подключения к БД."""
+async def db_url() -> AsyncGenerator[str]:
+    """URL БД текущего процесса: клон шаблона или внешняя БД."""
     settings = load_env_settings()
 
     if settings.use_external_app:
-        db_connection_string = os.environ.get("DB_CONNECTION_STRING")
-        return f"postgresql+asyncpg://{db_connection_string}"
+        yield settings.db_url
+        return
 
-    # Получаем URL из testcontainers и конвертируем для asyncpg
-    sync_url = postgres_container.get_connection_url()
-    return sync_url.replace("postgresql+psycopg2://", "postgresql+asyncpg://")
+    server_url = os.environ[SERVER_URL_ENV]
+    template = os.environ[TEMPLATE_DB_ENV]
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    database = f"{template}_{worker}"
+
+    await _clone_template(server_url, template, database)
+    yield _database_url(server_url, database)
+    await _drop_database(server_url, database)
 
 
 @pytest.fixture(scope="session")
@@ -112,31 +244,45 @@ async def db_engine(db_url):
     await engine.dispose()
 
 
-@pytest.fixture(scope="session")
-async def setup_database(db_engine, postgres_container):
+def _savepoint_sessionmaker(connection: AsyncConnection) -> async_sessionmaker:
     """
-    Создаёт таблицы в БД.
-    Для testcontainers — создаём таблицы напрямую.
-    Для внешнего окружения — предполагаем что миграции уже применены.
+    Сессии поверх соединения теста: commit() и rollback() в коде приложения
+    работают с SAVEPOINT, а внешняя транзакция теста остаётся открытой.
     """
-    settings = load_env_settings()
+    return async_sessionmaker(
+        bind=connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
 
-    if not settings.use_external_app:
-        from models import Base
 
-        async with db_engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+@pytest.fixture
+async def db_connection(db_engine) -> AsyncGenerator[AsyncConnection | None]:
+    """
+    Соединение с транзакцией на весь тест, откатывается после теста.
+    Для внешнего приложения — None: оно ходит в БД своими соединениями.
+    """
+    if load_env_settings().use_external_app:
+        yield None
+        return
 
-    yield
+    async with db_engine.connect() as connection:
+        transaction = await connection.begin()
+        yield connection
+        if transaction.is_active:
+            await transaction.rollback()
 
 
 @pytest.fixture
-async def db_session(db_engine, setup_database) -> AsyncGenerator[AsyncSession]:
+async def db_session(db_engine, db_connection) -> AsyncGenerator[AsyncSession]:
     """Сессия БД для каждого теста."""
-    async_session = async_sessionmaker(db_engine, expire_on_commit=False)
-    async with async_session() as session:
+    if db_connection is None:
+        session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
+    else:
+        session_factory = _savepoint_sessionmaker(db_connection)
+
+    async with session_factory() as session:
         yield session
-        await session.close()
 
 
 # ============================================================================
@@ -145,7 +291,7 @@ async def db_session(db_engine, setup_database) -> AsyncGenerator[AsyncSession]:
 
 
 @pytest.fixture(scope="session")
-def test_app(db_url, setup_database):
+def test_app(db_url):
     """
     FastAPI приложение для тестов.
     Подменяет настройки БД на тестовые.
@@ -156,18 +302,16 @@ def test_app(db_url, setup_database):
         yield None
         return
 
-    # Подменяем настройки БД перед импортом приложения
-    os.environ["DB_SETTINGS__DB_HOST"] = "overridden"  # Не используется напрямую
+    # Подменяем URL БД до импорта приложения: движок создаётся по снимку
+    # настроек в момент импорта core.database
+    from core.config import reload_config
 
-    # Патчим database URL
-    from unittest.mock import patch
+    os.environ["DB_SETTINGS__URL"] = db_url
+    reload_config()
 
-    from core.config import DatabaseConfig
+    from main import app
 
-    with patch.object(DatabaseConfig, "url", property(lambda self: db_url)):
-        from main import app
-
-        yield app
+    yield app
 
 
 @pytest.fixture
@@ -240,26 +384,62 @@ async def default_auth_client(
 
 
 # ============================================================================
-# Cleanup
+# Изоляция тестов
 # ============================================================================
 
 
 @pytest.fixture(autouse=True)
-async def cleanup_db(db_session: AsyncSession):
-    """Очищает все таблицы после каждого теста."""
+async def isolate_db(db_connection, db_engine, test_app):
+    """
+    In-process: подменяет get_session приложения на сессии поверх соединения
+    теста, поэтому всё, что сделал запрос, откатывается вместе с тестом.
+    Внешнее приложение: очищает все таблицы после теста.
+    """
+    if db_connection is None:
+        yield
+        await _truncate_all(db_engine)
+        return
+
+    from core.database import get_session
+
+    session_factory = _savepoint_sessionmaker(db_connection)
+
+    async def override_get_session():
+        async with session_factory() as session:
+            yield session
+
+    test_app.dependency_overrides[get_session] = override_get_session
+
     yield
 
-    # Получаем список таблиц
-    result = await db_session.execute(
-        text("""
-             SELECT tablename
-             FROM pg_tables
-             WHERE schemaname = 'public'
-             """)
-    )
-    tables = [row[0] for row in result]
+    test_app.dependency_overrides.clear()
 
-    # Очищаем таблицы
-    for table in tables:
-        await db_session.execute(text(f'TRUNCATE TABLE "{table}" CASCADE'))
-    await db_session.commit()
+
+@pytest.fixture(autouse=True)
+def reset_login_limits():
+    """
+    Счётчики попыток входа (memory backend) живут в модуле приложения и
+    иначе переносятся между тестами: повторные входы одного теста
+    исчерпывали бы лимит следующему.
+    """
+    from auth.rate_limit import memory_buckets
+
+    memory_buckets.clear()
+    yield
+    memory_buckets.clear()
+
+
+async def _truncate_all(db_engine) -> None:
+    async with db_engine.begin() as conn:
+        result = await conn.execute(
+            text("""
+                 SELECT tablename
+                 FROM pg_tables
+                 WHERE schemaname = 'public'
+                   AND tablename <> 'alembic_version'
+                 """)
+        )
+        tables = [row[0] for row in result]
+
+        for table in tables:
+            await conn.execute(text(f'TRUNCATE TABLE "{table}" CASCADE'))
@@ -0,0 +1,206 @@
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from enums.task_status import TaskStatus
+from models import Board, BoardColumn, Notification, Task, User
+
+
+async def create_board_with_columns(
+    db_session: AsyncSession, user: User, target_limit: int | None = None
+) -> tuple[BoardColumn, BoardColumn]:
+    board = Board(title="Test Board", owner_id=user.id)
+    db_session.add(board)
+    await db_session.commit()
+
+    source = BoardColumn(title="Sprint 1", position=0, board_id=board.id)
+    target = BoardColumn(
+        title="Sprint 2", position=1, limit=target_limit, board_id=board.id
+    )
+    db_session.add_all([source, target])
+    await db_session.commit()
+    return source, target
+
+
+async def create_tasks(
+    db_session: AsyncSession,
+    user: User,
+    column: BoardColumn,
+    count: int,
+    status: TaskStatus = TaskStatus.IN_PROGRESS,
+) -> list[Task]:
+    tasks = [
+        Task(title=f"Task {i}", status=status, user_id=user.id, column_id=column.id)
+        for i in range(count)
+    ]
+    db_session.add_all(tasks)
+    await db_session.commit()
+    return tasks
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_bulk_move_by_ids(
+    default_auth_client: AsyncClient,
+    default_auth_user: User,
+    db_session: AsyncSession,
+):
+    """Перенос задач по списку id: один ответ со всеми обновлёнными задачами."""
+    source, target = await create_board_with_columns(db_session, default_auth_user)
+    tasks = await create_tasks(db_session, default_auth_user, source, 3)
+    moved = tasks[:2]
+
+    response = await default_auth_client.patch(
+        "/api/v1/tasks:bulk",
+        json={
+            "ids": [str(task.id) for task in moved],
+            "changes": {"column_id": str(target.id)},
+        },
+    )
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["updated"] == 2
+    assert {item["id"] for item in data["tasks"]} == {str(task.id) for task in moved}
+    assert all(item["column_id"] == str(target.id) for item in data["tasks"])
+
+    for task in tasks:
+        await db_session.refresh(task)
+    assert [task.column_id for task in tasks] == [target.id, target.id, source.id]
+
+    result = await db_session.execute(select(Notification.task_id))
+    assert sorted(result.scalars().all()) == sorted(task.id for task in moved)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_bulk_status_by_filter(
+    default_auth_client: AsyncClient,
+    default_auth_user: User,
+    db_session: AsyncSession,
+):
+    """Фильтр по колонке и статусу затрагивает только подходящие задачи."""
+    source, target = await create_board_with_columns(db_session, default_auth_user)
+    in_progress = await create_tasks(db_session, default_auth_user, source, 3)
+    pending = await create_tasks(
+        db_session, default_auth_user, source, 2, status=TaskStatus.PENDING
+    )
+    other_column = await create_tasks(db_session, default_auth_user, target, 1)
+
+    response = await default_auth_client.patch(
+        "/api/v1/tasks:bulk",
+        json={
+            "filter": {"column_id": str(source.id), "status": "IN_PROGRESS"},
+            "changes": {"status": "COMPLETED"},
+        },
+    )
+    assert response.status_code == 200
+    assert response.json()["updated"] == 3
+
+    for task in in_progress + pending + other_column:
+        await db_session.refresh(task)
+    assert all(task.status == TaskStatus.COMPLETED for task in in_progress)
+    assert all(task.status == TaskStatus.PENDING for task in pending)
+    assert other_column[0].status == TaskStatus.IN_PROGRESS
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_bulk_move_respects_column_limit(
+    default_auth_client: AsyncClient,
+    default_auth_user: User,
+    db_session: AsyncSession,
+):
+    """Перенос сверх WIP-лимита колонки отклоняется целиком."""
+    source, target = await create_board_with_columns(
+        db_session, default_auth_user, target_limit=3
+    )
+    await create_tasks(db_session, default_auth_user, target, 2)
+    tasks = await create_tasks(db_session, default_auth_user, source, 2)
+
+    response = await default_auth_client.patch(
+        "/api/v1/tasks:bulk",
+        json={
+            "ids": [str(task.id) for task in tasks],
+            "changes": {"column_id": str(target.id)},
+        },
+    )
+    assert response.status_code == 409
+
+    for task in tasks:
+        await db_session.refresh(task)
+    assert all(task.column_id == source.id for task in tasks)
+
+    result = await db_session.execute(select(Notification))
+    assert result.scalars().all() == []
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_bulk_move_within_column_limit(
+    default_auth_client: AsyncClient,
+    default_auth_user: User,
+    db_session: AsyncSession,
+):
+    """Задачи, уже стоящие в колонке, не считаются дважды."""
+    source, target = await create_board_with_columns(
+        db_session, default_auth_user, target_limit=3
+    )
+    already_there = await create_tasks(db_session, default_auth_user, target, 2)
+    incoming = await create_tasks(db_session, default_auth_user, source, 1)
+
+    response = await default_auth_client.patch(
+        "/api/v1/tasks:bulk",
+        json={
+            "ids": [str(task.id) for task in already_there + incoming],
+            "changes": {"column_id": str(target.id)},
+        },
+    )
+    assert response.status_code == 200
+    assert response.json()["updated"] == 3
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_bulk_move_column_not_found(default_auth_client: AsyncClient):
+    """Перенос в несуществующую колонку должен вернуть 404."""
+    response = await default_auth_client.patch(
+        "/api/v1/tasks:bulk",
+        json={
+            "ids": [str(uuid.uuid4())],
+            "changes": {"column_id": str(uuid.uuid4())},
+        },
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_bulk_update_unknown_ids(default_auth_client: AsyncClient):
+    """Несуществующие id просто не попадают в результат."""
+    response = await default_auth_client.patch(
+        "/api/v1/tasks:bulk",
+        json={"ids": [str(uuid.uuid4())], "changes": {"status": "COMPLETED"}},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"updated": 0, "tasks": []}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"changes": {"status": "COMPLETED"}},
+        {
+            "ids": [str(uuid.uuid4())],
+            "filter": {"status": "PENDING"},
+            "changes": {"status": "COMPLETED"},
+        },
+        {"filter": {}, "changes": {"status": "COMPLETED"}},
+        {"ids": [], "changes": {"status": "COMPLETED"}},
+        {"ids": [str(uuid.uuid4())], "changes": {}},
+    ],
+)
+async def test_bulk_update_invalid_payload(
+    default_auth_client: AsyncClient, payload: dict
+):
+    """Нужен ровно один способ выбора задач и хотя бы одно изменение."""
+    response = await default_auth_client.patch("/api/v1/tasks:bulk", json=payload)
+    assert response.status_code == 422
@@ -64,3 +64,47 @@ async def test_get_task_not_found(default_auth_client: AsyncClient):
     response = await default_auth_client.get(f"/api/v1/tasks/{non_existent_id}")
     assert response.status_code == 404
     assert response.json() == {"detail": "Task not found"}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_task_sparse_fields(
+    default_auth_client: AsyncClient,
+    default_auth_user: User,
+    db_session: AsyncSession,
+):
+    """?fields= для одной задачи: только запрошенные поля и id."""
+    board = Board(title="Test Board", owner_id=default_auth_user.id)
+    db_session.add(board)
+    await db_session.commit()
+
+    column = BoardColumn(title="Test Column", board_id=board.id)
+    db_session.add(column)
+    await db_session.commit()
+
+    due_date = datetime.utcnow() + timedelta(days=7)
+    task = Task(
+        title="Card",
+        description="Long description",
+        status=TaskStatus.IN_PROGRESS,
+        due_date=due_date,
+        user_id=default_auth_user.id,
+        column_id=column.id,
+    )
+    db_session.add(task)
+    await db_session.commit()
+
+    response = await default_auth_client.get(
+        f"/api/v1/tasks/{task.id}", params={"fields": "title,status,due_date"}
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "id": str(task.id),
+        "title": "Card",
+        "status": "IN_PROGRESS",
+        "due_date": due_date.isoformat(),
+    }
+
+    response = await default_auth_client.get(
+        f"/api/v1/tasks/{uuid.uuid4()}", params={"fields": "title"}
+    )
+    assert response.status_code == 404
@@ -1,3 +1,5 @@
+import uuid
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -195,3 +197,119 @@ async def test_skip_negative(
         }
     ]
     assert data == expected
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_tasks_by_ids(
+    default_auth_client: AsyncClient,
+    default_auth_user: User,
+    db_session: AsyncSession,
+):
+    """Пакетное получение по ids: порядок запроса, без дублей и без несуществующих."""
+    board = Board(title="Test Board", owner_id=default_auth_user.id)
+    db_session.add(board)
+    await db_session.commit()
+
+    column = BoardColumn(title="Test Column", board_id=board.id)
+    db_session.add(column)
+    await db_session.commit()
+
+    tasks = [
+        Task(title=f"Task {i}", user_id=default_auth_user.id, column_id=column.id)
+        for i in range(3)
+    ]
+    db_session.add_all(tasks)
+    await db_session.commit()
+
+    ids = [tasks[2].id, tasks[0].id, tasks[2].id, uuid.uuid4()]
+    response = await default_auth_client.get(
+        "/api/v1/tasks", params={"ids": [str(task_id) for task_id in ids]}
+    )
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()] == [
+        str(tasks[2].id),
+        str(tasks[0].id),
+    ]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_tasks_by_ids_too_many(default_auth_client: AsyncClient):
+    """Больше 1000 ids в одном запросе — 422."""
+    ids = [str(uuid.uuid4()) for _ in range(1001)]
+    response = await default_auth_client.get("/api/v1/tasks", params={"ids": ids})
+    assert response.status_code == 422
+
+
+async def create_tasks(db_session: AsyncSession, user: User, count: int) -> list[Task]:
+    board = Board(title="Test Board", owner_id=user.id)
+    db_session.add(board)
+    await db_session.commit()
+
+    column = BoardColumn(title="Test Column", board_id=board.id)
+    db_session.add(column)
+    await db_session.commit()
+
+    tasks = [
+        Task(
+            title=f"Task {i}",
+            description="long " * 100,
+            user_id=user.id,
+            column_id=column.id,
+        )
+        for i in range(count)
+    ]
+    db_session.add_all(tasks)
+    await db_session.commit()
+    return tasks
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_tasks_sparse_fields(
+    default_auth_client: AsyncClient,
+    default_auth_user: User,
+    db_session: AsyncSession,
+):
+    """?fields= оставляет в ответе только запрошенные поля и id."""
+    tasks = await create_tasks(db_session, default_auth_user, 2)
+
+    response = await default_auth_client.get(
+        "/api/v1/tasks", params={"fields": "title, status,column_id"}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 2
+    for item in data:
+        assert list(item) == ["id", "title", "status", "column_id"]
+    assert {item["title"] for item in data} == {task.title for task in tasks}
+    assert data[0]["status"] == "PENDING"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_tasks_sparse_fields_by_ids(
+    default_auth_client: AsyncClient,
+    default_auth_user: User,
+    db_session: AsyncSession,
+):
+    """?fields= работает и с пакетным запросом по ids, порядок сохраняется."""
+    tasks = await create_tasks(db_session, default_auth_user, 3)
+
+    ids = [tasks[2].id, tasks[0].id, uuid.uuid4()]
+    response = await default_auth_client.get(
+        "/api/v1/tasks",
+        params={"ids": [str(task_id) for task_id in ids], "fields": "title"},
+    )
+    assert response.status_code == 200
+    assert response.json() == [
+        {"id": str(tasks[2].id), "title": tasks[2].title},
+        {"id": str(tasks[0].id), "title": tasks[0].title},
+    ]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_tasks_sparse_fields_unknown(default_auth_client: AsyncClient):
+    """Неизвестное поле в ?fields= — 422."""
+    response = await default_auth_client.get(
+        "/api/v1/tasks", params={"fields": "title,password"}
+    )
+    assert response.status_code == 422
+    assert "password" in response.json()["detail"]
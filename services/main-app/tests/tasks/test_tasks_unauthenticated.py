@@ -14,6 +14,7 @@ async def test_tasks_routes_unauthenticated(http_client: AsyncClient):
         ("GET", "/api/v1/tasks"),
         ("POST", "/api/v1/tasks"),
         ("GET", f"/api/v1/tasks/{task_id}"),
+        ("PATCH", "/api/v1/tasks:bulk"),
         ("PATCH", f"/api/v1/tasks/{task_id}"),
         ("DELETE", f"/api/v1/tasks/{task_id}"),
     ]
@@ -0,0 +1,167 @@
+import gzip
+from dataclasses import replace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import core.config
+from core.compression import PrecompressedCache, choose_encoding
+from core.middleware import CompressionMiddleware
+from core.responses import precompressed_cache
+from models import Team
+
+LARGE = "x" * 2048
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=1024,
+        encodings=["zstd", "br", "gzip"],
+        content_types=["application/json", "text/plain"],
+    )
+
+    @app.get("/large")
+    async def large():
+        return {"data": LARGE}
+
+    @app.get("/small")
+    async def small():
+        return {"data": "x"}
+
+    @app.get("/binary")
+    async def binary():
+        return Response(LARGE.encode(), media_type="application/octet-stream")
+
+    @app.get("/text")
+    async def text():
+        return PlainTextResponse(LARGE)
+
+    return app
+
+
+@pytest.fixture
+async def client():
+    transport = ASGITransport(app=make_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_large_json_compressed(client: AsyncClient):
+    """Большой JSON сжимается, Content-Length — размер сжатого тела."""
+    response = await client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(LARGE)
+    assert response.json() == {"data": LARGE}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize(
+    "path, accept_encoding",
+    [
+        ("/small", "gzip"),
+        ("/binary", "gzip"),
+        ("/large", "identity"),
+        ("/large", "gzip;q=0"),
+    ],
+)
+async def test_not_compressed(client: AsyncClient, path: str, accept_encoding: str):
+    """Маленькие ответы, чужие Content-Type и отказ клиента — без сжатия."""
+    response = await client.get(path, headers={"Accept-Encoding": accept_encoding})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_allowlisted_content_type_with_charset(client: AsyncClient):
+    """Параметры Content-Type (charset) не мешают сравнению с allowlist."""
+    response = await client.get("/text", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-type"].startswith("text/plain; charset")
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == LARGE
+
+
+def test_choose_encoding():
+    """Выбирается первая доступная кодировка из предпочтений сервера."""
+    assert choose_encoding("gzip, deflate", ["zstd", "br", "gzip"]) == "gzip"
+    assert choose_encoding("*", ["gzip"]) == "gzip"
+    assert choose_encoding(None, ["gzip"]) is None
+    assert choose_encoding("br", ["gzip"]) is None
+
+
+def test_precompressed_cache_compresses_once(monkeypatch):
+    """Повторный запрос той же версии берёт сжатые байты из кэша."""
+    cache = PrecompressedCache(max_entries=2)
+    body = LARGE.encode()
+
+    first = cache.get('W/"a"', "gzip", body, 6)
+    assert gzip.decompress(first) == body
+
+    calls = []
+    monkeypatch.setattr(
+        "core.compression.compress", lambda *args: calls.append(args) or b""
+    )
+    assert cache.get('W/"a"', "gzip", body, 6) is first
+    assert calls == []
+
+    cache.get('W/"b"', "gzip", body, 6)
+    cache.get('W/"c"', "gzip", body, 6)
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_statistics_etag(
+    default_auth_client: AsyncClient, db_session: AsyncSession
+):
+    """Статистика отдаётся с ETag; та же версия — 304, новая — 200."""
+    response = await default_auth_client.get("/api/v1/statistics")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+
+    response = await default_auth_client.get(
+        "/api/v1/statistics", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+    db_session.add(Team(name="Changed"))
+    await db_session.commit()
+
+    response = await default_auth_client.get(
+        "/api/v1/statistics", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["entity_counts"]["teams"] == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_statistics_precompressed(
+    default_auth_client: AsyncClient, app_url: str | None, monkeypatch
+):
+    """Сжатое тело статистики кэшируется по версии и кодировке."""
+    if app_url:
+        pytest.skip("кэш и настройки живут в процессе приложения")
+    # Ответ статистики меньше порога по умолчанию
+    config = core.config.get_config()
+    monkeypatch.setattr(
+        core.config,
+        "_config",
+        replace(config, compression=replace(config.compression, minimum_size=0)),
+    )
+    precompressed_cache.clear()
+
+    headers = {"Accept-Encoding": "gzip"}
+    first = await default_auth_client.get("/api/v1/statistics", headers=headers)
+    second = await default_auth_client.get("/api/v1/statistics", headers=headers)
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.headers["etag"] == second.headers["etag"]
+    assert first.json() == second.json()
+    assert len(precompressed_cache) == 1
@@ -0,0 +1,192 @@
+import dataclasses
+import os
+
+import pytest
+
+import core.config
+from core.config import ConfigError, load_config, on_reload, reload_config
+
+VALID = """
+[app_settings]
+app_name = "tracker"
+app_version = "1.2.3"
+
+[db_settings]
+db_name = "kanban"
+db_user = "user"
+db_password = "secret"
+db_host = "db"
+db_port = 5433
+pool_size = 20
+
+[auth_settings]
+sekret_key = "key"
+algorithm = "HS256"
+access_token_expire_minutes = 15
+"""
+
+
+@pytest.fixture
+def settings_file(tmp_path, monkeypatch):
+    # Настройки тестового окружения (URL БД и т.п.) заданы через переменные
+    # окружения — здесь проверяется только файл
+    for name in os.environ:
+        if name.upper().endswith("_SETTINGS") or "_SETTINGS__" in name.upper():
+            monkeypatch.delenv(name)
+
+    def write(content: str):
+        path = tmp_path / "settings.toml"
+        path.write_text(content)
+        return path
+
+    return write
+
+
+def test_load_config(settings_file):
+    """Настройки превращаются в типизированный неизменяемый снимок."""
+    config = load_config(settings_file(VALID))
+
+    assert config.app.name == "tracker"
+    assert config.db.url == "postgresql+asyncpg://user:secret@db:5433/kanban"
+    assert config.db.pool_size == 20
+    assert config.db.echo is False
+    assert config.auth.refresh_token_expire_days == 30
+    assert config.compression.encodings == ("gzip",)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.auth.secret_key = "other"
+    # slots: нет __dict__ и случайных атрибутов
+    assert not hasattr(config.db, "__dict__")
+
+
+def test_load_config_env_override(settings_file, monkeypatch):
+    """Переменные окружения перекрывают файл, полный URL — отдельные поля."""
+    monkeypatch.setenv("DB_SETTINGS__URL", "postgresql+asyncpg://u:p@h/other")
+    monkeypatch.setenv("AUTH_SETTINGS__ACCESS_TOKEN_EXPIRE_MINUTES", "5")
+
+    config = load_config(settings_file(VALID))
+
+    assert config.db.url == "postgresql+asyncpg://u:p@h/other"
+    assert config.auth.access_token_expire_minutes == 5
+
+
+def test_db_statement_cache_settings(settings_file):
+    """Размеры кэшей запросов: по умолчанию и проверка отрицательных значений."""
+    config = load_config(settings_file(VALID))
+    assert config.db.query_cache_size == 500
+    assert config.db.prepared_statement_cache_size == 100
+
+    content = VALID.replace(
+        "pool_size = 20", "pool_size = 20\nprepared_statement_cache_size = -1"
+    )
+    with pytest.raises(ConfigError) as exc_info:
+        load_config(settings_file(content))
+    assert exc_info.value.errors == [
+        "db_settings.prepared_statement_cache_size: must be >= 0"
+    ]
+
+
+def test_load_config_collects_errors(settings_file):
+    """Все ошибки настроек выводятся разом, с путём до ключа."""
+    content = VALID.replace("db_port = 5433", 'db_port = "five"')
+    content = content.replace('algorithm = "HS256"', 'algorithm = "none"')
+    content = content.replace("access_token_expire_minutes = 15\n", "")
+    content += '\n[compression_settings]\nencodings = ["gzip", "lzma"]\n'
+
+    with pytest.raises(ConfigError) as exc_info:
+        load_config(settings_file(content))
+
+    errors = exc_info.value.errors
+    assert "db_settings.db_port: expected int, got 'five'" in errors
+    assert "auth_settings.access_token_expire_minutes: required" in errors
+    assert any(error.startswith("auth_settings.algorithm") for error in errors)
+    assert "compression_settings.encodings: unknown 'lzma'" in errors
+    assert "db_settings.db_port" in str(exc_info.value)
+
+
+def test_reload_config_calls_hooks(settings_file, monkeypatch):
+    """reload_config() подменяет снимок и вызывает хуки."""
+    path = settings_file(VALID)
+    monkeypatch.setattr(core.config, "_config", core.config.get_config())
+    monkeypatch.setattr(core.config, "_reload_hooks", [])
+
+    seen = []
+    on_reload(seen.append)
+    config = reload_config(path)
+
+    assert seen == [config]
+    assert core.config.get_config() is config
+    assert config.app.name == "tracker"
+
+
+def test_server_settings(settings_file):
+    """Секция server_settings необязательна; отрицательные значения — ошибка."""
+    config = load_config(settings_file(VALID))
+    assert config.server.workers == 0
+    assert config.server.max_requests == 0
+
+    content = VALID + "\n[server_settings]\nworkers = 4\nmax_requests = -1\n"
+    with pytest.raises(ConfigError) as exc_info:
+        load_config(settings_file(content))
+    assert exc_info.value.errors == ["server_settings.max_requests: must be >= 0"]
+
+
+def test_forwarded_allow_ips(settings_file):
+    """Доверенные прокси — адреса, сети или "*"."""
+    assert load_config(settings_file(VALID)).server.forwarded_allow_ips == (
+        "127.0.0.1",
+    )
+
+    content = (
+        VALID + "\n[server_settings]\n"
+        'forwarded_allow_ips = ["10.0.0.0/8", "::1", "*"]\n'
+    )
+    config = load_config(settings_file(content))
+    assert config.server.forwarded_allow_ips == ("10.0.0.0/8", "::1", "*")
+
+    content = VALID + '\n[server_settings]\nforwarded_allow_ips = ["proxy"]\n'
+    with pytest.raises(ConfigError) as exc_info:
+        load_config(settings_file(content))
+    assert exc_info.value.errors == [
+        "server_settings.forwarded_allow_ips: 'proxy' is not an IP address or network"
+    ]
+
+
+def test_auth_service_settings(settings_file):
+    """Токены auth-service проверяются по JWKS и только асимметричной подписью."""
+    content = VALID.replace(
+        'algorithm = "HS256"',
+        'algorithm = "RS256"\nissuer_url = "http://auth-service/tokens"',
+    ).replace('sekret_key = "key"\n', "")
+    with pytest.raises(ConfigError) as exc_info:
+        load_config(settings_file(content))
+    assert exc_info.value.errors == [
+        "auth_settings.jwks_url: required when issuer_url is set",
+        "auth_settings.issuer_client_secret: required when issuer_url is set",
+    ]
+
+    content = VALID + 'jwks_url = "http://auth-service/.well-known/jwks.json"\n'
+    with pytest.raises(ConfigError) as exc_info:
+        load_config(settings_file(content))
+    assert exc_info.value.errors == [
+        "auth_settings.algorithm: auth-service tokens need an asymmetric algorithm"
+    ]
+
+
+def test_password_settings(settings_file):
+    """Схемы хэширования — из списка поддерживаемых, стоимость — в пределах схемы."""
+    config = load_config(settings_file(VALID))
+    assert config.password.schemes == ("sha512_crypt",)
+
+    content = (
+        VALID + "\n[password_settings]\n"
+        'schemes = ["scrypt", "bcrypt"]\nsha512_crypt_rounds = 10\n'
+    )
+    with pytest.raises(ConfigError) as exc_info:
+        load_config(settings_file(content))
+    assert exc_info.value.errors == [
+        "password_settings.schemes: 'scrypt' is not one of argon2, sha512_crypt",
+        "password_settings.schemes: 'bcrypt' is not supported: "
+        "passlib 1.7.4 is incompatible with the installed bcrypt >= 4.1",
+        "password_settings.sha512_crypt_rounds: must be in 1000..999999999",
+    ]
@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.loader import DataLoader, model_loader
+from models import Team
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_loader_coalesces_and_memoizes():
+    """Ключи одного прохода event loop уходят одним батчем, повторы — из кеша."""
+    batches = []
+
+    async def batch_load(keys):
+        batches.append(keys)
+        return {key: key * 10 for key in keys if key != 3}
+
+    loader = DataLoader(batch_load)
+
+    assert await asyncio.gather(loader.load(1), loader.load(2), loader.load(1)) == [
+        10,
+        20,
+        10,
+    ]
+    assert await loader.load_many([2, 3]) == [20, None]
+    assert batches == [[1, 2], [3]]
+
+    loader.clear()
+    assert await loader.load(1) == 10
+    assert batches[-1] == [1]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_loader_does_not_cache_errors():
+    """Упавший батч отдаёт ошибку всем ожидающим, но не остаётся в кеше."""
+    calls = 0
+
+    async def batch_load(keys):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("boom")
+        return {key: key for key in keys}
+
+    loader = DataLoader(batch_load)
+
+    with pytest.raises(RuntimeError):
+        await loader.load(1)
+    assert await loader.load(1) == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_model_loader_single_query(db_session: AsyncSession):
+    """Параллельные get_by_id по одной модели — один SELECT ... = ANY(...)."""
+    teams = [Team(name=f"Team {i}") for i in range(3)]
+    db_session.add_all(teams)
+    await db_session.commit()
+
+    statements = []
+    sync_engine = (await db_session.connection()).engine.sync_engine
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(sync_engine, "before_cursor_execute", count)
+    try:
+        loader = model_loader(db_session, Team)
+        loaded = await asyncio.gather(*(loader.load(team.id) for team in teams))
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", count)
+
+    assert [team.id for team in loaded] == [team.id for team in teams]
+    assert len(statements) == 1
+    assert "ANY" in statements[0]
+    assert model_loader(db_session, Team) is loader
@@ -0,0 +1,91 @@
+import inspect
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import repositories
+from models import Board, User
+from repositories.base import BaseRepository
+from repositories.board import BoardRepository
+from repositories.column import ColumnRepository
+from repositories.task import TaskRepository, _select_fields_page
+
+
+def test_statements_built_once_per_repository():
+    """Запрос строится один раз на класс репозитория и переиспользуется."""
+    assert BoardRepository._select_page() is BoardRepository._select_page()
+    assert BoardRepository._select_page() is not ColumnRepository._select_page()
+    assert BoardRepository._select_page_by("owner_id") is (
+        BoardRepository._select_page_by("owner_id")
+    )
+
+
+def test_subclasses_keep_base_signatures():
+    """Наследники принимают те же аргументы общих методов: create(data), update(id, data)..."""
+    assert repositories  # все репозитории импортированы
+    for repository in BaseRepository.__subclasses__():
+        for name in (
+            "get_by_id",
+            "get_by_ids",
+            "get_all",
+            "create",
+            "update",
+            "delete",
+        ):
+            arguments = inspect.signature(getattr(BaseRepository, name)).parameters
+            own = inspect.signature(getattr(repository, name))
+            try:
+                own.bind(*arguments)
+            except TypeError:
+                pytest.fail(f"{repository.__name__}.{name}{own} differs from the base")
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_pages_by_column(db_session: AsyncSession):
+    """Фильтр, поиск и пагинация через параметры закэшированного запроса."""
+    owner = User(name="Owner", email="base-repo-owner@test.com", hashed_password="x")
+    other = User(name="Other", email="base-repo-other@test.com", hashed_password="x")
+    db_session.add_all([owner, other])
+    await db_session.flush()
+    db_session.add_all(
+        [Board(title=f"Owned {i}", owner_id=owner.id) for i in range(3)]
+        + [Board(title="Foreign", owner_id=other.id)]
+    )
+    await db_session.commit()
+    repo = BoardRepository(db_session)
+
+    owned = await repo.get_by_owner_id(owner.id, skip=0, limit=10)
+    assert sorted(board.title for board in owned) == ["Owned 0", "Owned 1", "Owned 2"]
+    assert len(await repo.get_by_owner_id(owner.id, skip=1, limit=10)) == 2
+    assert len(await repo.get_by_owner_id(owner.id, skip=0, limit=1)) == 1
+
+    found = await repo.search_by_title("foreign")
+    assert [board.owner_id for board in found] == [other.id]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_crud(db_session: AsyncSession):
+    owner = User(name="Owner", email="base-repo-crud@test.com", hashed_password="x")
+    db_session.add(owner)
+    await db_session.flush()
+    repo = BoardRepository(db_session)
+
+    board = await repo.create({"title": "Created", "owner_id": owner.id})
+    assert (await repo.update(board.id, {"title": "Renamed"})).title == "Renamed"
+    assert [b.id for b in await repo.get_by_ids([board.id])] == [board.id]
+
+    assert await repo.delete(board.id)
+    assert not await repo.delete(board.id)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_task_field_statements_cached(db_session: AsyncSession):
+    """Выборка по ?fields= тоже не строит запрос заново для того же набора колонок."""
+    repo = TaskRepository(db_session)
+    fields = ("id", "title")
+
+    await repo.get_all(fields=list(fields))
+    before = _select_fields_page.cache_info().hits
+    await repo.get_all(fields=fields)
+
+    assert _select_fields_page.cache_info().hits == before + 1
@@ -0,0 +1,56 @@
+import json
+import uuid
+from datetime import datetime
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from httpx import AsyncClient
+
+from api.v1.tasks import task_to_response
+from core.responses import fast_json
+from enums.task_status import TaskStatus
+from models import Task
+from schemas.task import TaskResponse
+
+
+def test_fast_json_matches_response_model():
+    """Быстрый путь отдаёт те же байты-значения, что и обычный response_model."""
+    tasks = [
+        Task(
+            id=uuid.uuid4(),
+            title="Task",
+            description=None,
+            status=TaskStatus.IN_PROGRESS,
+            due_date=datetime(2025, 1, 2, 3, 4, 5, 6),
+            user_id=uuid.uuid4(),
+            column_id=uuid.uuid4(),
+            created_at=datetime(2025, 1, 1),
+            updated_at=datetime(2025, 1, 1, 0, 0, 1),
+        )
+    ]
+
+    response = fast_json(tasks, TaskResponse)
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == jsonable_encoder(
+        [task_to_response(task) for task in tasks]
+    )
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_openapi_keeps_response_models(http_client: AsyncClient):
+    """Эндпоинты с быстрым путём по-прежнему описывают ответ в OpenAPI."""
+    response = await http_client.get("/openapi.json")
+    assert response.status_code == 200
+    paths = response.json()["paths"]
+
+    for path, schema in [
+        ("/api/v1/tasks", "TaskResponse"),
+        ("/api/v1/boards", "BoardResponse"),
+        ("/api/v1/columns", "ColumnResponse"),
+        ("/api/v1/teams", "TeamResponse"),
+        ("/api/v1/users", "UserResponse"),
+    ]:
+        content = paths[path]["get"]["responses"]["200"]["content"]
+        items = content["application/json"]["schema"]["items"]
+        assert items["$ref"] == f"#/components/schemas/{schema}"
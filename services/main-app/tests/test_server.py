@@ -0,0 +1,72 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import core.lifecycle
+from core.config import ServerConfig
+from core.lifecycle import lifespan, warm_pool
+from core.middleware import MaxRequestsMiddleware
+from server import parse_args, server_options, worker_count
+
+
+def test_worker_count():
+    """0 в настройках — по воркеру на ядро, иначе явное значение."""
+    assert worker_count(ServerConfig(), cores=6) == 6
+    assert worker_count(ServerConfig(workers=3), cores=6) == 3
+    assert worker_count(ServerConfig()) >= 1
+
+
+def test_server_options():
+    """Аргументы командной строки перекрывают settings.toml."""
+    options = server_options(parse_args(["--port", "9000", "--workers", "2"]))
+
+    assert options["port"] == 9000
+    assert options["workers"] == 2
+    assert options["lifespan"] == "on"
+    assert options["timeout_graceful_shutdown"] == 30
+    assert options["proxy_headers"] is True
+    assert options["forwarded_allow_ips"] == "127.0.0.1"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_max_requests_with_jitter():
+    """Воркер останавливается один раз, после max_requests + 0..jitter запросов."""
+    stops = []
+    app = FastAPI()
+
+    @app.get("/")
+    async def root():
+        return PlainTextResponse("ok")
+
+    middleware = MaxRequestsMiddleware(
+        app, max_requests=3, jitter=2, on_limit=lambda: stops.append(True)
+    )
+    transport = ASGITransport(app=middleware)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        for _ in range(3):
+            assert (await client.get("/")).status_code == 200
+        assert 3 <= middleware.limit <= 5
+        assert stops == ([True] if middleware.limit == 3 else [])
+
+        for _ in range(5):
+            # Начатые запросы завершаются, пока uvicorn останавливает воркер
+            assert (await client.get("/")).status_code == 200
+
+    assert stops == [True]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_lifespan_warms_and_disposes_pool(db_url, monkeypatch):
+    """Пул наполняется до приёма запросов и закрывается при остановке."""
+    engine = create_async_engine(db_url, pool_size=3)
+    monkeypatch.setattr(core.lifecycle, "get_engine", lambda: engine)
+
+    await warm_pool(engine, 3)
+    assert engine.pool.checkedin() == 3
+
+    async with lifespan(FastAPI()):
+        assert engine.pool.checkedin() == 3
+
+    assert engine.pool.checkedin() == 0
@@ -0,0 +1,121 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.unit_of_work import UnitOfWork
+from models import Board, BoardColumn, Notification, Task, Team, User
+from repositories.notification import NotificationRepository
+from repositories.team import TeamRepository
+
+
+async def _create_column(db_session: AsyncSession, user: User) -> BoardColumn:
+    board = Board(title="UoW Board", owner_id=user.id)
+    db_session.add(board)
+    await db_session.flush()
+    column = BoardColumn(title="UoW Column", board_id=board.id)
+    db_session.add(column)
+    await db_session.commit()
+    return column
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_commits_once_at_outer_block(db_session: AsyncSession):
+    """Вложенные блоки не коммитят: один commit при выходе из внешнего."""
+    commits = []
+    event.listen(db_session.sync_session, "after_commit", commits.append)
+    uow = UnitOfWork(db_session)
+    repository = TeamRepository(db_session)
+
+    async with uow:
+        await repository.add(Team(name="Outer"))
+        async with uow:
+            await repository.add(Team(name="Inner"))
+        assert commits == []
+
+    assert len(commits) == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_rollback_on_error(db_session: AsyncSession):
+    """Исключение в блоке откатывает всё, что успели записать репозитории."""
+    uow = UnitOfWork(db_session)
+
+    with pytest.raises(RuntimeError):
+        async with uow:
+            await TeamRepository(db_session).add(Team(name="Rolled back"))
+            raise RuntimeError
+
+    result = await db_session.execute(select(Team).where(Team.name == "Rolled back"))
+    assert result.scalar_one_or_none() is None
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_explicit_commit(db_session: AsyncSession):
+    """commit() фиксирует сделанное до него, даже если блок потом упадёт."""
+    uow = UnitOfWork(db_session)
+
+    with pytest.raises(RuntimeError):
+        async with uow:
+            await TeamRepository(db_session).add(Team(name="Committed"))
+            await uow.commit()
+            await TeamRepository(db_session).add(Team(name="Discarded"))
+            raise RuntimeError
+
+    result = await db_session.execute(select(Team.name))
+    assert result.scalars().all() == ["Committed"]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_task_and_notification_are_atomic(
+    default_auth_client: AsyncClient,
+    default_auth_user: User,
+    db_session: AsyncSession,
+    app_url: str | None,
+    monkeypatch,
+):
+    """Задача не сохраняется, если не удалось создать уведомление о ней."""
+    if app_url:
+        pytest.skip("ошибку нужно подставить в процессе приложения")
+    column = await _create_column(db_session, default_auth_user)
+
+    async def fail(self, notification_data: dict) -> Notification:
+        raise RuntimeError("notification failed")
+
+    monkeypatch.setattr(NotificationRepository, "create", fail)
+
+    with pytest.raises(RuntimeError):
+        await default_auth_client.post(
+            "/api/v1/tasks",
+            json={
+                "title": "Half-created",
+                "user_id": str(default_auth_user.id),
+                "column_id": str(column.id),
+            },
+        )
+
+    result = await db_session.execute(select(Task).where(Task.title == "Half-created"))
+    assert result.scalar_one_or_none() is None
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_task_update_creates_notification(
+    default_auth_client: AsyncClient,
+    default_auth_user: User,
+    db_session: AsyncSession,
+):
+    """Изменение задачи и уведомление о нём попадают в БД вместе."""
+    column = await _create_column(db_session, default_auth_user)
+    task = Task(title="Notify", user_id=default_auth_user.id, column_id=column.id)
+    db_session.add(task)
+    await db_session.commit()
+
+    response = await default_auth_client.patch(
+        f"/api/v1/tasks/{task.id}", json={"title": "Notified"}
+    )
+    assert response.status_code == 200
+
+    result = await db_session.execute(
+        select(Notification.message).where(Notification.task_id == task.id)
+    )
+    assert result.scalars().all() == ["Task `Notified` has been updated"]
@@ -0,0 +1,75 @@
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from auth.security import hash_password
+from models import User
+
+
+def user_to_dict(user: User) -> dict:
+    return {
+        "id": str(user.id),
+        "name": user.name,
+        "email": user.email,
+        "created_at": user.created_at.isoformat(),
+        "updated_at": user.updated_at.isoformat(),
+    }
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_users_routes_unauthenticated(http_client: AsyncClient):
+    """Эндпоинты users требуют аутентификации."""
+    user_id = "00000000-0000-0000-0000-000000000001"
+
+    for url in (f"/api/v1/users?ids={user_id}", f"/api/v1/users/{user_id}"):
+        response = await http_client.get(url)
+        assert response.status_code == 401, f"GET {url} got {response.status_code}"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_user(default_auth_client: AsyncClient, default_auth_user: User):
+    """Получение пользователя по id, без хэша пароля."""
+    response = await default_auth_client.get(f"/api/v1/users/{default_auth_user.id}")
+    assert response.status_code == 200
+    assert response.json() == user_to_dict(default_auth_user)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_user_not_found(default_auth_client: AsyncClient):
+    """Несуществующий пользователь — 404."""
+    response = await default_auth_client.get(f"/api/v1/users/{uuid.uuid4()}")
+    assert response.status_code == 404
+    assert response.json() == {"detail": "User not found"}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_users_by_ids(
+    default_auth_client: AsyncClient,
+    default_auth_user: User,
+    db_session: AsyncSession,
+):
+    """Пакетное получение пользователей по ids."""
+    other = User(
+        name="Other User",
+        email="other-user@test.com",
+        hashed_password=hash_password("TestPassword123!"),
+    )
+    db_session.add(other)
+    await db_session.commit()
+
+    response = await default_auth_client.get(
+        "/api/v1/users",
+        params={"ids": [str(other.id), str(uuid.uuid4()), str(default_auth_user.id)]},
+    )
+    assert response.status_code == 200
+    assert response.json() == [user_to_dict(other), user_to_dict(default_auth_user)]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_users_list_requires_ids(default_auth_client: AsyncClient):
+    """Списка всех пользователей нет: без ids — 422."""
+    response = await default_auth_client.get("/api/v1/users")
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["query", "ids"]